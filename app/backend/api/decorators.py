@@ -3,10 +3,12 @@ Decorators and utilities for API routes.
 """
 
 import os
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
 import time
 
-from app.backend.models.game import GameState
+from app.backend.core.config import settings
+from app.backend.models.game import GameAction, GameState
+from app.backend.services.broadcast_coalescer import BroadcastCoalescer
 
 
 # Detect if we're running as the dedicated WS worker
@@ -15,8 +17,104 @@ from app.backend.models.game import GameState
 IS_WS_WORKER = os.environ.get("MANAFORGE_WS_WORKER", "").lower() in ("1", "true", "yes")
 
 
+async def _send_game_update(game_id: str, message: dict) -> None:
+    if IS_WS_WORKER:
+        # Direct broadcast via ConnectionManager (we are the WS worker)
+        from app.backend.api.websocket import manager
+
+        await manager.broadcast_to_game(game_id, message)
+    else:
+        # Relay to the WS worker through this worker's batching NOTIFY publisher
+        from app.backend.services.notify_service import async_notify_game_update
+
+        await async_notify_game_update(game_id, message)
+
+
+# Bursts of updates to one game go out as one message (see broadcast_coalescer)
+broadcast_coalescer = BroadcastCoalescer(
+    settings.broadcast_coalesce_ms / 1000, _send_game_update
+)
+
+
+def _stamp_action_entry(action_info: dict, game_state: GameState) -> dict:
+    action_entry = dict(action_info)
+    action_entry.setdefault("timestamp", time.time())
+    action_entry.setdefault("origin", "server")
+
+    phase_value = getattr(game_state, "phase", None)
+    if phase_value is not None:
+        action_entry.setdefault(
+            "phase", getattr(phase_value, "value", str(phase_value))
+        )
+
+    turn_value = getattr(game_state, "turn", None)
+    if turn_value is not None:
+        action_entry.setdefault("turn", turn_value)
+
+    active_index = getattr(game_state, "active_player", None)
+    if isinstance(active_index, int) and 0 <= active_index < len(
+        getattr(game_state, "players", [])
+    ):
+        active_player = game_state.players[active_index]
+        action_entry.setdefault("turn_player_id", getattr(active_player, "id", None))
+        action_entry.setdefault(
+            "turn_player_name", getattr(active_player, "name", None)
+        )
+    return action_entry
+
+
+def build_game_update(
+    game_id: str,
+    game_state: GameState,
+    action_info: Optional[Union[dict, List[dict]]] = None,
+    record_history: bool = True,
+) -> dict:
+    """
+    Build the game_state_update message that broadcast_game_update sends.
+
+    Synchronous, so callers that own a game's state in a worker thread (see
+    services/action_executor.py) can project it there and only submit the
+    message from the event loop.
+    """
+    from app.backend.api.routes import game_engine
+
+    # Use compact format for reduced payload size
+    # Skip full action_history/chat_log for incremental updates
+    action_history: list = []
+    chat_log: list = []
+    message = {
+        "type": "game_state_update",
+        "game_state": game_state.to_compact_ui_data(
+            viewer_id=None,
+            action_history=action_history,
+            chat_log=chat_log,
+        ),
+        "timestamp": game_state.turn if hasattr(game_state, "turn") else None,
+        # The WS tier sends a delta against the previous seq (see
+        # ConnectionManager._sequence_state_update)
+        "seq": game_state.version,
+    }
+    message["game_state"].pop("action_history", None)
+    message["game_state"].pop("chat_log", None)
+
+    if action_info:
+        # A batch broadcasts once with every entry, oldest first
+        batch = action_info if isinstance(action_info, list) else [action_info]
+        entries = [_stamp_action_entry(entry, game_state) for entry in batch]
+        if record_history:
+            for entry in entries:
+                game_engine.record_action_history(game_id, entry, game_state=game_state)
+        message["action_result"] = entries[-1]
+        if isinstance(action_info, list):
+            message["action_results"] = entries
+    return message
+
+
 async def broadcast_game_update(
-    game_id: str, game_state: GameState, action_info: Optional[dict] = None
+    game_id: str,
+    game_state: GameState,
+    action_info: Optional[Union[dict, List[dict]]] = None,
+    record_history: bool = True,
 ):
     """
     Broadcast game state update to all connected clients.
@@ -24,69 +122,22 @@ async def broadcast_game_update(
     Uses compact format with card_instances for reduced payload size.
     Card definitions are NOT included - clients fetch them via /api/v1/cards/{id}.
 
+    Pass record_history=False when action_info was already persisted with
+    record_action_history (e.g. inside the action's unit of work). A batch
+    passes the list of its entries: they are sent as action_results, the
+    last one also as action_result.
+
+    Updates of one game submitted within settings.broadcast_coalesce_ms are
+    merged by broadcast_coalescer: the latest state is sent once, with every
+    action_result listed in action_results.
+
     In multi-worker mode:
     - WS worker: Uses ConnectionManager directly
     - API workers: Uses PostgreSQL NOTIFY to relay to WS worker
     """
     try:
-        from app.backend.api.routes import game_engine
-
-        # Use compact format for reduced payload size
-        # Skip full action_history/chat_log for incremental updates
-        action_history: list = []
-        chat_log: list = []
-        message = {
-            "type": "game_state_update",
-            "game_state": game_state.to_compact_ui_data(
-                viewer_id=None,
-                action_history=action_history,
-                chat_log=chat_log,
-            ),
-            "timestamp": game_state.turn if hasattr(game_state, "turn") else None,
-        }
-        message["game_state"].pop("action_history", None)
-        message["game_state"].pop("chat_log", None)
-
-        if action_info:
-            action_entry = dict(action_info)
-            action_entry.setdefault("timestamp", time.time())
-            action_entry.setdefault("origin", "server")
-
-            phase_value = getattr(game_state, "phase", None)
-            if phase_value is not None:
-                action_entry.setdefault(
-                    "phase", getattr(phase_value, "value", str(phase_value))
-                )
-
-            turn_value = getattr(game_state, "turn", None)
-            if turn_value is not None:
-                action_entry.setdefault("turn", turn_value)
-
-            active_index = getattr(game_state, "active_player", None)
-            if isinstance(active_index, int) and 0 <= active_index < len(
-                getattr(game_state, "players", [])
-            ):
-                active_player = game_state.players[active_index]
-                action_entry.setdefault(
-                    "turn_player_id", getattr(active_player, "id", None)
-                )
-                action_entry.setdefault(
-                    "turn_player_name", getattr(active_player, "name", None)
-                )
-
-            game_engine.record_action_history(game_id, action_entry)
-            message["action_result"] = action_entry
-
-        if IS_WS_WORKER:
-            # Direct broadcast via ConnectionManager (we are the WS worker)
-            from app.backend.api.websocket import manager
-
-            await manager.broadcast_to_game(game_id, message)
-        else:
-            # Use PostgreSQL NOTIFY to relay to the WS worker
-            from app.backend.services.notify_service import async_notify_game_update
-
-            await async_notify_game_update(game_id, message)
+        message = build_game_update(game_id, game_state, action_info, record_history)
+        await broadcast_coalescer.submit(game_id, message)
 
         print(f"Broadcasted game state update for game {game_id}")
 
@@ -100,7 +151,8 @@ async def broadcast_draft_update(room_id: str, message: dict):
 
     In multi-worker mode:
     - WS worker: Uses ConnectionManager directly
-    - API workers: Uses PostgreSQL NOTIFY to relay to WS worker
+    - API workers: Uses PostgreSQL NOTIFY (shared publisher connection) to
+      relay to WS worker
     """
     try:
         if IS_WS_WORKER:
@@ -146,3 +198,49 @@ class ActionRegistry:
 
 
 action_registry = ActionRegistry()
+
+
+async def build_game_action(
+    game_id: str, request: Dict[str, Any], current_state: GameState
+) -> Tuple[GameAction, Dict[str, Any]]:
+    """
+    Resolve a raw action request through its registered handler.
+
+    Returns the GameAction for the engine and the action_result entry that is
+    recorded in the action history and broadcast to clients. Handlers only
+    read current_state; nothing is applied yet.
+    """
+    action_type = request.get("action_type")
+    handler_info = action_registry.get_handler(action_type)
+    if not handler_info:
+        raise ValueError(f"Unknown action_type: {action_type}")
+
+    if "player_id" in request:
+        player_id = request["player_id"]
+    else:
+        if action_type in ["pass_priority", "resolve_stack"]:
+            seat_index = current_state.priority_player
+        else:
+            seat_index = current_state.active_player
+        player_id = (
+            current_state.players[seat_index].id
+            if 0 <= seat_index < len(current_state.players)
+            else f"player{seat_index + 1}"
+        )
+
+    handler = handler_info["handler"]
+    action_data = await handler(game_id, request, current_state)
+
+    final_action_type = action_data.get("action_type", action_type)
+    action_params = {
+        k: v for k, v in action_data.items() if k not in ["broadcast_data", "action_type"]
+    }
+    action = GameAction(player_id=player_id, action_type=final_action_type, **action_params)
+
+    action_result = {"success": True, "action": action_type, "player": player_id}
+    action_result.update(action_data.get("broadcast_data", {}))
+    if action_result.get("face_down"):
+        action_result.setdefault("face_down_owner", player_id)
+    action_result.setdefault("origin", "server")
+    action_result.setdefault("timestamp", time.time())
+    return action, action_result
@@ -2,12 +2,16 @@
 API routes for the draft feature.
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import List, Optional
 from pydantic import BaseModel
 import random
 
-from app.backend.models.game import DraftRoom, DraftType
+from app.backend.models.game import DraftRoom, DraftRoomSummary, DraftState, DraftType
+from app.backend.repositories.draft_room_summaries import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+)
 from app.backend.services.card_service import CardService
 from app.backend.services.draft_service import DraftService
 from app.backend.services.draft_engine import DraftEngine
@@ -110,16 +114,26 @@ async def create_draft_room(
     return room
 
 
-@router.get("/rooms", response_model=List[DraftRoom])
-async def list_draft_rooms(engine: DraftEngine = Depends(get_draft_engine)):
-    """List all active draft rooms."""
-    return list(engine.draft_rooms.values())
+@router.get("/rooms", response_model=List[DraftRoomSummary])
+async def list_draft_rooms(
+    state: Optional[DraftState] = Query(None),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(0, ge=0),
+    engine: DraftEngine = Depends(get_draft_engine),
+):
+    """
+    List draft room summaries, most recently updated first.
+
+    Packs and drafted cards are left out; GET /rooms/{room_id} serves the
+    full room.
+    """
+    return await engine.fetch_draft_room_summaries(state, limit, offset)
 
 
 @router.get("/rooms/{room_id}", response_model=DraftRoom)
 async def get_draft_room(room_id: str, engine: DraftEngine = Depends(get_draft_engine)):
     """Get a specific draft room by ID."""
-    room = engine.get_draft_room(room_id)
+    room = await engine.fetch_draft_room(room_id)
     if not room:
         raise HTTPException(status_code=404, detail="Draft room not found")
     return room
@@ -3,24 +3,39 @@ Refactored API routes for the ManaForge application.
 Consolidated and optimized version with unified game action endpoint.
 """
 
+import asyncio
+import json
 import uuid
 import time
 from urllib.parse import quote_plus
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from typing import List, Dict, Optional, Any
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, List, Dict, Optional, Any, Tuple, Union
 
 from app.backend.models.game import (
     Card,
     Deck,
     GameAction,
     GameSetupStatus,
+    GameState,
     GameFormat,
     PhaseMode,
 )
+from app.backend.repositories.dict_proxies import (
+    GameStateConflictError,
+    identity_scope,
+)
+from app.backend.repositories.game_summaries import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.backend.services.action_executor import game_action_executor
 from app.backend.services.card_service import CardService
-from app.backend.services.game_engine import SimpleGameEngine
-from app.backend.api.decorators import broadcast_game_update, action_registry
+from app.backend.services.game_actor import ForwardedActionError, GameActorRuntime
+from app.backend.services.game_engine import BatchActionError, SimpleGameEngine
+from app.backend.api.decorators import (
+    action_registry,
+    broadcast_game_update,
+    build_game_action,
+)
 
 # fmt: off
 from app.backend.api import action_handlers  # noqa: F401 - handlers are registered via decorators
@@ -35,6 +50,31 @@ router = APIRouter(prefix="/api/v1")
 # Use DB-backed storage in production, can be disabled for testing
 game_engine = SimpleGameEngine(use_db=True)
 
+
+async def _broadcast_actor_update(
+    game_id: str, game_state, action_result: Union[dict, List[dict]]
+) -> None:
+    await broadcast_game_update(game_id, game_state, action_result, record_history=False)
+
+
+# Single-writer game actors; started by the app lifespan when
+# settings.game_actor_mode is enabled
+actor_runtime = GameActorRuntime(
+    game_engine,
+    build_action=build_game_action,
+    on_applied=_broadcast_actor_update,
+)
+
+
+def load_game_state(game_id: str):
+    """Return the freshest state: the local actor's copy, else storage."""
+    return actor_runtime.local_state(game_id) or game_engine.games.get(game_id)
+
+
+async def fetch_game_state(game_id: str):
+    """load_game_state for route handlers, read on the async pool."""
+    return actor_runtime.local_state(game_id) or await game_engine.fetch_game(game_id)
+
 # Singleton CardService instance - stateless, no need to create per request
 _card_service_instance: Optional[CardService] = None
 
@@ -311,94 +351,16 @@ async def create_modern_example_game(
 
 
 @router.get("/games/list")
-async def list_games() -> List[Dict[str, Any]]:
-    """List all game rooms and active games with their current status."""
-    games_list: List[Dict[str, Any]] = []
-    processed_games = set()
-
-    for game_id, setup in game_engine.game_setups.items():
-        player_status_dump = {
-            player_id: status.model_dump()
-            for player_id, status in setup.player_status.items()
-        }
-        submitted_count = sum(
-            1 for status in player_status_dump.values() if status.get("submitted")
-        )
-        validated_count = sum(
-            1 for status in player_status_dump.values() if status.get("validated")
-        )
-        seat_claimed_count = sum(
-            1 for status in player_status_dump.values() if status.get("seat_claimed")
-        )
-
-        entry: Dict[str, Any] = {
-            "game_id": game_id,
-            "status": setup.status,
-            "ready": setup.ready,
-            "game_format": (
-                setup.game_format.value
-                if hasattr(setup.game_format, "value")
-                else str(setup.game_format)
-            ),
-            "phase_mode": (
-                setup.phase_mode.value
-                if hasattr(setup.phase_mode, "value")
-                else str(setup.phase_mode)
-            ),
-            "submitted_count": submitted_count,
-            "validated_count": validated_count,
-            "seat_claimed_count": seat_claimed_count,
-            "player_status": player_status_dump,
-            "created_at": setup.created_at.isoformat(),
-            "updated_at": setup.updated_at.isoformat(),
-            "players": [
-                player_id
-                for player_id, status in player_status_dump.items()
-                if status.get("submitted")
-            ],
-            "max_players": setup.max_players,
-        }
-
-        if setup.ready and game_id in game_engine.games:
-            game_state = game_engine.games[game_id]
-            entry["status"] = "ongoing"
-            entry["players"] = [player.id for player in game_state.players]
-            entry["active_player"] = game_state.active_player
-            entry["turn"] = game_state.turn
-            entry["created_at"] = game_state.created_at.isoformat()
-            entry["updated_at"] = game_state.updated_at.isoformat()
-            processed_games.add(game_id)
-
-        games_list.append(entry)
-
-    for game_id, game_state in game_engine.games.items():
-        if game_id in processed_games:
-            continue
-        games_list.append(
-            {
-                "game_id": game_id,
-                "status": "ongoing",
-                "ready": True,
-                "game_format": getattr(
-                    game_state.game_format, "value", str(game_state.game_format)
-                ),
-                "phase_mode": getattr(
-                    game_state.phase_mode, "value", str(game_state.phase_mode)
-                ),
-                "submitted_count": len(game_state.players),
-                "validated_count": len(game_state.players),
-                "seat_claimed_count": len(game_state.players),
-                "player_status": {},
-                "players": [player.id for player in game_state.players],
-                "active_player": game_state.active_player,
-                "turn": game_state.turn,
-                "max_players": len(game_state.players),
-                "created_at": game_state.created_at.isoformat(),
-                "updated_at": game_state.updated_at.isoformat(),
-            }
-        )
+async def list_games(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(0, ge=0),
+) -> List[Dict[str, Any]]:
+    """
+    List game rooms and active games with their current status.
 
-    return games_list
+    Most recently updated first, `limit` entries from `offset`.
+    """
+    return await game_engine.fetch_game_summaries(limit, offset)
 
 
 @router.delete("/games/{game_id}")
@@ -468,7 +430,7 @@ async def get_game_setup_status(
     Creates the game setup if it doesn't exist.
     Optionally claims a seat if player parameter is provided.
     """
-    setup = game_engine.get_game_setup_status(game_id)
+    setup = await game_engine.fetch_game_setup(game_id)
     if not setup:
         # Auto-create setup if it doesn't exist (allows direct URL navigation)
         setup = game_engine.create_game_setup(game_id=game_id)
@@ -611,9 +573,10 @@ async def update_game_settings(game_id: str, request: dict) -> GameSetupStatus:
 @router.get("/games/{game_id}/state")
 async def get_game_state(game_id: str) -> Dict[str, Any]:
     """Get current game state (only available after setup is complete)."""
-    if game_id not in game_engine.games:
+    game_state = await fetch_game_state(game_id)
+    if not game_state:
         raise HTTPException(status_code=404, detail="Game not found")
-    return game_engine.games[game_id].model_dump(mode="json")
+    return game_state.model_dump(mode="json")
 
 
 @router.get("/games/{game_id}/ui-data")
@@ -634,12 +597,14 @@ async def get_game_ui_data(game_id: str, viewer_id: Optional[str] = None) -> dic
     Returns:
         Compact game state with card_instances and card_catalog
     """
-    if game_id not in game_engine.games:
+    game_state = await fetch_game_state(game_id)
+    if not game_state:
         raise HTTPException(status_code=404, detail="Game not found")
 
-    game_state = game_engine.games[game_id]
-    action_history = game_engine.get_action_history(game_id)
-    chat_log = game_engine.get_chat_log(game_id)
+    action_history, chat_log = await asyncio.gather(
+        game_engine.fetch_action_history(game_id),
+        game_engine.fetch_chat_log(game_id),
+    )
     return game_state.to_compact_ui_data(
         viewer_id=viewer_id,
         action_history=action_history,
@@ -647,6 +612,79 @@ async def get_game_ui_data(game_id: str, viewer_id: Optional[str] = None) -> dic
     )
 
 
+@router.get("/games/{game_id}/players/{player_id}/library")
+async def get_player_library(
+    game_id: str, player_id: str, viewer_id: Optional[str] = None
+) -> dict:
+    """
+    Get the ordered card ids of a player's library, for library search.
+
+    Compact payloads only carry the library size; a player loads the
+    contents when they open their own library. Positions match the virtual
+    unique_ids ("{player_id}:library:{index}") used by library actions.
+    Nobody else may see the order, opponents and spectators included.
+    """
+    if not viewer_id or viewer_id != player_id:
+        raise HTTPException(
+            status_code=403, detail="Only its owner can search a library"
+        )
+    game_state = await fetch_game_state(game_id)
+    if not game_state:
+        raise HTTPException(status_code=404, detail="Game not found")
+    player = next((p for p in game_state.players if p.id == player_id), None)
+    if player is None:
+        raise HTTPException(status_code=404, detail="Player not found")
+    return {
+        "player_id": player_id,
+        "version": game_state.version,
+        "cards": [card.id for card in player.library],
+    }
+
+
+async def _apply_action_request(
+    engine: SimpleGameEngine, game_id: str, request: dict
+) -> Tuple[GameState, Any]:
+    """
+    Apply one /action request; runs in the game's executor lane.
+
+    Raises KeyError if the game does not exist.
+    """
+    with identity_scope():
+        current_state = engine.games.get(game_id)
+        if not current_state:
+            raise KeyError(game_id)
+
+        action, broadcast_info = await build_game_action(
+            game_id, request, current_state
+        )
+
+        # State, replay step and history entry are committed together
+        with engine.unit_of_work():
+            game_state = await engine.process_action(
+                game_id, action, game_state=current_state
+            )
+            broadcast_info = (
+                engine.record_action_history(
+                    game_id, broadcast_info, game_state=game_state
+                )
+                or broadcast_info
+            )
+    return game_state, broadcast_info
+
+
+async def _apply_action_batch(
+    engine: SimpleGameEngine, game_id: str, requests: List[dict]
+) -> Tuple[GameState, List[dict]]:
+    """Apply an /action/batch request, like _apply_action_request."""
+    with identity_scope():
+        current_state = engine.games.get(game_id)
+        if not current_state:
+            raise KeyError(game_id)
+        return await engine.process_actions(
+            game_id, requests, build_game_action, game_state=current_state
+        )
+
+
 @router.post("/games/{game_id}/action")
 async def perform_game_action(
     game_id: str, request: dict, engine: SimpleGameEngine = Depends(get_game_engine)
@@ -667,67 +705,130 @@ async def perform_game_action(
             f"Available: {action_registry.list_actions()}",
         )
 
-    current_state = engine.games.get(game_id)
-    if not current_state:
-        raise HTTPException(status_code=404, detail="Game not found")
-
-    if "player_id" in request:
-        player_id = request["player_id"]
-    else:
-        if action_type in ["pass_priority", "resolve_stack"]:
-            priority_index = current_state.priority_player
-            player_id = (
-                current_state.players[priority_index].id
-                if 0 <= priority_index < len(current_state.players)
-                else f"player{priority_index + 1}"
-            )
-        else:
-            active_index = current_state.active_player
-            player_id = (
-                current_state.players[active_index].id
-                if 0 <= active_index < len(current_state.players)
-                else f"player{active_index + 1}"
-            )
+    if actor_runtime.enabled:
+        # The owning actor applies and broadcasts; forwarded actions come
+        # back without the full state
+        try:
+            outcome = await actor_runtime.submit(game_id, request)
+        except ForwardedActionError as e:
+            raise HTTPException(status_code=e.status_code, detail=str(e))
+        except KeyError:
+            raise HTTPException(status_code=404, detail="Game not found")
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+        return {
+            "success": True,
+            "version": outcome.version,
+            "game_state": outcome.game_state.model_dump(mode="json")
+            if outcome.game_state
+            else None,
+        }
 
     try:
-        handler = handler_info["handler"]
-        action_data = await handler(game_id, request, current_state)
-
-        final_action_type = action_data.get("action_type", action_type)
-
-        action_params = {
-            k: v
-            for k, v in action_data.items()
-            if k not in ["broadcast_data", "action_type"]
-        }
-        action = GameAction(
-            player_id=player_id, action_type=final_action_type, **action_params
+        # Load, apply and save in the game's executor lane, off the loop
+        game_state, broadcast_info = await game_action_executor.run(
+            game_id, _apply_action_request, engine, game_id, request
         )
 
-        game_state = await engine.process_action(
-            game_id, action, game_state=current_state
+        await broadcast_game_update(
+            game_id, game_state, broadcast_info, record_history=False
         )
 
-        broadcast_info = {"action": action_type, "player": player_id, "success": True}
-        broadcast_info.update(action_data.get("broadcast_data", {}))
-        if broadcast_info.get("face_down"):
-            broadcast_info.setdefault("face_down_owner", player_id)
-
-        await broadcast_game_update(game_id, game_state, broadcast_info)
-
         return {"success": True, "game_state": game_state.model_dump(mode="json")}
 
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Game not found")
+    except GameStateConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 
+@router.post("/games/{game_id}/action/batch")
+async def perform_game_action_batch(
+    game_id: str, request: dict, engine: SimpleGameEngine = Depends(get_game_engine)
+) -> dict:
+    """
+    Apply an ordered list of actions (same bodies as /action) all-or-nothing.
+
+    The actions run against one in-memory state, which is saved once with a
+    replay step and history entry per action, and broadcast once. If any
+    action fails, none is applied; the error names the failing index.
+    """
+    requests = request.get("actions")
+    if not isinstance(requests, list) or not requests:
+        raise HTTPException(status_code=400, detail="actions must be a non-empty list")
+    if len(requests) > engine.MAX_BATCH_ACTIONS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"A batch holds at most {engine.MAX_BATCH_ACTIONS} actions",
+        )
+    for index, action_request in enumerate(requests):
+        action_type = (
+            action_request.get("action_type")
+            if isinstance(action_request, dict)
+            else None
+        )
+        if not action_registry.get_handler(action_type):
+            raise HTTPException(
+                status_code=400,
+                detail=f"Action {index}: unknown action_type {action_type!r}",
+            )
+        if "player_id" in request:
+            action_request.setdefault("player_id", request["player_id"])
+
+    if actor_runtime.enabled:
+        try:
+            outcome = await actor_runtime.submit(game_id, {"actions": requests})
+        except (BatchActionError, ForwardedActionError) as e:
+            raise HTTPException(status_code=e.status_code, detail=str(e))
+        except KeyError:
+            raise HTTPException(status_code=404, detail="Game not found")
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return {
+            "success": True,
+            "version": outcome.version,
+            "action_results": outcome.action_results,
+            "game_state": outcome.game_state.model_dump(mode="json")
+            if outcome.game_state
+            else None,
+        }
+
+    try:
+        game_state, entries = await game_action_executor.run(
+            game_id, _apply_action_batch, engine, game_id, requests
+        )
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Game not found")
+    except BatchActionError as e:
+        raise HTTPException(status_code=e.status_code, detail=str(e))
+    except GameStateConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    await broadcast_game_update(game_id, game_state, entries, record_history=False)
+
+    return {
+        "success": True,
+        "version": game_state.version,
+        "action_results": entries,
+        "game_state": game_state.model_dump(mode="json"),
+    }
+
+
 @router.post("/games/{game_id}/actions")
 async def perform_action(game_id: str, action: GameAction) -> Dict[str, Any]:
     """Legacy endpoint - perform an action in the game."""
     try:
-        game_state = await game_engine.process_action(game_id, action)
+        game_state = await game_action_executor.run(
+            game_id, game_engine.process_action, game_id, action
+        )
         return game_state.model_dump(mode="json")
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -897,46 +998,126 @@ async def list_available_actions() -> Dict[str, Any]:
     }
 
 
+async def _synthetic_replay_step(game_id: str) -> Optional[Dict[str, Any]]:
+    """Single snapshot step for games without recorded history."""
+    current_state = await game_engine.fetch_game(game_id)
+    if current_state is None:
+        return None
+    # Create a synthetic single-step timeline using compact format
+    # Exclude card_catalog - not needed for replay
+    compact_data = current_state.to_compact_ui_data(
+        action_history=await game_engine.fetch_action_history(game_id),
+        chat_log=await game_engine.fetch_chat_log(game_id),
+    )
+    return {
+        "timestamp": time.time(),
+        "state": compact_data,
+        "action": {"action_type": "snapshot", "player_id": "system"},
+    }
+
+
 @router.get("/games/{game_id}/replay")
-async def get_game_replay(game_id: str) -> Dict[str, Any]:
+async def get_game_replay(
+    game_id: str,
+    from_step: int = Query(0, ge=0, description="First step to return"),
+    to_step: Optional[int] = Query(
+        None, ge=0, description="Stop before this step (default: last step)"
+    ),
+) -> Dict[str, Any]:
     """
-    Get the full replay history for a game.
+    Get the replay history for a game, optionally a range of steps.
 
     Returns a compact structure with:
     - game_id: The game identifier
     - timeline: List of game states (referencing cards by card_id)
+    - from_step: Index of the first returned step
+    - total_steps: Number of steps in the whole replay
 
     Card definitions are not included - they can be fetched via /cards/{card_id}
     when replaying. This significantly reduces replay file size.
+
+    Long replays are better read page by page or through /replay/stream.
     """
-    if game_id in game_engine.replays:
+    timeline = await game_engine.get_replay_timeline(game_id, from_step, to_step)
+    if timeline is not None:
         return {
             "game_id": game_id,
-            "timeline": game_engine.replays[game_id],
+            "timeline": timeline,
+            "from_step": from_step,
+            "total_steps": await game_engine.fetch_replay_step_count(game_id),
         }
 
     # Fallback for games without recorded history (e.g. started before restart)
-    if game_id in game_engine.games:
-        current_state = game_engine.games[game_id]
-        # Create a synthetic single-step timeline using compact format
-        # Exclude card_catalog - not needed for replay
-        compact_data = current_state.to_compact_ui_data(
-            action_history=game_engine.get_action_history(game_id),
-            chat_log=game_engine.get_chat_log(game_id),
-        )
-        synthetic_step = {
-            "timestamp": time.time(),
-            "state": compact_data,
-            "action": {"action_type": "snapshot", "player_id": "system"},
-        }
+    synthetic_step = await _synthetic_replay_step(game_id)
+    if synthetic_step is not None:
         return {
             "game_id": game_id,
-            "timeline": [synthetic_step],
+            "timeline": [synthetic_step][from_step:to_step],
+            "from_step": from_step,
+            "total_steps": 1,
         }
 
     raise HTTPException(status_code=404, detail="Replay not found for this game")
 
 
+@router.get("/games/{game_id}/replay/steps/{step}")
+async def get_game_replay_step(game_id: str, step: int) -> Dict[str, Any]:
+    """Get a single replay step by index."""
+    if step < 0:
+        raise HTTPException(status_code=404, detail="Replay step not found")
+    timeline = await game_engine.get_replay_timeline(game_id, step, step + 1)
+    if timeline is None:
+        synthetic_step = await _synthetic_replay_step(game_id)
+        timeline = [synthetic_step][step:] if synthetic_step else None
+        total_steps = 1
+    else:
+        total_steps = await game_engine.fetch_replay_step_count(game_id)
+    if not timeline:
+        raise HTTPException(status_code=404, detail="Replay step not found")
+    return {"game_id": game_id, "step": step, "total_steps": total_steps, **timeline[0]}
+
+
+@router.get("/games/{game_id}/replay/stream")
+async def stream_game_replay(
+    game_id: str,
+    from_step: int = Query(0, ge=0, description="First step to send"),
+) -> StreamingResponse:
+    """
+    Stream a replay as NDJSON, one line per step.
+
+    The first line is {"game_id", "from_step", "total_steps"}; every following
+    line is a step with its "step" index. Steps are read from the database
+    through a server-side cursor and sent as they are decoded, so clients can
+    start playback after the first lines.
+    """
+    total_steps = await game_engine.fetch_replay_step_count(game_id)
+    if total_steps:
+        steps = game_engine.iter_replay_steps(game_id, from_step)
+    else:
+        synthetic_step = await _synthetic_replay_step(game_id)
+        if synthetic_step is None:
+            raise HTTPException(
+                status_code=404, detail="Replay not found for this game"
+            )
+        total_steps = 1
+
+        async def synthetic_steps() -> AsyncIterator[Dict[str, Any]]:
+            for entry in [synthetic_step][from_step:]:
+                yield entry
+
+        steps = synthetic_steps()
+
+    async def lines() -> AsyncIterator[str]:
+        header = {"game_id": game_id, "from_step": from_step, "total_steps": total_steps}
+        yield json.dumps(header) + "\n"
+        index = from_step
+        async for entry in steps:
+            yield json.dumps({"step": index, **entry}) + "\n"
+            index += 1
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
 # =============================================================================
 # Pricing API endpoints (data loaded in memory at startup)
 # =============================================================================
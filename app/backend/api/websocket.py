@@ -2,22 +2,168 @@
 WebSocket handler for real-time game communication.
 """
 
+from collections import deque
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from typing import Dict, List, Optional
+from typing import Deque, Dict, List, Optional, Set, Tuple
+import heapq
+import itertools
 import json
 import asyncio
+import os
+import socket
 import time
 
+from app.backend.core.config import settings
+from app.backend.repositories.dict_proxies import (
+    GameStateConflictError,
+    identity_scope,
+)
+from app.backend.services.action_executor import game_action_executor
+from app.backend.utils.state_delta import diff_compact_state, state_order
+
 
 websocket_router = APIRouter()
 
 
+# Messages a connection may have queued before it counts as a slow consumer
+SEND_QUEUE_SIZE = 64
+# Close code sent to slow consumers; clients reconnect and resync
+SLOW_CONSUMER_CLOSE_CODE = 1013
+# Fan-out latencies kept per room
+FANOUT_WINDOW = 200
+# Each connection is pinged this long after it was last pinged...
+PING_INTERVAL_SECONDS = 30
+# ...and dropped once the client has been silent for this long (two missed
+# pongs)
+PING_TIMEOUT_SECONDS = 75
+HEARTBEAT_TICK_SECONDS = 1.0
+# Sequenced state messages kept per room for clients resuming with ?last_seq=
+REPLAY_BUFFER_SIZE = 128
+# How long an empty room keeps its replay buffer (and its NOTIFY subscription)
+REPLAY_RETENTION_SECONDS = 60
+
+
+class _Fanout:
+    """One broadcast in flight: done once every recipient's writer sent it."""
+
+    __slots__ = ("game_id", "started", "remaining", "on_done")
+
+    def __init__(self, game_id: str, remaining: int, on_done):
+        self.game_id = game_id
+        self.started = time.perf_counter()
+        self.remaining = remaining
+        self.on_done = on_done
+
+    def sent(self) -> None:
+        self.remaining -= 1
+        if self.remaining == 0:
+            self.on_done(self.game_id, time.perf_counter() - self.started)
+
+
+class Connection:
+    """
+    One client socket with its own bounded send queue and writer task.
+
+    Messages are queued already encoded; the writer sends them in order, so
+    a slow socket only delays itself. enqueue() returns False when the queue
+    is full, and the manager then drops the connection.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        game_id: str,
+        player_id: str,
+        max_queue: int = SEND_QUEUE_SIZE,
+    ):
+        self.websocket = websocket
+        self.game_id = game_id
+        self.player_id = player_id
+        # Last time the client sent anything (pongs included)
+        self.last_seen = time.time()
+        self.queue: asyncio.Queue = asyncio.Queue(max_queue)
+        self.writer: Optional[asyncio.Task] = None
+        self.closed = False
+
+    def start(self, on_error) -> None:
+        self.writer = asyncio.get_running_loop().create_task(self._write(on_error))
+
+    def enqueue(self, text: str, fanout: Optional[_Fanout] = None) -> bool:
+        try:
+            self.queue.put_nowait((text, fanout))
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    async def _write(self, on_error) -> None:
+        while True:
+            text, fanout = await self.queue.get()
+            try:
+                await self.websocket.send_text(text)
+            except Exception as e:
+                print(f"Error sending message to WebSocket {self.player_id}: {e}")
+                if fanout is not None:
+                    fanout.sent()
+                on_error(self)
+                return
+            if fanout is not None:
+                fanout.sent()
+
+    def stop(self) -> None:
+        """Cancel the writer; queued broadcasts count as delivered."""
+        self.closed = True
+        if self.writer is not None:
+            self.writer.cancel()
+        while not self.queue.empty():
+            _, fanout = self.queue.get_nowait()
+            if fanout is not None:
+                fanout.sent()
+
+
 class ConnectionManager:
-    """Manages WebSocket connections for game rooms."""
+    """
+    Manages WebSocket connections for game rooms.
+
+    Connections are indexed by room (active_connections, insertion ordered)
+    and by socket, so lookups and removals are O(1). Heartbeats are kept in a
+    heap ordered by due time; each tick only pops the connections that are
+    due instead of walking every room.
+
+    Sequenced state messages are also kept, encoded, in a bounded per-room
+    replay buffer. A client reconnecting with the seq it last applied gets
+    only what it missed (resume), then the chat and action history tails,
+    which unsequenced messages may have added to meanwhile. The buffer
+    outlives the room's last connection by REPLAY_RETENTION_SECONDS to cover
+    network blips. A game restarted in the room (new created_at, versions
+    starting over) starts a new buffer.
+    """
 
     def __init__(self):
-        self.active_connections: Dict[str, List[tuple]] = {}
+        self.active_connections: Dict[str, Dict[WebSocket, Connection]] = {}
+        self._by_socket: Dict[WebSocket, Connection] = {}
+        # (due time, tie-breaker, connection); entries of closed connections
+        # are skipped when they come due
+        self._heartbeats: List[Tuple[float, int, Connection]] = []
+        self._heartbeat_order = itertools.count()
         self.heartbeat_task: Optional[asyncio.Task] = None
+        # Set by the WS server: LISTENs to the NOTIFY channel of every room
+        # with a connection here (see ws_main.RoomNotifyListener)
+        self.room_listener = None
+        # Tags the broadcasts this process relays so its listener skips them
+        self.origin = f"{socket.gethostname()}:{os.getpid()}"
+        self._relay_tasks: Set[asyncio.Task] = set()
+        self._close_tasks: Set[asyncio.Task] = set()
+        # Per room: seconds from broadcast to the last recipient's send
+        self.fanout_latencies: Dict[str, Deque[float]] = {}
+        # Per room: ((created_at, seq), compact state) of the last
+        # game_state_update sent, the base of the next delta
+        self._room_states: Dict[str, Tuple[Tuple[str, float], dict]] = {}
+        # Per room: (base_seq, seq, encoded message) of the recent state
+        # messages; base_seq is None for full snapshots
+        self._replay: Dict[str, Deque[Tuple[Optional[int], int, str]]] = {}
+        self._expiries: Dict[str, asyncio.TimerHandle] = {}
+        self.broadcasts = 0
+        self.slow_consumer_disconnects = 0
 
     def ensure_heartbeat(self):
         """
@@ -40,40 +186,35 @@ class ConnectionManager:
         self.heartbeat_task = loop.create_task(self._heartbeat_loop())
 
     async def _heartbeat_loop(self):
-        """Send periodic ping to all connections and clean up dead ones."""
+        """Ping the connections that are due and drop the silent ones."""
         while True:
             try:
-                await asyncio.sleep(30)
-                current_time = time.time()
-
-                for game_id in list(self.active_connections.keys()):
-                    connections = self.active_connections[game_id]
-                    alive_connections = []
-
-                    for websocket, player_id, last_ping in connections:
-                        try:
-                            if current_time - last_ping > 60:
-                                await websocket.close()
-                                continue
-
-                            await websocket.send_text(
-                                json.dumps({"type": "ping", "timestamp": current_time})
-                            )
-                            alive_connections.append(
-                                (websocket, player_id, current_time)
-                            )
-
-                        except Exception:
-                            continue
-
-                    if alive_connections:
-                        self.active_connections[game_id] = alive_connections
-                    else:
-                        del self.active_connections[game_id]
-
+                await asyncio.sleep(HEARTBEAT_TICK_SECONDS)
+                self._heartbeat_tick(time.time())
             except Exception as e:
                 print(f"Heartbeat error: {e}")
 
+    def _schedule_heartbeat(self, connection: Connection, due: float) -> None:
+        heapq.heappush(
+            self._heartbeats, (due, next(self._heartbeat_order), connection)
+        )
+
+    def _heartbeat_tick(self, now: float) -> None:
+        # Encoded once per tick; every due connection gets the same frame and
+        # the writers send them concurrently
+        ping = None
+        while self._heartbeats and self._heartbeats[0][0] <= now:
+            _, _, connection = heapq.heappop(self._heartbeats)
+            if connection.closed:
+                continue
+            if now - connection.last_seen > PING_TIMEOUT_SECONDS:
+                self._drop(connection, close_code=1000)
+                continue
+            if ping is None:
+                ping = json.dumps({"type": "ping", "timestamp": now})
+            if self._send(connection, ping):
+                self._schedule_heartbeat(connection, now + PING_INTERVAL_SECONDS)
+
     async def connect(
         self, websocket: WebSocket, game_id: str, player_id: str = "spectator"
     ):
@@ -82,17 +223,27 @@ class ConnectionManager:
         self.ensure_heartbeat()
 
         if game_id not in self.active_connections:
-            self.active_connections[game_id] = []
-
-        current_time = time.time()
-        self.active_connections[game_id].append((websocket, player_id, current_time))
+            self.active_connections[game_id] = {}
+        expiry = self._expiries.pop(game_id, None)
+        if expiry is not None:
+            expiry.cancel()
+
+        connection = Connection(websocket, game_id, player_id)
+        connection.start(self._connection_failed)
+        self.active_connections[game_id][websocket] = connection
+        self._by_socket[websocket] = connection
+        self._schedule_heartbeat(connection, time.time() + PING_INTERVAL_SECONDS)
+        if self.room_listener is not None:
+            # Don't report the connection before the room's NOTIFYs reach us
+            await self.room_listener.subscribe(game_id)
 
         print(
             f"WebSocket connected to game {game_id} as {player_id} "
             f"(total: {len(self.active_connections[game_id])})"
         )
 
-        await websocket.send_text(
+        self._send(
+            connection,
             json.dumps(
                 {
                     "type": "connection_established",
@@ -100,72 +251,411 @@ class ConnectionManager:
                     "player_id": player_id,
                     "connected_players": len(self.active_connections[game_id]),
                 }
-            )
+            ),
         )
 
+    def _find(self, websocket: WebSocket, game_id: str) -> Optional[Connection]:
+        connection = self._by_socket.get(websocket)
+        if connection is None or connection.game_id != game_id:
+            return None
+        return connection
+
     def disconnect(self, websocket: WebSocket, game_id: str):
         """Remove a WebSocket connection."""
+        connection = self._find(websocket, game_id)
+        if connection is not None:
+            self._remove(connection)
+
+        print(f"WebSocket disconnected from game {game_id}")
+
+    def _remove(self, connection: Connection) -> bool:
+        connections = self.active_connections.get(connection.game_id)
+        if not connections or connections.get(connection.websocket) is not connection:
+            return False
+        del connections[connection.websocket]
+        del self._by_socket[connection.websocket]
+        connection.stop()
+        if not connections:
+            del self.active_connections[connection.game_id]
+            self._room_closed(connection.game_id)
+        return True
+
+    def _drop(self, connection: Connection, close_code: int) -> None:
+        """Remove a connection and close its socket in the background."""
+        if not self._remove(connection):
+            return
+        task = asyncio.get_running_loop().create_task(
+            self._close(connection.websocket, close_code)
+        )
+        self._close_tasks.add(task)
+        task.add_done_callback(self._close_tasks.discard)
+
+    @staticmethod
+    async def _close(websocket: WebSocket, close_code: int) -> None:
+        try:
+            await websocket.close(code=close_code)
+        except Exception:
+            pass
+
+    def _connection_failed(self, connection: Connection) -> None:
+        self._remove(connection)
+
+    def _send(
+        self, connection: Connection, text: str, fanout: Optional[_Fanout] = None
+    ) -> bool:
+        """Queue text for one connection; a full queue disconnects it."""
+        if connection.enqueue(text, fanout):
+            return True
+        print(
+            f"Disconnecting slow WebSocket {connection.player_id} "
+            f"in game {connection.game_id}"
+        )
+        self.slow_consumer_disconnects += 1
+        if fanout is not None:
+            fanout.sent()
+        self._drop(connection, close_code=SLOW_CONSUMER_CLOSE_CODE)
+        return False
+
+    def _room_closed(self, game_id: str) -> None:
+        self.fanout_latencies.pop(game_id, None)
+        if game_id not in self._replay:
+            self._expire_room(game_id)
+            return
+        # Keep the room subscribed and its buffer filled for a while, so a
+        # client coming back after a blip can still resume
+        self._expiries[game_id] = asyncio.get_running_loop().call_later(
+            REPLAY_RETENTION_SECONDS, self._expire_room, game_id
+        )
+
+    def _expire_room(self, game_id: str) -> None:
+        self._expiries.pop(game_id, None)
         if game_id in self.active_connections:
-            self.active_connections[game_id] = [
-                (ws, pid, ping)
-                for ws, pid, ping in self.active_connections[game_id]
-                if ws != websocket
-            ]
+            return
+        self._room_states.pop(game_id, None)
+        self._replay.pop(game_id, None)
+        if self.room_listener is not None:
+            self.room_listener.unsubscribe(game_id)
 
-            if not self.active_connections[game_id]:
-                del self.active_connections[game_id]
+    def _record_fanout(self, game_id: str, elapsed: float) -> None:
+        if game_id in self.active_connections:
+            self.fanout_latencies.setdefault(
+                game_id, deque(maxlen=FANOUT_WINDOW)
+            ).append(elapsed)
 
-        print(f"WebSocket disconnected from game {game_id}")
+    async def send_to(self, websocket: WebSocket, game_id: str, message: dict):
+        """Send a message to one connection, in order with its broadcasts."""
+        connection = self._find(websocket, game_id)
+        if connection is not None:
+            self._send(connection, json.dumps(message))
 
     async def broadcast_to_game(
         self, game_id: str, message: dict, exclude_websocket: Optional[WebSocket] = None
     ):
-        """Broadcast a message to all connections in a game."""
-        if game_id not in self.active_connections:
-            print(f"No active connections for game {game_id}")
-            return
+        """
+        Broadcast a message to all connections in a game.
 
-        disconnected = []
+        Rooms normally live on a single WS process, but with several processes
+        a rebalance can leave a room's connections split between two of them,
+        so the message is also relayed through the room's NOTIFY channel.
+        """
+        if self.room_listener is not None and settings.ws_processes > 1:
+            self._relay(game_id, message)
+        await self.deliver_local(game_id, message, exclude_websocket)
 
-        for websocket, player_id, last_ping in self.active_connections[game_id]:
-            if exclude_websocket and websocket == exclude_websocket:
-                continue
+    def _relay(self, game_id: str, message: dict) -> None:
+        from app.backend.services.notify_service import async_notify_game_update
 
-            try:
-                await websocket.send_text(json.dumps(message))
-            except Exception as e:
-                print(f"Error sending message to WebSocket {player_id}: {e}")
-                disconnected.append(websocket)
+        task = asyncio.get_running_loop().create_task(
+            async_notify_game_update(game_id, message, origin=self.origin)
+        )
+        self._relay_tasks.add(task)
+        task.add_done_callback(self._relay_done)
+
+    def _relay_done(self, task: asyncio.Task) -> None:
+        self._relay_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            print(f"Error relaying broadcast: {task.exception()}")
+
+    async def deliver_local(
+        self, game_id: str, message: dict, exclude_websocket: Optional[WebSocket] = None
+    ):
+        """
+        Send a message to the connections of a game held by this process.
 
-        for websocket in disconnected:
-            self.disconnect(websocket, game_id)
+        The message is encoded once and queued on every connection; this
+        returns without waiting for the sockets.
+        """
+        if game_id not in self.active_connections and game_id not in self._replay:
+            print(f"No active connections for game {game_id}")
+            return
 
-        remaining_connections = len(self.active_connections.get(game_id, []))
+        text = None
+        if message.get("type") == "game_state_update" and "seq" in message:
+            message = self._sequence_state_update(game_id, message)
+            if message is None:
+                return
+            text = json.dumps(message)
+            self._replay.setdefault(
+                game_id, deque(maxlen=REPLAY_BUFFER_SIZE)
+            ).append((message.get("base_seq"), message["seq"], text))
+
+        recipients = [
+            connection
+            for websocket, connection in self.active_connections.get(
+                game_id, {}
+            ).items()
+            if not (exclude_websocket and websocket == exclude_websocket)
+        ]
+        if not recipients:
+            return
+        if text is None:
+            text = json.dumps(message)
+        fanout = _Fanout(game_id, len(recipients), self._record_fanout)
+        self.broadcasts += 1
+        for connection in recipients:
+            self._send(connection, text, fanout)
+
+        remaining_connections = len(self.active_connections.get(game_id, {}))
         print(
             f"Broadcasted message to {remaining_connections} "
             f"connections in game {game_id}"
         )
 
+    def _sequence_state_update(self, game_id: str, message: dict) -> Optional[dict]:
+        """
+        Turn a full game_state_update into a game_state_delta against the last
+        state sent to the room.
+
+        Updates carry the game state version as "seq" and are ordered by
+        state_order (created_at, seq). Anything older than the last one sent
+        is dropped; clients whose seq is not the delta's base_seq ask for a
+        snapshot (request_game_state). The first update of a restarted game
+        goes out in full and drops the replay buffer of the previous game,
+        whose seqs it reuses.
+        """
+        order = state_order(message)
+        previous = self._room_states.get(game_id)
+        if previous is not None and order <= previous[0]:
+            return None
+        state = message["game_state"]
+        self._room_states[game_id] = (order, state)
+        if previous is None:
+            return message
+        if order[0] != previous[0][0]:
+            self._replay.pop(game_id, None)
+            return message
+        delta = diff_compact_state(previous[1], state)
+        if delta is None:
+            return message
+        sequenced = {
+            key: value for key, value in message.items() if key != "game_state"
+        }
+        sequenced.update(
+            type="game_state_delta", base_seq=previous[0][1], delta=delta
+        )
+        return sequenced
+
+    def resume(
+        self,
+        websocket: WebSocket,
+        game_id: str,
+        last_seq: int,
+        created_at: Optional[str] = None,
+        logs: Optional[dict] = None,
+    ) -> bool:
+        """
+        Send a reconnecting client the state messages after last_seq, then
+        session_resumed carrying logs (chat_log and action_history, read
+        after the client connected, as in a snapshot).
+
+        created_at is that of the game the client last applied a state of;
+        seqs of a restarted game only make sense within it. Returns False
+        when the buffer no longer covers last_seq (evicted, expired, another
+        process restarted the room, or the game was restarted since); the
+        caller then sends a full snapshot instead.
+        """
+        connection = self._find(websocket, game_id)
+        buffered = self._replay.get(game_id)
+        if connection is None or not buffered or last_seq > buffered[-1][1]:
+            return False
+        room_state = self._room_states.get(game_id)
+        if created_at is not None and (
+            room_state is None or room_state[0][0] != created_at
+        ):
+            return False
+        missed = [entry for entry in buffered if entry[1] > last_seq]
+        if missed and missed[0][0] not in (None, last_seq):
+            return False
+        if not missed and last_seq not in (entry[1] for entry in buffered):
+            return False
+        for _, _, text in missed:
+            if not self._send(connection, text):
+                return True
+        self._send(
+            connection,
+            json.dumps(
+                {
+                    "type": "session_resumed",
+                    "last_seq": last_seq,
+                    "seq": buffered[-1][1],
+                    "replayed": len(missed),
+                    **(logs or {}),
+                }
+            ),
+        )
+        return True
+
     def get_connection_count(self, game_id: str) -> int:
         """Get number of active connections for a game."""
-        return len(self.active_connections.get(game_id, []))
+        return len(self.active_connections.get(game_id, {}))
+
+    def mark_alive(self, websocket: WebSocket, game_id: str):
+        """Record that the client just sent something."""
+        connection = self._find(websocket, game_id)
+        if connection is not None:
+            connection.last_seen = time.time()
+
+    def stats(self) -> Dict[str, object]:
+        """Connection counts and fan-out latency, overall and worst rooms."""
+
+        def p95(samples: List[float]) -> float:
+            ordered = sorted(samples)
+            return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+        per_room = {
+            game_id: p95(list(samples))
+            for game_id, samples in self.fanout_latencies.items()
+            if samples
+        }
+        samples = [
+            sample for room in self.fanout_latencies.values() for sample in room
+        ]
+        worst = sorted(per_room.items(), key=lambda item: item[1], reverse=True)[:5]
+        return {
+            "connections": len(self._by_socket),
+            "broadcasts": self.broadcasts,
+            "slow_consumer_disconnects": self.slow_consumer_disconnects,
+            "replay_rooms": len(self._replay),
+            "fanout_ms_p95": round(p95(samples) * 1000, 3) if samples else None,
+            "slowest_rooms_fanout_ms_p95": {
+                game_id: round(latency * 1000, 3) for game_id, latency in worst
+            },
+        }
 
-    def update_ping(self, websocket: WebSocket, game_id: str):
-        """Update the last ping time for a connection."""
-        if game_id in self.active_connections:
-            current_time = time.time()
-            updated_connections = []
 
-            for ws, player_id, last_ping in self.active_connections[game_id]:
-                if ws == websocket:
-                    updated_connections.append((ws, player_id, current_time))
-                else:
-                    updated_connections.append((ws, player_id, last_ping))
+manager = ConnectionManager()
 
-            self.active_connections[game_id] = updated_connections
 
+def _build_game_state_snapshot(game_id: str, player_id: str) -> Optional[dict]:
+    """Full game state, history and chat for one client; None if no game."""
+    from app.backend.api.routes import game_engine, load_game_state
+
+    game_state = load_game_state(game_id)
+    if not game_state:
+        return None
+
+    action_history = game_engine.get_action_history(game_id)
+    chat_log = game_engine.get_chat_log(game_id)
+
+    # Use compact format with viewer_id for proper face-down handling
+    # Include card_catalog for initial/full state request
+    return {
+        "type": "game_state_update",
+        "game_state": game_state.to_compact_ui_data(
+            viewer_id=player_id,
+            action_history=action_history,
+            chat_log=chat_log,
+        ),
+        "timestamp": time.time(),
+        "seq": game_state.version,
+    }
+
+
+async def _fetch_session_logs(game_id: str) -> dict:
+    """Chat and action history of a game, as sent with a resumed session."""
+    from app.backend.api.routes import game_engine
+
+    action_history, chat_log = await asyncio.gather(
+        game_engine.fetch_action_history(game_id),
+        game_engine.fetch_chat_log(game_id),
+    )
+    return {"action_history": action_history, "chat_log": chat_log}
+
+
+async def _send_game_state_snapshot(
+    websocket: WebSocket, game_id: str, player_id: str
+) -> bool:
+    """Send the full game state, history and chat to one client."""
+    snapshot = await game_action_executor.run(
+        game_id, _build_game_state_snapshot, game_id, player_id
+    )
+    if snapshot is None:
+        await manager.send_to(
+            websocket,
+            game_id,
+            {"type": "error", "message": f"Game {game_id} not found"},
+        )
+        return False
+    await manager.send_to(websocket, game_id, snapshot)
+    return True
 
-manager = ConnectionManager()
+
+async def _apply_game_action(game_id: str, request_data: dict) -> dict:
+    """
+    Apply one game_action message and build its broadcast.
+
+    Runs in the game's executor lane: every read and write of the state
+    happens there, the event loop only sends the result. Storage reads are
+    scoped to the message (identity_scope()).
+    """
+    from app.backend.api.routes import game_engine
+    from app.backend.api.decorators import build_game_action, build_game_update
+
+    with identity_scope():
+        current_state = game_engine.games.get(game_id)
+        if not current_state:
+            raise ValueError(f"Game {game_id} not found")
+
+        game_action, action_result = await build_game_action(
+            game_id, request_data, current_state
+        )
+
+        print(f"[WS] Dispatching to engine: {game_action.model_dump_json(indent=2)}")
+
+        # State, replay step and history entry share one transaction
+        with game_engine.unit_of_work():
+            updated_game_state = await game_engine.process_action(
+                game_id, game_action, game_state=current_state
+            )
+            action_result = (
+                game_engine.record_action_history(
+                    game_id, action_result, game_state=updated_game_state
+                )
+                or action_result
+            )
+
+        return build_game_update(
+            game_id, updated_game_state, action_result, record_history=False
+        )
+
+
+async def _apply_game_actions(game_id: str, batch: List[dict]) -> dict:
+    """Apply a game_actions batch and build its broadcast, like _apply_game_action."""
+    from app.backend.api.routes import game_engine
+    from app.backend.api.decorators import build_game_action, build_game_update
+
+    with identity_scope():
+        updated_game_state, entries = await game_engine.process_actions(
+            game_id, batch, build_game_action
+        )
+    return build_game_update(game_id, updated_game_state, entries, record_history=False)
+
+
+def _parse_seq(value: Optional[str]) -> Optional[int]:
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
 
 
 @websocket_router.websocket("/ws/game/{game_id}")
@@ -174,8 +664,22 @@ async def websocket_endpoint(websocket: WebSocket, game_id: str):
     query_params = dict(websocket.query_params)
     player_id = query_params.get("player", "spectator")
 
+    last_seq = _parse_seq(query_params.get("last_seq"))
+    created_at = query_params.get("created_at")
+
     await manager.connect(websocket, game_id, player_id)
 
+    # A client coming back after a blip resumes from the last seq it applied;
+    # the snapshot (state, history, chat) is only reloaded when that is gone.
+    # Chat is not sequenced: the logs, read now that the client is connected
+    # again, cover whatever was said while it was away.
+    if "last_seq" in query_params and not game_id.startswith("draft-"):
+        logs = await _fetch_session_logs(game_id) if last_seq is not None else None
+        if last_seq is None or not manager.resume(
+            websocket, game_id, last_seq, created_at, logs
+        ):
+            await _send_game_state_snapshot(websocket, game_id, player_id)
+
     # If it's a draft room, broadcast the initial state
     if game_id.startswith("draft-"):
         from app.backend.api.draft_routes import get_draft_engine
@@ -195,37 +699,17 @@ async def websocket_endpoint(websocket: WebSocket, game_id: str):
         while True:
             data = await websocket.receive_text()
             message = json.loads(data)
+            manager.mark_alive(websocket, game_id)
 
             if message.get("type") == "ping":
-                manager.update_ping(websocket, game_id)
-                await websocket.send_text(
-                    json.dumps({"type": "pong", "timestamp": message.get("timestamp")})
+                await manager.send_to(
+                    websocket,
+                    game_id,
+                    {"type": "pong", "timestamp": message.get("timestamp")},
                 )
 
             elif message.get("type") == "request_game_state":
-                from app.backend.api.routes import game_engine
-
-                if game_id in game_engine.games:
-                    game_state = game_engine.games[game_id]
-                    action_history = game_engine.get_action_history(game_id)
-                    chat_log = game_engine.get_chat_log(game_id)
-
-                    # Use compact format with viewer_id for proper face-down handling
-                    # Include card_catalog for initial/full state request
-                    await websocket.send_text(
-                        json.dumps(
-                            {
-                                "type": "game_state_update",
-                                "game_state": game_state.to_compact_ui_data(
-                                    viewer_id=player_id,
-                                    action_history=action_history,
-                                    chat_log=chat_log,
-                                ),
-                                "timestamp": time.time(),
-                            }
-                        )
-                    )
-
+                if await _send_game_state_snapshot(websocket, game_id, player_id):
                     await manager.broadcast_to_game(
                         game_id,
                         {
@@ -235,12 +719,6 @@ async def websocket_endpoint(websocket: WebSocket, game_id: str):
                         },
                         exclude_websocket=websocket,
                     )
-                else:
-                    await websocket.send_text(
-                        json.dumps(
-                            {"type": "error", "message": f"Game {game_id} not found"}
-                        )
-                    )
 
             elif message.get("type") == "game_action":
                 action_type = message.get("action")
@@ -251,95 +729,27 @@ async def websocket_endpoint(websocket: WebSocket, game_id: str):
                 print(f"[WS] Processing game action: {action_type} from {player_id}")
 
                 try:
-                    from app.backend.api.routes import game_engine
-                    from app.backend.api.decorators import action_registry
-                    from app.backend.models.game import GameAction
-
-                    handler_info = action_registry.get_handler(action_type)
-                    if not handler_info:
-                        raise ValueError(f"Unknown action_type: {action_type}")
-
-                    current_state = game_engine.games.get(game_id)
-                    if not current_state:
-                        raise ValueError(f"Game {game_id} not found")
-
-                    handler = handler_info["handler"]
-                    handler_result = await handler(game_id, request_data, current_state)
-
-                    final_action_type = handler_result.get("action_type", action_type)
-
-                    action_params = {
-                        k: v
-                        for k, v in handler_result.items()
-                        if k not in ["broadcast_data", "action_type"]
-                    }
-                    game_action = GameAction(
-                        player_id=player_id,
-                        action_type=final_action_type,
-                        **action_params,
-                    )
+                    from app.backend.api.routes import actor_runtime
+                    from app.backend.api.decorators import broadcast_coalescer
 
-                    print(
-                        "[WS] Dispatching to engine: "
-                        f"{game_action.model_dump_json(indent=2)}"
-                    )
-                    updated_game_state = await game_engine.process_action(
-                        game_id, game_action, game_state=current_state
-                    )
-                    # Use compact format for reduced payload size
-                    # Exclude card_catalog - clients cache it from initial load
-                    # Note: Broadcasting same state to all players for now.
-                    # Per-player filtering can be added later.
-                    action_history: list = []
-                    chat_log: list = []
-                    broadcast_info = {
-                        "type": "game_state_update",
-                        "game_state": updated_game_state.to_compact_ui_data(
-                            viewer_id=None,
-                            action_history=action_history,
-                            chat_log=chat_log,
-                        ),
-                        "action_result": {
-                            "success": True,
-                            "action": action_type,
-                            "player": player_id,
-                        },
-                        "timestamp": time.time(),
-                    }
-                    broadcast_info["action_result"].update(
-                        handler_result.get("broadcast_data", {})
-                    )
-                    if broadcast_info["action_result"].get("face_down"):
-                        broadcast_info["action_result"].setdefault(
-                            "face_down_owner", player_id
-                        )
-                    broadcast_info["action_result"].setdefault("origin", "server")
-                    broadcast_info["action_result"].setdefault(
-                        "timestamp", broadcast_info["timestamp"]
-                    )
-                    current_phase = getattr(
-                        updated_game_state.phase, "value", updated_game_state.phase
-                    )
-                    if current_phase:
-                        broadcast_info["action_result"].setdefault(
-                            "phase", current_phase
-                        )
-
-                    broadcast_info["game_state"].pop("action_history", None)
-                    broadcast_info["game_state"].pop("chat_log", None)
+                    if actor_runtime.enabled:
+                        # The owning actor applies the action and broadcasts
+                        await actor_runtime.submit(game_id, request_data)
+                        continue
 
-                    game_engine.record_action_history(
-                        game_id, broadcast_info["action_result"]
+                    update = await game_action_executor.run(
+                        game_id, _apply_game_action, game_id, request_data
                     )
-
-                    await manager.broadcast_to_game(game_id, broadcast_info)
+                    await broadcast_coalescer.submit(game_id, update)
 
                 except Exception as e:
                     print(f"Error processing game action via WebSocket: {e}")
                     try:
                         from app.backend.api.routes import game_engine as ge
 
-                        ge.record_action_history(
+                        await game_action_executor.run(
+                            game_id,
+                            ge.record_action_history,
                             game_id,
                             {
                                 "success": False,
@@ -352,14 +762,53 @@ async def websocket_endpoint(websocket: WebSocket, game_id: str):
                         )
                     except Exception:
                         pass  # If we can't record the error, just continue
-                    await websocket.send_text(
-                        json.dumps(
-                            {
-                                "type": "action_error",
-                                "message": str(e),
-                                "action": action_type,
-                            }
-                        )
+                    await manager.send_to(
+                        websocket,
+                        game_id,
+                        {
+                            "type": "action_error",
+                            "message": str(e),
+                            "action": action_type,
+                        },
+                    )
+
+            elif message.get("type") == "game_actions":
+                # One gesture, several actions: applied all-or-nothing, saved
+                # and broadcast once (see SimpleGameEngine.process_actions)
+                batch = []
+                for item in message.get("actions") or []:
+                    item = item if isinstance(item, dict) else {}
+                    request_data = dict(item.get("data") or {})
+                    request_data["action_type"] = item.get("action")
+                    request_data["player_id"] = player_id
+                    batch.append(request_data)
+
+                print(f"[WS] Processing {len(batch)} batched actions from {player_id}")
+
+                try:
+                    from app.backend.api.routes import actor_runtime
+                    from app.backend.api.decorators import broadcast_coalescer
+
+                    if actor_runtime.enabled:
+                        await actor_runtime.submit(game_id, {"actions": batch})
+                        continue
+
+                    update = await game_action_executor.run(
+                        game_id, _apply_game_actions, game_id, batch
+                    )
+                    await broadcast_coalescer.submit(game_id, update)
+
+                except Exception as e:
+                    print(f"Error processing batched actions via WebSocket: {e}")
+                    await manager.send_to(
+                        websocket,
+                        game_id,
+                        {
+                            "type": "action_error",
+                            "message": str(e),
+                            "action": "game_actions",
+                            "index": getattr(e, "index", None),
+                        },
                     )
 
             elif message.get("type") == "chat":
@@ -371,7 +820,9 @@ async def websocket_endpoint(websocket: WebSocket, game_id: str):
                     "message": message.get("message", ""),
                     "timestamp": time.time(),
                 }
-                game_engine.add_chat_message(game_id, payload)
+                await game_action_executor.run(
+                    game_id, game_engine.add_chat_message, game_id, payload
+                )
                 await manager.broadcast_to_game(game_id, {**payload})
 
             elif message.get("type") == "player_joined":
@@ -405,20 +856,36 @@ async def websocket_endpoint(websocket: WebSocket, game_id: str):
             elif message.get("type") == "random_animation":
                 import random
 
+                from app.backend.api.routes import game_engine
+
                 animation_type = message.get("animation_type")
                 player_name = message.get("player", player_id)
 
-                # Calculate result server-side
+                def roll(sides: int) -> int:
+                    # Seeded per game; unseeded only before the game starts
+                    try:
+                        return game_engine.roll_table_die(game_id, sides)
+                    except (ValueError, GameStateConflictError):
+                        return random.randint(1, sides)
+
+                # Calculate result server-side; the roll reads the game state,
+                # so it runs in the game's executor lane
+                sides = {"coin": 2, "d6": 6, "d20": 20}.get(animation_type)
+                rolled = (
+                    await game_action_executor.run(game_id, roll, sides)
+                    if sides
+                    else None
+                )
                 if animation_type == "coin":
-                    result = "Heads" if random.random() < 0.5 else "Tails"
+                    result = "Heads" if rolled == 1 else "Tails"
                     action_label = "Coin Flip"
                     result_message = f"🪙 {result}"
                 elif animation_type == "d6":
-                    result = random.randint(1, 6)
+                    result = rolled
                     action_label = "D6 Roll"
                     result_message = f"🎲 Rolled {result}"
                 elif animation_type == "d20":
-                    result = random.randint(1, 20)
+                    result = rolled
                     action_label = "D20 Roll"
                     if result == 20:
                         result_message = "🎯 Rolled 20 - CRITICAL!"
@@ -432,9 +899,9 @@ async def websocket_endpoint(websocket: WebSocket, game_id: str):
                     result_message = f"Result: {result}"
 
                 # Record in action history for persistence
-                from app.backend.api.routes import game_engine
-
-                game_engine.record_action_history(
+                await game_action_executor.run(
+                    game_id,
+                    game_engine.record_action_history,
                     game_id,
                     {
                         "action": action_label,
@@ -485,10 +952,10 @@ async def websocket_endpoint(websocket: WebSocket, game_id: str):
                             decklist = ""
                             for card in player.drafted_cards:
                                 decklist += f"1 {card.name}\n"
-                            await websocket.send_text(
-                                json.dumps(
-                                    {"type": "decklist_data", "decklist": decklist}
-                                )
+                            await manager.send_to(
+                                websocket,
+                                game_id,
+                                {"type": "decklist_data", "decklist": decklist},
                             )
                         # Don't broadcast after this, it's a direct response
                         continue
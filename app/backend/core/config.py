@@ -17,6 +17,46 @@ class Settings(BaseSettings):
 
     database_url: str | None = None
 
+    # Per-process cache of deserialized game states; 0 disables it
+    game_state_cache_mb: int = 64
+    # Per-process LRU of the card definitions game states refer to
+    # (see repositories/card_definitions.py)
+    card_definition_cache_entries: int = 20000
+
+    # Single-writer game actors (see services/game_actor.py). Off by default:
+    # every worker then loads, mutates and saves the game on each action.
+    game_actor_mode: bool = False
+    game_actor_flush_ms: int = 50
+    game_actor_idle_seconds: float = 300.0
+    game_actor_lease_seconds: float = 30.0
+    game_actor_forward_timeout: float = 10.0
+
+    # "snapshot" stores a compact state per replay step; "events" stores only
+    # the seed, decks and action stream and rebuilds steps on read
+    # (see services/replay_service.py)
+    replay_mode: str = "snapshot"
+
+    # Per-process batch writer for replay steps, action history and chat
+    # (see repositories/batch_writer.py). When off they are written inline.
+    write_behind: bool = True
+    write_behind_flush_ms: int = 5
+    write_behind_max_pending: int = 5000
+    write_behind_max_attempts: int = 5
+
+    # WebSocket processes behind nginx's consistent hash on the room id
+    # (see ws_cluster.py). With more than one, broadcasts made by a WS process
+    # are also relayed through NOTIFY in case a room is split during a
+    # rebalance.
+    ws_processes: int = 1
+    ws_base_port: int = 8001
+    # Threads that apply WebSocket game actions off the event loop, one action
+    # at a time per game (see services/action_executor.py); 0 runs them inline
+    ws_action_workers: int = 4
+
+    # Game state broadcasts of one game within this window are merged into
+    # one (see services/broadcast_coalescer.py); 0 sends each immediately
+    broadcast_coalesce_ms: int = 20
+
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
 
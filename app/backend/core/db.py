@@ -1,23 +1,43 @@
 """PostgreSQL connection helper with connection pooling."""
 
+import asyncio
 import atexit
+import itertools
 import os
-from contextlib import contextmanager
-from typing import Generator, Optional
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import AsyncGenerator, Callable, Generator, List, Optional
 
 import psycopg
-from psycopg_pool import ConnectionPool
+from psycopg import sql
+from psycopg_pool import AsyncConnectionPool, ConnectionPool
 
 from app.backend.core.config import settings
 
 # Global connection pool
 _pool: Optional[ConnectionPool] = None
+# Async pool for the event loop of the process, opened on first use
+_async_pool: Optional[AsyncConnectionPool] = None
+_async_pool_loop: Optional[asyncio.AbstractEventLoop] = None
 
 # Pool configuration
 POOL_MIN_SIZE = 2
 POOL_MAX_SIZE = 20
 POOL_TIMEOUT = 30.0  # seconds to wait for a connection
 
+# Connection owned by the unit of work active in the current context, if any
+_unit_of_work_conn: ContextVar[Optional[psycopg.Connection]] = ContextVar(
+    "manaforge_unit_of_work_conn", default=None
+)
+# Callbacks deferred until the active unit of work commits or rolls back
+_after_commit_callbacks: ContextVar[Optional[List[Callable[[], None]]]] = ContextVar(
+    "manaforge_after_commit_callbacks", default=None
+)
+_on_rollback_callbacks: ContextVar[Optional[List[Callable[[], None]]]] = ContextVar(
+    "manaforge_on_rollback_callbacks", default=None
+)
+_savepoint_ids = itertools.count(1)
+
 
 def get_database_url() -> str:
     url = settings.database_url or os.getenv("DATABASE_URL")
@@ -69,11 +89,191 @@ def get_connection() -> Generator[psycopg.Connection, None, None]:
                 cur.execute(...)
             conn.commit()
     """
+    active = _unit_of_work_conn.get()
+    if active is not None:
+        yield active
+        return
+
     pool = get_pool()
     with pool.connection() as conn:
         yield conn
 
 
+async def get_async_pool() -> AsyncConnectionPool:
+    """
+    Get or open the global async connection pool.
+
+    The pool belongs to the event loop that opened it (the app's main loop);
+    code running on another loop, such as the game action threads, keeps
+    using the sync pool.
+    """
+    global _async_pool, _async_pool_loop
+    loop = asyncio.get_running_loop()
+    if _async_pool is None:
+        pool = AsyncConnectionPool(
+            get_database_url(),
+            min_size=POOL_MIN_SIZE,
+            max_size=POOL_MAX_SIZE,
+            timeout=POOL_TIMEOUT,
+            open=False,
+        )
+        await pool.open()
+        if _async_pool is not None:
+            # Another task opened one while we waited
+            await pool.close()
+        else:
+            _async_pool, _async_pool_loop = pool, loop
+    if _async_pool_loop is not loop:
+        raise RuntimeError("The async connection pool belongs to another event loop")
+    return _async_pool
+
+
+async def close_async_pool() -> None:
+    """Close the async connection pool; called by the app lifespans."""
+    global _async_pool, _async_pool_loop
+    pool, _async_pool, _async_pool_loop = _async_pool, None, None
+    if pool is not None:
+        await pool.close()
+
+
+@asynccontextmanager
+async def get_async_connection() -> AsyncGenerator[psycopg.AsyncConnection, None]:
+    """
+    Get a connection from the async pool.
+
+    Async connections never join a unit_of_work(): callers commit their own
+    writes.
+
+    Usage:
+        async with get_async_connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(...)
+    """
+    pool = await get_async_pool()
+    async with pool.connection() as conn:
+        yield conn
+
+
+@contextmanager
+def unit_of_work() -> Generator[psycopg.Connection, None, None]:
+    """
+    Share one pooled connection and transaction across repository calls.
+
+    Every get_connection() inside the block reuses the same connection, and
+    commit() becomes a no-op until the block exits. Statements run in pipeline
+    mode, so writes that don't read results back (state upsert, replay step,
+    history row) reach the server together with the final COMMIT.
+
+    Nested blocks join the outermost unit of work inside a savepoint: an
+    exception in a nested block only undoes that block's writes, while an
+    exception in the outermost block rolls back the whole transaction.
+
+    Usage:
+        with unit_of_work():
+            games[game_id] = game_state
+            replays.append_step(game_id, step)
+    """
+    active = _unit_of_work_conn.get()
+    if active is not None:
+        with _savepoint(active):
+            yield active
+        return
+
+    pool = get_pool()
+    callbacks: List[Callable[[], None]] = []
+    rollback_callbacks: List[Callable[[], None]] = []
+    with pool.connection() as conn:
+        token = _unit_of_work_conn.set(conn)
+        callbacks_token = _after_commit_callbacks.set(callbacks)
+        rollback_token = _on_rollback_callbacks.set(rollback_callbacks)
+        try:
+            with conn.pipeline():
+                yield conn
+                conn.commit()
+        except BaseException:
+            for callback in rollback_callbacks:
+                _run_after_commit(callback)
+            raise
+        finally:
+            _on_rollback_callbacks.reset(rollback_token)
+            _after_commit_callbacks.reset(callbacks_token)
+            _unit_of_work_conn.reset(token)
+    for callback in callbacks:
+        _run_after_commit(callback)
+
+
+@contextmanager
+def _savepoint(conn: psycopg.Connection) -> Generator[None, None, None]:
+    """Scope a nested unit of work to its own savepoint."""
+    # Issued by hand: conn.transaction() would BEGIN/COMMIT an outer
+    # transaction when nothing has been sent yet in pipeline mode.
+    name = sql.Identifier(f"uow_{next(_savepoint_ids)}")
+    callbacks = _after_commit_callbacks.get()
+    pending = len(callbacks) if callbacks is not None else 0
+    rollback_callbacks = _on_rollback_callbacks.get()
+    rollback_pending = len(rollback_callbacks) if rollback_callbacks is not None else 0
+    conn.execute(sql.SQL("SAVEPOINT {}").format(name))
+    try:
+        yield
+    except BaseException:
+        conn.execute(sql.SQL("ROLLBACK TO SAVEPOINT {}").format(name))
+        if callbacks is not None:
+            del callbacks[pending:]
+        if rollback_callbacks is not None:
+            for callback in rollback_callbacks[rollback_pending:]:
+                _run_after_commit(callback)
+            del rollback_callbacks[rollback_pending:]
+        raise
+    conn.execute(sql.SQL("RELEASE SAVEPOINT {}").format(name))
+
+
+def in_unit_of_work() -> bool:
+    """Return True when the current context is inside a unit of work."""
+    return _unit_of_work_conn.get() is not None
+
+
+def after_commit(callback: Callable[[], None]) -> None:
+    """
+    Run callback once the active unit of work commits.
+
+    Outside a unit of work the caller has already committed, so the callback
+    runs immediately. Callbacks registered in a block that rolls back (the
+    whole unit of work or a nested savepoint) are dropped.
+    """
+    callbacks = _after_commit_callbacks.get()
+    if callbacks is None:
+        _run_after_commit(callback)
+        return
+    callbacks.append(callback)
+
+
+def on_rollback(callback: Callable[[], None]) -> None:
+    """
+    Run callback if the writes made so far in the active unit of work are
+    rolled back, e.g. to forget in-memory bookkeeping about them.
+
+    Outside a unit of work the caller has already committed, so this is a
+    no-op.
+    """
+    callbacks = _on_rollback_callbacks.get()
+    if callbacks is not None:
+        callbacks.append(callback)
+
+
+def _run_after_commit(callback: Callable[[], None]) -> None:
+    try:
+        callback()
+    except Exception as e:
+        print(f"Error in transaction callback: {e}")
+
+
+def commit(conn: psycopg.Connection) -> None:
+    """Commit a connection unless it belongs to the active unit of work."""
+    if _unit_of_work_conn.get() is conn:
+        return
+    conn.commit()
+
+
 def connect() -> psycopg.Connection:
     """
     Return a blocking psycopg connection (legacy interface).
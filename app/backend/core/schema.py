@@ -385,11 +385,272 @@ def _migration_004_cleanup_and_perf(cur: psycopg.Cursor) -> None:
         )
 
 
+def _migration_005_game_state_version(cur: psycopg.Cursor) -> None:
+    """Add a version column to game_states for optimistic concurrency.
+
+    Saves compare the version the caller loaded against the stored one and
+    bump it atomically, so concurrent read-modify-write cycles from different
+    workers can detect each other instead of silently losing updates.
+    """
+    cur.execute(
+        "ALTER TABLE game_states ADD COLUMN IF NOT EXISTS version BIGINT NOT NULL DEFAULT 0;"
+    )
+
+
+def _migration_006_game_actor_leases(cur: psycopg.Cursor) -> None:
+    """Track which process owns each game when game actor mode is enabled.
+
+    owner_id doubles as the owner's NOTIFY channel for forwarded actions. A
+    lease that is not renewed before expires_at can be taken over.
+    """
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS game_actor_leases (
+            game_id TEXT PRIMARY KEY,
+            owner_id TEXT NOT NULL,
+            expires_at TIMESTAMPTZ NOT NULL
+        );
+        """
+    )
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_game_actor_leases_owner "
+        "ON game_actor_leases(owner_id);"
+    )
+
+
+def _migration_007_replay_deltas(cur: psycopg.Cursor) -> None:
+    """Store most replay steps as JSON Patch deltas against the previous step.
+
+    Keyframe rows keep the full state in state_json; delta rows leave it NULL
+    and carry delta_json instead. state_version is the game state version the
+    step was recorded at, used to check the previous row before writing a
+    delta against it.
+    """
+    cur.execute("ALTER TABLE game_replays ALTER COLUMN state_json DROP NOT NULL;")
+    cur.execute("ALTER TABLE game_replays ADD COLUMN IF NOT EXISTS delta_json JSONB;")
+    cur.execute(
+        "ALTER TABLE game_replays ADD COLUMN IF NOT EXISTS state_version BIGINT;"
+    )
+
+
+def _migration_008_replay_events(cur: psycopg.Cursor) -> None:
+    """Event log for event-sourced replays (REPLAY_MODE=events).
+
+    A game's log is a "setup" event holding the RNG seed, the submitted decks
+    and the setup, followed by one "action" event per applied GameAction.
+    Replay steps are rebuilt from it instead of being stored as states.
+    """
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS game_replay_events (
+            game_id TEXT NOT NULL,
+            seq INTEGER NOT NULL,
+            event_type TEXT NOT NULL,
+            payload_json JSONB NOT NULL,
+            recorded_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+            PRIMARY KEY (game_id, seq)
+        );
+        """
+    )
+
+
+def _migration_009_notify_outbox(cur: psycopg.Cursor) -> None:
+    """Outbox for notifications too large for a NOTIFY payload.
+
+    The publisher stores the payload here and NOTIFY only carries the row id;
+    rows are pruned once they are older than the outbox retention.
+    """
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS notify_outbox (
+            id BIGSERIAL PRIMARY KEY,
+            channel TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+        );
+        CREATE INDEX IF NOT EXISTS idx_notify_outbox_created_at
+            ON notify_outbox (created_at);
+        """
+    )
+
+
+def _migration_010_game_summaries(cur: psycopg.Cursor) -> None:
+    """Narrow per-game rows for the lobby list (repositories/game_summaries.py).
+
+    The setup columns are written with every game setup save and the state
+    columns with every game state save, in the same transaction; updated_at
+    is the later of the two and orders the list. Existing games are
+    backfilled from their documents.
+    """
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS game_summaries (
+            game_id TEXT PRIMARY KEY,
+            setup_status TEXT,
+            ready BOOLEAN,
+            game_format TEXT,
+            phase_mode TEXT,
+            max_players INTEGER,
+            submitted_count INTEGER,
+            validated_count INTEGER,
+            seat_claimed_count INTEGER,
+            player_status JSONB,
+            setup_created_at TIMESTAMPTZ,
+            setup_updated_at TIMESTAMPTZ,
+            players JSONB,
+            active_player INTEGER,
+            turn INTEGER,
+            state_created_at TIMESTAMPTZ,
+            state_updated_at TIMESTAMPTZ,
+            updated_at TIMESTAMPTZ NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_game_summaries_updated_at
+            ON game_summaries (updated_at DESC, game_id);
+        """
+    )
+    cur.execute(
+        """
+        INSERT INTO game_summaries (
+            game_id, setup_status, ready, game_format, phase_mode, max_players,
+            submitted_count, validated_count, seat_claimed_count, player_status,
+            setup_created_at, setup_updated_at, updated_at
+        )
+        SELECT
+            id,
+            setup_json->>'status',
+            COALESCE((setup_json->>'ready')::boolean, FALSE),
+            setup_json->>'game_format',
+            setup_json->>'phase_mode',
+            COALESCE((setup_json->>'max_players')::int, 2),
+            (SELECT COUNT(*) FROM jsonb_each(setup_json->'player_status') s
+             WHERE (s.value->>'submitted')::boolean),
+            (SELECT COUNT(*) FROM jsonb_each(setup_json->'player_status') s
+             WHERE (s.value->>'validated')::boolean),
+            (SELECT COUNT(*) FROM jsonb_each(setup_json->'player_status') s
+             WHERE (s.value->>'seat_claimed')::boolean),
+            COALESCE(setup_json->'player_status', '{}'::jsonb),
+            COALESCE((setup_json->>'created_at')::timestamptz, created_at),
+            COALESCE((setup_json->>'updated_at')::timestamptz, updated_at),
+            COALESCE((setup_json->>'updated_at')::timestamptz, updated_at)
+        FROM game_setups
+        ON CONFLICT (game_id) DO NOTHING;
+        """
+    )
+    cur.execute(
+        """
+        INSERT INTO game_summaries (
+            game_id, game_format, phase_mode, players, active_player, turn,
+            state_created_at, state_updated_at, updated_at
+        )
+        SELECT
+            id,
+            state_json->>'game_format',
+            state_json->>'phase_mode',
+            jsonb_path_query_array(state_json, '$.players[*].id'),
+            COALESCE((state_json->>'active_player')::int, 0),
+            COALESCE((state_json->>'turn')::int, 1),
+            COALESCE((state_json->>'created_at')::timestamptz, created_at),
+            COALESCE((state_json->>'updated_at')::timestamptz, updated_at),
+            COALESCE((state_json->>'updated_at')::timestamptz, updated_at)
+        FROM game_states
+        ON CONFLICT (game_id) DO UPDATE SET
+            game_format = COALESCE(game_summaries.game_format, EXCLUDED.game_format),
+            phase_mode = COALESCE(game_summaries.phase_mode, EXCLUDED.phase_mode),
+            players = EXCLUDED.players,
+            active_player = EXCLUDED.active_player,
+            turn = EXCLUDED.turn,
+            state_created_at = EXCLUDED.state_created_at,
+            state_updated_at = EXCLUDED.state_updated_at,
+            updated_at = GREATEST(game_summaries.updated_at, EXCLUDED.updated_at);
+        """
+    )
+
+
+def _migration_011_draft_room_summaries(cur: psycopg.Cursor) -> None:
+    """Narrow per-room rows for the draft lobby (draft_room_summaries.py).
+
+    Written with every draft room save, in the same transaction. Existing
+    rooms are backfilled from their documents.
+    """
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS draft_room_summaries (
+            id TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            set_code TEXT NOT NULL,
+            set_name TEXT NOT NULL,
+            draft_type TEXT NOT NULL,
+            state TEXT NOT NULL,
+            max_players INTEGER NOT NULL,
+            player_count INTEGER NOT NULL,
+            human_player_count INTEGER NOT NULL,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+            updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+        );
+        CREATE INDEX IF NOT EXISTS idx_draft_room_summaries_updated_at
+            ON draft_room_summaries (updated_at DESC, id);
+        CREATE INDEX IF NOT EXISTS idx_draft_room_summaries_state
+            ON draft_room_summaries (state, updated_at DESC, id);
+        """
+    )
+    cur.execute(
+        """
+        INSERT INTO draft_room_summaries (
+            id, name, set_code, set_name, draft_type, state, max_players,
+            player_count, human_player_count, created_at, updated_at
+        )
+        SELECT
+            id,
+            room_json->>'name',
+            room_json->>'set_code',
+            room_json->>'set_name',
+            COALESCE(room_json->>'draft_type', 'booster_draft'),
+            COALESCE(room_json->>'state', 'waiting'),
+            COALESCE((room_json->>'max_players')::int, 8),
+            COALESCE(jsonb_array_length(room_json->'players'), 0),
+            (SELECT COUNT(*) FROM jsonb_array_elements(room_json->'players') p
+             WHERE NOT COALESCE((p->>'is_bot')::boolean, FALSE)),
+            created_at,
+            updated_at
+        FROM draft_rooms
+        ON CONFLICT (id) DO NOTHING;
+        """
+    )
+
+
+def _migration_012_card_definitions(cur: psycopg.Cursor) -> None:
+    """Static card data shared by game states (card_definitions.py).
+
+    Keyed by a digest of the definition, so rows are never updated. Existing
+    game states keep their full cards until their next save.
+    """
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS card_definitions (
+            definition_key TEXT PRIMARY KEY,
+            card_id TEXT NOT NULL,
+            definition_json JSONB NOT NULL,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+        );
+        CREATE INDEX IF NOT EXISTS idx_card_definitions_card_id
+            ON card_definitions (card_id);
+        """
+    )
+
+
 MIGRATIONS: List[Migration] = [
     Migration(1, "init", _migration_001_init),
     Migration(2, "cards_indexes", _migration_002_cards_indexes),
     Migration(3, "performance_indexes", _migration_003_performance_indexes),
     Migration(4, "cleanup_and_perf", _migration_004_cleanup_and_perf),
+    Migration(5, "game_state_version", _migration_005_game_state_version),
+    Migration(6, "game_actor_leases", _migration_006_game_actor_leases),
+    Migration(7, "replay_deltas", _migration_007_replay_deltas),
+    Migration(8, "replay_events", _migration_008_replay_events),
+    Migration(9, "notify_outbox", _migration_009_notify_outbox),
+    Migration(10, "game_summaries", _migration_010_game_summaries),
+    Migration(11, "draft_room_summaries", _migration_011_draft_room_summaries),
+    Migration(12, "card_definitions", _migration_012_card_definitions),
 ]
 
 
@@ -454,11 +715,16 @@ def drop_tables() -> None:
             cur.execute(
                 """
                 DROP TABLE IF EXISTS users CASCADE;
+                DROP TABLE IF EXISTS notify_outbox CASCADE;
+                DROP TABLE IF EXISTS game_summaries CASCADE;
+                DROP TABLE IF EXISTS draft_room_summaries CASCADE;
+                DROP TABLE IF EXISTS card_definitions CASCADE;
                 DROP TABLE IF EXISTS schema_migrations CASCADE;
                 DROP TABLE IF EXISTS submitted_decks CASCADE;
                 DROP TABLE IF EXISTS pending_decks CASCADE;
                 DROP TABLE IF EXISTS chat_messages CASCADE;
                 DROP TABLE IF EXISTS action_history CASCADE;
+                DROP TABLE IF EXISTS game_replay_events CASCADE;
                 DROP TABLE IF EXISTS game_replays CASCADE;
                 DROP TABLE IF EXISTS game_setups CASCADE;
                 DROP TABLE IF EXISTS game_states CASCADE;
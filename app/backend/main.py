@@ -10,12 +10,20 @@ from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 
 from app.backend.core.config import settings
-from app.backend.api.routes import router
+from app.backend.core.db import close_async_pool
+from app.backend.api.decorators import broadcast_coalescer
+from app.backend.api.routes import actor_runtime, game_engine, router
 from app.backend.api.websocket import websocket_router
 from app.backend.api.draft_routes import router as draft_router
 from app.backend.api.auth_routes import router as auth_router
 from app.backend.services.pricing_service import load_pricing_data
 from app.backend.core.schema import apply_migrations
+from app.backend.models.projection_cache import projection_cache
+from app.backend.repositories.dict_proxies import identity_scope
+from app.backend.repositories.card_definitions import card_definition_store
+from app.backend.repositories.game_state_cache import game_state_cache
+from app.backend.services.action_executor import game_action_executor
+from app.backend.services.notify_service import notify_publisher
 
 
 @asynccontextmanager
@@ -29,8 +37,38 @@ async def lifespan(app: FastAPI):
 
     # Load pricing data into memory at startup
     load_pricing_data()
+
+    if settings.write_behind:
+        game_engine.writer.start()
+    if settings.game_actor_mode:
+        await actor_runtime.start()
+
     yield
 
+    # Let running actions finish, then flush write-behind game state and
+    # the rows it queued before exiting
+    await game_action_executor.stop()
+    await actor_runtime.stop()
+    await game_engine.writer.stop()
+    await broadcast_coalescer.stop()
+    await notify_publisher.stop()
+    await close_async_pool()
+
+
+class IdentityMapMiddleware:
+    """Serve each HTTP request inside its own proxy identity_scope()."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            # WebSocket connections open a scope per message instead
+            await self.app(scope, receive, send)
+            return
+        with identity_scope():
+            await self.app(scope, receive, send)
+
 
 app = FastAPI(
     title=settings.app_name,
@@ -38,6 +76,7 @@ app = FastAPI(
     version="0.1.0",
     lifespan=lifespan,
 )
+app.add_middleware(IdentityMapMiddleware)
 
 # Mount static files (for development; in production Nginx serves these)
 static_dir = Path(__file__).resolve().parent.parent / "static"
@@ -52,5 +91,15 @@ app.include_router(auth_router)
 
 @app.get("/health")
 async def health_check():
-    """Health check endpoint."""
-    return {"status": "healthy", "app": settings.app_name}
+    """Health check endpoint, including this worker's cache, writer and NOTIFY counters."""
+    return {
+        "status": "healthy",
+        "app": settings.app_name,
+        "game_state_cache": game_state_cache.stats(),
+        "card_definitions": card_definition_store.stats(),
+        "projection_cache": projection_cache.stats(),
+        "batch_writer": game_engine.writer.stats(),
+        "broadcast_coalescer": broadcast_coalescer.stats(),
+        "game_action_executor": game_action_executor.stats(),
+        "notify_publisher": notify_publisher.stats(),
+    }
@@ -3,17 +3,26 @@ Core models for the Magic The Gathering game.
 """
 
 from datetime import datetime, timezone
+import operator
+import secrets
 import uuid
 from pydantic import BaseModel, Field, field_validator
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from enum import Enum
 
+from app.backend.models.projection_cache import CardEntry, projection_cache
+
 
 def current_utc_datetime() -> datetime:
     """Return current time with UTC timezone info."""
     return datetime.now(timezone.utc)
 
 
+def new_rng_seed() -> int:
+    """Return a fresh seed for a game's random streams."""
+    return secrets.randbits(63)
+
+
 class CardType(str, Enum):
     """Card types in Magic The Gathering."""
 
@@ -517,6 +526,28 @@ class CombatState(BaseModel):
     )
 
 
+# Scalar Card fields a compact instance is built from (besides the mutable
+# counters, custom_keywords and custom_types)
+_card_instance_fields = operator.itemgetter(
+    "id",
+    "scryfall_id",
+    "owner_id",
+    "tapped",
+    "face_down",
+    "current_face",
+    "is_token",
+    "attacking",
+    "blocking",
+    "targeted",
+    "attached_to",
+    "attachment_order",
+    "current_power",
+    "current_toughness",
+    "loyalty",
+    "is_commander",
+)
+
+
 class GameState(BaseModel):
     """Current state of a Magic game."""
 
@@ -588,6 +619,22 @@ class GameState(BaseModel):
         default_factory=current_utc_datetime,
         description="Timestamp for the most recent change to the game state",
     )
+    version: int = Field(
+        default=0,
+        description="Optimistic concurrency version, incremented on every save",
+    )
+    rng_seed: int = Field(
+        default_factory=new_rng_seed,
+        description="Seed of the game's random streams (shuffles, coin flips, new card ids)",
+    )
+    rng_draws: int = Field(
+        default=0,
+        description="Generators taken so far from the game stream, replayed by actions",
+    )
+    table_rng_draws: int = Field(
+        default=0,
+        description="Generators taken so far from the table stream (dice and coin animations)",
+    )
 
     # Zone names for iteration
     _PLAYER_ZONES = (
@@ -601,8 +648,9 @@ class GameState(BaseModel):
         "look_zone",
     )
 
-    # Zones where cards have no dynamic state and identity is hidden from opponents.
-    # These zones use a compact format: only unique_id list + minimal card mapping.
+    # Zones whose contents and order no viewer may see. They are projected as
+    # {"count": n} only; library search loads the cards on demand (see the
+    # /games/{game_id}/players/{player_id}/library route).
     _HIDDEN_ZONES = ("library",)
 
     def _should_include_definition(
@@ -662,15 +710,15 @@ class GameState(BaseModel):
         if card.targeted:
             instance["targeted"] = True
         if card.counters:
-            instance["counters"] = card.counters
+            instance["counters"] = dict(card.counters)
         if card.attached_to:
             instance["attached_to"] = card.attached_to
         if card.attachment_order is not None:
             instance["attachment_order"] = card.attachment_order
         if card.custom_keywords:
-            instance["custom_keywords"] = card.custom_keywords
+            instance["custom_keywords"] = list(card.custom_keywords)
         if card.custom_types:
-            instance["custom_types"] = card.custom_types
+            instance["custom_types"] = list(card.custom_types)
         if card.current_power is not None:
             instance["current_power"] = card.current_power
         if card.current_toughness is not None:
@@ -682,6 +730,44 @@ class GameState(BaseModel):
 
         return instance
 
+    def _cached_compact_instance(
+        self,
+        card: Card,
+        owner_id: str,
+        zone: str,
+        viewer_id: Optional[str],
+        previous: Dict[str, CardEntry],
+        current: Dict[str, CardEntry],
+    ) -> Tuple[Dict[str, Any], bool]:
+        """
+        Compact instance of card, reusing the previous projection's dict when
+        none of the fields it was built from changed. Returns (instance,
+        reused).
+        """
+        fields = card.__dict__
+        counters = fields["counters"]
+        keywords = fields["custom_keywords"]
+        types = fields["custom_types"]
+        signature = (
+            owner_id,
+            zone,
+            self._should_include_definition(card, owner_id, viewer_id),
+            _card_instance_fields(fields),
+            # Snapshots of the mutable fields, which change in place
+            tuple(counters.items()) if counters else None,
+            tuple(keywords) if keywords else None,
+            tuple(types) if types else None,
+        )
+        entry = previous.get(card.unique_id)
+        reused = entry is not None and entry[0] == signature
+        if not reused:
+            entry = (
+                signature,
+                self._card_to_compact_instance(card, owner_id, zone, viewer_id),
+            )
+        current[card.unique_id] = entry
+        return entry[1], reused
+
     def to_compact_ui_data(
         self,
         viewer_id: Optional[str] = None,
@@ -693,10 +779,14 @@ class GameState(BaseModel):
 
         This format significantly reduces payload size by:
         1. Storing only dynamic state in card_instances
-        2. Using hidden_zone_cards for library (just unique_id -> card_id)
+        2. Sending only a card count for hidden zones (library)
         3. Omitting card identity for face-down cards (for opponents)
         4. NOT including card_catalog - client fetches via /api/v1/cards/{card_id}
 
+        Projections are memoized per state version and viewer (see
+        models/projection_cache.py): only top-level keys of the result may
+        be replaced, nested values are shared with other callers.
+
         Args:
             viewer_id: The player ID viewing this data. Used to determine
                        what information to reveal for face-down cards.
@@ -709,28 +799,58 @@ class GameState(BaseModel):
         """
         if action_history is None or chat_log is None:
             raise ValueError("action_history and chat_log must be provided")
+        key = (self.id, self.created_at, self.version)
+        projection = projection_cache.get(key, viewer_id)
+        if projection is None:
+            projection, per_viewer = self._build_compact_ui_data(viewer_id)
+            projection_cache.put(key, viewer_id, projection, per_viewer)
+        # Shallow copy: history and chat differ per call, the rest is shared
+        result = dict(projection)
+        result["action_history"] = action_history
+        result["chat_log"] = chat_log
+        return result
+
+    def _build_compact_ui_data(
+        self, viewer_id: Optional[str]
+    ) -> Tuple[Dict[str, Any], bool]:
+        """
+        Project the state for viewer_id (see to_compact_ui_data). Also
+        returns whether the projection depends on the viewer, which is only
+        the case when a card is face down.
+        """
+        previous_cards = projection_cache.card_entries(self.id)
+        current_cards: Dict[str, CardEntry] = {}
+        reused_cards = 0
+        per_viewer = False
         card_instances: Dict[str, Dict[str, Any]] = {}
         player_data: List[Dict[str, Any]] = []
 
         for player in self.players:
-            zones_data: Dict[str, List[str]] = {}
+            zones_data: Dict[str, Any] = {}
 
             for zone_name in self._PLAYER_ZONES:
                 zone_cards: List[Card] = getattr(player, zone_name, [])
                 is_hidden_zone = zone_name in self._HIDDEN_ZONES
 
                 if is_hidden_zone:
-                    # Hidden zones: store ordered list of card_ids directly
-                    # Client reconstructs unique_ids from position if needed
-                    zones_data[zone_name] = [card.id for card in zone_cards]
+                    # Hidden zones: no identities, no order. Clients build
+                    # positional unique_ids ("{player}:library:{index}")
+                    zones_data[zone_name] = {"count": len(zone_cards)}
                 else:
                     zone_ids: List[str] = []
                     for card in zone_cards:
                         zone_ids.append(card.unique_id)
                         # Regular zones: full CardInstance with dynamic state
-                        instance = self._card_to_compact_instance(
-                            card, player.id, zone_name, viewer_id
+                        instance, reused = self._cached_compact_instance(
+                            card,
+                            player.id,
+                            zone_name,
+                            viewer_id,
+                            previous_cards,
+                            current_cards,
                         )
+                        reused_cards += reused
+                        per_viewer = per_viewer or instance["face_down"]
                         card_instances[card.unique_id] = instance
                     zones_data[zone_name] = zone_ids
 
@@ -740,8 +860,8 @@ class GameState(BaseModel):
                     "name": player.name,
                     "deck_name": player.deck_name,
                     "life": player.life,
-                    "mana_pool": player.mana_pool,
-                    "counters": player.counters,
+                    "mana_pool": dict(player.mana_pool),
+                    "counters": dict(player.counters),
                     "commander_tax": player.commander_tax,
                     "zones": zones_data,
                 }
@@ -750,14 +870,22 @@ class GameState(BaseModel):
         # Process stack
         stack_ids: List[str] = []
         for card in self.stack:
-            instance = self._card_to_compact_instance(
-                card, card.owner_id or "", "stack", viewer_id
+            instance, reused = self._cached_compact_instance(
+                card,
+                card.owner_id or "",
+                "stack",
+                viewer_id,
+                previous_cards,
+                current_cards,
             )
+            reused_cards += reused
+            per_viewer = per_viewer or instance["face_down"]
             card_instances[card.unique_id] = instance
             stack_ids.append(card.unique_id)
+        projection_cache.store_card_entries(self.id, current_cards, reused_cards)
 
-        return {
-            "schema_version": 1,
+        projection = {
+            "schema_version": 2,
             "game_id": self.id,
             "turn": self.turn,
             "round": self.round,
@@ -780,12 +908,14 @@ class GameState(BaseModel):
             "players": player_data,
             "stack": stack_ids,
             "card_instances": card_instances,
-            "action_history": action_history,
-            "chat_log": chat_log,
-            "targeting_arrows": self.targeting_arrows,
+            # Filled in per call by to_compact_ui_data
+            "action_history": None,
+            "chat_log": None,
+            "targeting_arrows": [dict(arrow) for arrow in self.targeting_arrows],
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
+        return projection, per_viewer
 
 
 class GameAction(BaseModel):
@@ -843,3 +973,19 @@ class DraftRoom(BaseModel):
     packs: List[List[List[Card]]] = Field(default_factory=list)
     pack_direction: int = 1
     cube_configuration: Optional[CubeConfiguration] = None
+
+
+class DraftRoomSummary(BaseModel):
+    """Lobby view of a draft room, without packs or drafted cards."""
+
+    id: str
+    name: str
+    set_code: str
+    set_name: str
+    draft_type: DraftType = DraftType.BOOSTER_DRAFT
+    state: DraftState = DraftState.WAITING
+    max_players: int = 8
+    player_count: int = 0
+    human_player_count: int = 0
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
@@ -0,0 +1,134 @@
+"""
+Per-process cache of GameState.to_compact_ui_data projections.
+
+Projections are keyed by (game_id, created_at, version) and viewer_id, and
+evicted in LRU order. Viewers only see different projections when a card is
+face down, so other projections are stored once for every viewer. The
+version is bumped on every save, and created_at tells a restarted game apart
+from the one it replaced (its versions start over). A state mutated in
+memory must therefore be saved before it is projected again; when a
+mutation is abandoned instead (rolled back, or a write-behind timeline lost
+a race), the engine calls forget(game_id).
+
+Card instance dicts are also kept per game, with the card fields they were
+built from, and reused while those fields are unchanged. Consecutive
+projections then share the instances of untouched cards, which the
+WebSocket delta and the replay diff skip by identity.
+
+Projections are shared, not copied. Callers may set or pop top-level keys
+of the dict they get back but must not mutate nested values.
+"""
+
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+ProjectionKey = Tuple[str, Optional[datetime], int]
+CardEntry = Tuple[tuple, Dict[str, Any]]
+
+PROJECTION_CACHE_SIZE = 256
+# Games whose card instances are kept for reuse
+CARD_CACHE_GAMES = 64
+
+# Viewer slot of the projections that are the same for every viewer
+_ANY_VIEWER = object()
+
+
+class ProjectionCache:
+    """LRU of compact projections plus the last card instances per game."""
+
+    def __init__(
+        self,
+        max_entries: int = PROJECTION_CACHE_SIZE,
+        max_games: int = CARD_CACHE_GAMES,
+    ):
+        self.max_entries = max_entries
+        self.max_games = max_games
+        self._entries: "OrderedDict[Tuple[ProjectionKey, Any], Dict[str, Any]]" = (
+            OrderedDict()
+        )
+        self._cards: "OrderedDict[str, Dict[str, CardEntry]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.cards_reused = 0
+        self.cards_built = 0
+
+    def get(
+        self, key: ProjectionKey, viewer_id: Optional[str]
+    ) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            for entry_key in ((key, _ANY_VIEWER), (key, viewer_id)):
+                projection = self._entries.get(entry_key)
+                if projection is not None:
+                    self._entries.move_to_end(entry_key)
+                    self.hits += 1
+                    return projection
+            self.misses += 1
+            return None
+
+    def put(
+        self,
+        key: ProjectionKey,
+        viewer_id: Optional[str],
+        projection: Dict[str, Any],
+        per_viewer: bool = True,
+    ) -> None:
+        if self.max_entries <= 0:
+            return
+        entry_key = (key, viewer_id if per_viewer else _ANY_VIEWER)
+        with self._lock:
+            self._entries[entry_key] = projection
+            self._entries.move_to_end(entry_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def card_entries(self, game_id: str) -> Dict[str, CardEntry]:
+        """Card instances of the last projection of game_id, by unique_id."""
+        with self._lock:
+            return self._cards.get(game_id, {})
+
+    def store_card_entries(
+        self, game_id: str, entries: Dict[str, CardEntry], reused: int
+    ) -> None:
+        with self._lock:
+            self._cards[game_id] = entries
+            self._cards.move_to_end(game_id)
+            while len(self._cards) > self.max_games:
+                self._cards.popitem(last=False)
+            self.cards_reused += reused
+            self.cards_built += len(entries) - reused
+
+    def forget(self, game_id: str) -> None:
+        """Drop every projection of game_id, e.g. after an unsaved mutation."""
+        with self._lock:
+            for key in [key for key in self._entries if key[0][0] == game_id]:
+                del self._entries[key]
+            self._cards.pop(game_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._cards.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            cards = self.cards_reused + self.cards_built
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+                "evictions": self.evictions,
+                "card_reuse_ratio": (
+                    round(self.cards_reused / cards, 4) if cards else None
+                ),
+            }
+
+
+projection_cache = ProjectionCache()
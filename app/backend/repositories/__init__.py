@@ -16,16 +16,30 @@ from app.backend.repositories.game_repository import (
 )
 
 from app.backend.repositories.dict_proxies import (
+    GameStateConflictError,
     GameStatesProxy,
     GameSetupsProxy,
     DraftRoomsProxy,
     ReplaysProxy,
+    ReplayEventsProxy,
     PendingDecksProxy,
     CubePoolsProxy,
     CubePoolCursorsProxy,
     CubeCardCacheProxy,
 )
 
+from app.backend.repositories.async_proxies import (
+    AsyncDBDictReader,
+    AsyncDBDictProxy,
+    AsyncGameStatesProxy,
+    AsyncGameSetupsProxy,
+    AsyncDraftRoomsProxy,
+    AsyncReplaysProxy,
+    AsyncActionHistoryProxy,
+    AsyncChatMessagesProxy,
+    AsyncGameSummariesProxy,
+)
+
 __all__ = [
     # Repository classes
     "GameStateRepository",
@@ -40,12 +54,24 @@ __all__ = [
     "action_history_repo",
     "chat_repo",
     # Dict-like proxies
+    "GameStateConflictError",
     "GameStatesProxy",
     "GameSetupsProxy",
     "DraftRoomsProxy",
     "ReplaysProxy",
+    "ReplayEventsProxy",
     "PendingDecksProxy",
     "CubePoolsProxy",
     "CubePoolCursorsProxy",
     "CubeCardCacheProxy",
+    # Async proxies for the event loop
+    "AsyncDBDictReader",
+    "AsyncDBDictProxy",
+    "AsyncGameStatesProxy",
+    "AsyncGameSetupsProxy",
+    "AsyncDraftRoomsProxy",
+    "AsyncReplaysProxy",
+    "AsyncActionHistoryProxy",
+    "AsyncChatMessagesProxy",
+    "AsyncGameSummariesProxy",
 ]
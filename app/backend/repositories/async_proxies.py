@@ -0,0 +1,440 @@
+"""
+Async counterparts of the PostgreSQL dict proxies.
+
+Route handlers run on the event loop, where a blocking psycopg call stalls
+every other request the worker is serving. These proxies read the same
+tables through the async connection pool (core/db.get_async_connection) so
+the handler awaits the round-trip instead.
+
+They share table layout, (de)serialization and the per-process game state
+cache with the sync proxies in dict_proxies.py, which stay the write path:
+writes join unit_of_work() transactions and run in worker threads (the
+game action executor, the batch writer) that have no access to the main
+loop's pool.
+
+`in` and item access cannot be awaited, so the methods are named after the
+dict methods they mirror: contains(), get(), keys(), values(), items(), plus
+get_many() for several keys in one query. AsyncDBDictReader only reads;
+AsyncDBDictProxy adds set() and delete() for tables without a sync write
+path of their own. Keyed reads share the identity_scope() map of the sync
+proxies.
+"""
+
+import json
+from typing import Any, Dict, Generic, List, Optional, Tuple, TypeVar
+
+from psycopg import sql
+from psycopg.rows import dict_row
+
+from app.backend.core.db import get_async_connection
+from app.backend.models.game import (
+    DraftRoom,
+    DraftRoomSummary,
+    DraftState,
+    GameSetupStatus,
+    GameState,
+)
+from app.backend.repositories.card_definitions import FETCH_QUERY
+from app.backend.repositories.dict_proxies import (
+    ABSENT,
+    UNKNOWN,
+    DEFAULT_ACTION_HISTORY_LIMIT,
+    DEFAULT_CHAT_MESSAGES_LIMIT,
+    DBDictProxy,
+    DraftRoomsProxy,
+    GameSetupsProxy,
+    GameStatesProxy,
+    in_identity_scope,
+    materialize_replay_rows,
+)
+from app.backend.repositories.draft_room_summaries import page_query, summary_from_row
+from app.backend.repositories.game_summaries import PAGE_QUERY, summary_entry
+
+T = TypeVar("T")
+
+
+class AsyncDBDictReader(Generic[T]):
+    """Async reads of the table of a sync DBDictProxy, using its codec."""
+
+    def __init__(self, proxy: DBDictProxy[T]):
+        self._proxy = proxy
+
+    async def contains(self, key: str) -> bool:
+        recalled = self._proxy._recall(key)
+        if recalled is not UNKNOWN:
+            return recalled is not ABSENT
+        if in_identity_scope():
+            return await self.get(key) is not None
+        query = sql.SQL("SELECT 1 FROM {} WHERE {} = %s").format(
+            self._proxy._sql_table(), self._proxy._sql_id_col()
+        )
+        async with get_async_connection() as conn:
+            cur = await conn.execute(query, (key,))
+            return await cur.fetchone() is not None
+
+    async def get(self, key: str, default: Optional[T] = None) -> Optional[T]:
+        recalled = self._proxy._recall(key)
+        if recalled is ABSENT:
+            return default
+        if recalled is not UNKNOWN:
+            return recalled
+        query = sql.SQL("SELECT {} FROM {} WHERE {} = %s").format(
+            self._proxy._sql_data_col(),
+            self._proxy._sql_table(),
+            self._proxy._sql_id_col(),
+        )
+        async with get_async_connection() as conn:
+            cur = await conn.execute(query, (key,))
+            row = await cur.fetchone()
+        if row is None:
+            self._proxy._remember(key, ABSENT)
+            return default
+        value = self._proxy._deserialize(row[0])
+        self._proxy._remember(key, value)
+        return value
+
+    async def get_many(self, keys: List[str]) -> Dict[str, T]:
+        """Values of the keys that exist, in one query."""
+        values, missing = self._recall_many(keys)
+        if missing:
+            query = sql.SQL("SELECT {}, {} FROM {} WHERE {} = ANY(%s)").format(
+                self._proxy._sql_id_col(),
+                self._proxy._sql_data_col(),
+                self._proxy._sql_table(),
+                self._proxy._sql_id_col(),
+            )
+            async with get_async_connection() as conn:
+                cur = await conn.execute(query, (missing,))
+                rows = await cur.fetchall()
+            for key, data in rows:
+                values[key] = self._proxy._identify(key, data)
+            self._forget_missing(missing, values)
+        return {key: values[key] for key in keys if key in values}
+
+    def _recall_many(self, keys: List[str]) -> Tuple[Dict[str, T], List[str]]:
+        """Values of keys found in the identity map, and the keys to fetch."""
+        values: Dict[str, T] = {}
+        missing = []
+        for key in dict.fromkeys(keys):
+            recalled = self._proxy._recall(key)
+            if recalled is UNKNOWN:
+                missing.append(key)
+            elif recalled is not ABSENT:
+                values[key] = recalled
+        return values, missing
+
+    def _forget_missing(self, keys: List[str], found: Dict[str, T]) -> None:
+        """Remember the fetched keys that have no row as ABSENT."""
+        for key in keys:
+            if key not in found:
+                self._proxy._remember(key, ABSENT)
+
+    async def keys(self) -> List[str]:
+        query = sql.SQL("SELECT {} FROM {}").format(
+            self._proxy._sql_id_col(), self._proxy._sql_table()
+        )
+        async with get_async_connection() as conn:
+            cur = await conn.execute(query)
+            return [row[0] for row in await cur.fetchall()]
+
+    async def items(self) -> List[Tuple[str, T]]:
+        query = sql.SQL("SELECT {}, {} FROM {}").format(
+            self._proxy._sql_id_col(),
+            self._proxy._sql_data_col(),
+            self._proxy._sql_table(),
+        )
+        async with get_async_connection() as conn:
+            cur = await conn.execute(query)
+            rows = await cur.fetchall()
+        return [(key, self._proxy._identify(key, data)) for key, data in rows]
+
+    async def values(self) -> List[T]:
+        return [value for _, value in await self.items()]
+
+
+class AsyncDBDictProxy(AsyncDBDictReader[T]):
+    """Async reads and writes of the table of a sync DBDictProxy."""
+
+    async def set(self, key: str, value: T) -> None:
+        data = self._proxy._serialize(value)
+        query = sql.SQL(
+            """
+            INSERT INTO {} ({}, {})
+            VALUES (%s, %s)
+            ON CONFLICT ({}) DO UPDATE SET
+                {} = EXCLUDED.{}
+        """
+        ).format(
+            self._proxy._sql_table(),
+            self._proxy._sql_id_col(),
+            self._proxy._sql_data_col(),
+            self._proxy._sql_id_col(),
+            self._proxy._sql_data_col(),
+            self._proxy._sql_data_col(),
+        )
+        async with get_async_connection() as conn:
+            await conn.execute(query, (key, json.dumps(data)))
+            await conn.commit()
+        self._proxy._remember(key, value)
+
+    async def delete(self, key: str) -> bool:
+        """Delete key; return False if it did not exist."""
+        query = sql.SQL("DELETE FROM {} WHERE {} = %s").format(
+            self._proxy._sql_table(), self._proxy._sql_id_col()
+        )
+        async with get_async_connection() as conn:
+            cur = await conn.execute(query, (key,))
+            await conn.commit()
+        self._proxy._remember(key, ABSENT)
+        return cur.rowcount > 0
+
+
+class AsyncGameStatesProxy(AsyncDBDictReader[GameState]):
+    """
+    Async reads of game states through the shared game_state_cache.
+
+    Saves stay on GameStatesProxy: they are compare-and-swap writes inside
+    the action's unit of work.
+    """
+
+    def __init__(self, proxy: Optional[GameStatesProxy] = None):
+        super().__init__(proxy if proxy is not None else GameStatesProxy())
+        self._cache = self._proxy._cache
+        self._definitions = self._proxy._definitions
+
+    async def _load(self, conn, state_text: str, version: int) -> GameState:
+        """GameStatesProxy._load, fetching unknown card definitions with conn."""
+        data = json.loads(state_text)
+        missing = self._definitions.missing(data)
+        fetched = None
+        if missing:
+            cur = await conn.execute(FETCH_QUERY, (missing,))
+            fetched = self._definitions.remember(await cur.fetchall())
+        static_size = self._definitions.resolve(data, fetched)
+        return self._proxy._build(data, version, len(state_text) + static_size)
+
+    async def contains(self, key: str) -> bool:
+        if self._cache.get(key) is not None:
+            return True
+        return await super().contains(key)
+
+    async def get(
+        self, key: str, default: Optional[GameState] = None
+    ) -> Optional[GameState]:
+        recalled = self._proxy._recall(key)
+        if recalled is ABSENT:
+            return default
+        if recalled is not UNKNOWN:
+            return recalled
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._proxy._remember(key, cached)
+            return cached
+        async with get_async_connection() as conn:
+            cur = await conn.execute(
+                "SELECT state_json::text, version FROM game_states WHERE id = %s",
+                (key,),
+            )
+            row = await cur.fetchone()
+            if row is not None:
+                game_state = await self._load(conn, row[0], row[1])
+        if row is None:
+            self._proxy._remember(key, ABSENT)
+            return default
+        self._proxy._remember(key, game_state)
+        return game_state
+
+    async def get_many(self, keys: List[str]) -> Dict[str, GameState]:
+        """Game states of the keys that exist, fetching those not cached."""
+        states, missing = self._recall_many(keys)
+        uncached = []
+        for game_id in missing:
+            cached = self._cache.get(game_id)
+            if cached is not None:
+                states[game_id] = cached
+                self._proxy._remember(game_id, cached)
+            else:
+                uncached.append(game_id)
+        if uncached:
+            async with get_async_connection() as conn:
+                cur = await conn.execute(
+                    """
+                    SELECT id, state_json::text, version FROM game_states
+                    WHERE id = ANY(%s)
+                    """,
+                    (uncached,),
+                )
+                for game_id, state_text, version in await cur.fetchall():
+                    states[game_id] = await self._load(conn, state_text, version)
+                    self._proxy._remember(game_id, states[game_id])
+            self._forget_missing(uncached, states)
+        return {key: states[key] for key in keys if key in states}
+
+    async def items(self) -> List[Tuple[str, GameState]]:
+        """List all games, fetching only the rows missing from the cache."""
+        async with get_async_connection() as conn:
+            cur = await conn.execute("SELECT id, version FROM game_states")
+            versions = await cur.fetchall()
+            states: Dict[str, GameState] = {}
+            missing = []
+            for game_id, version in versions:
+                recalled = self._proxy._recall(game_id)
+                if recalled is not UNKNOWN and recalled is not ABSENT:
+                    states[game_id] = recalled
+                    continue
+                cached = self._cache.get(game_id)
+                if cached is not None and cached.version >= version:
+                    states[game_id] = cached
+                else:
+                    missing.append(game_id)
+            if missing:
+                cur = await conn.execute(
+                    """
+                    SELECT id, state_json::text, version FROM game_states
+                    WHERE id = ANY(%s)
+                    """,
+                    (missing,),
+                )
+                for game_id, state_text, version in await cur.fetchall():
+                    states[game_id] = await self._load(conn, state_text, version)
+        for game_id, game_state in states.items():
+            self._proxy._remember(game_id, game_state)
+        return [
+            (game_id, states[game_id]) for game_id, _ in versions if game_id in states
+        ]
+
+
+class AsyncGameSetupsProxy(AsyncDBDictReader[GameSetupStatus]):
+    """
+    Async reads of game setups.
+
+    Saves stay on GameSetupsProxy, which also writes the game_summaries row.
+    """
+
+    def __init__(self, proxy: Optional[GameSetupsProxy] = None):
+        super().__init__(proxy if proxy is not None else GameSetupsProxy())
+
+
+class AsyncDraftRoomsProxy(AsyncDBDictReader[DraftRoom]):
+    """
+    Async reads of draft rooms and of their draft_room_summaries rows.
+
+    Saves stay on DraftRoomsProxy, which also writes the summary row.
+    """
+
+    def __init__(self, proxy: Optional[DraftRoomsProxy] = None):
+        super().__init__(proxy if proxy is not None else DraftRoomsProxy())
+
+    async def summaries(
+        self, state: Optional[DraftState], limit: int, offset: int = 0
+    ) -> List[DraftRoomSummary]:
+        """Lobby summaries, most recently updated first."""
+        query, params = page_query(state, limit, offset)
+        async with get_async_connection() as conn:
+            async with conn.cursor(row_factory=dict_row) as cur:
+                await cur.execute(query, params)
+                rows = await cur.fetchall()
+        return [summary_from_row(row) for row in rows]
+
+
+class AsyncReplaysProxy:
+    """Async reads of keyframe/delta replay timelines (see ReplaysProxy)."""
+
+    async def contains(self, game_id: str) -> bool:
+        async with get_async_connection() as conn:
+            cur = await conn.execute(
+                "SELECT 1 FROM game_replays WHERE game_id = %s LIMIT 1", (game_id,)
+            )
+            return await cur.fetchone() is not None
+
+    async def get(self, game_id: str) -> Optional[List[Dict[str, Any]]]:
+        """The whole timeline, or None if nothing was recorded."""
+        async with get_async_connection() as conn:
+            cur = await conn.execute(
+                """
+                SELECT action_json, state_json, delta_json, recorded_at
+                FROM game_replays
+                WHERE game_id = %s
+                ORDER BY step_index ASC
+            """,
+                (game_id,),
+            )
+            rows = await cur.fetchall()
+        return materialize_replay_rows(rows) if rows else None
+
+    async def count_steps(self, game_id: str) -> int:
+        async with get_async_connection() as conn:
+            cur = await conn.execute(
+                "SELECT COALESCE(MAX(step_index) + 1, 0) FROM game_replays "
+                "WHERE game_id = %s",
+                (game_id,),
+            )
+            return (await cur.fetchone())[0]
+
+
+class AsyncActionHistoryProxy:
+    """Async reads of action history entries (see ActionHistoryProxy)."""
+
+    async def get_recent(
+        self, game_id: str, limit: int = DEFAULT_ACTION_HISTORY_LIMIT
+    ) -> List[Dict[str, Any]]:
+        async with get_async_connection() as conn:
+            cur = await conn.execute(
+                """
+                SELECT action_json, recorded_at
+                FROM action_history
+                WHERE game_id = %s
+                ORDER BY recorded_at ASC
+                LIMIT %s
+                """,
+                (game_id, limit),
+            )
+            rows = await cur.fetchall()
+
+        entries: List[Dict[str, Any]] = []
+        for action_json, recorded_at in rows:
+            entry = action_json or {}
+            if "timestamp" not in entry and recorded_at:
+                entry["timestamp"] = recorded_at.timestamp()
+            entries.append(entry)
+        return entries
+
+
+class AsyncChatMessagesProxy:
+    """Async reads of chat messages (see ChatMessagesProxy)."""
+
+    async def get_recent(
+        self, game_id: str, limit: int = DEFAULT_CHAT_MESSAGES_LIMIT
+    ) -> List[Dict[str, Any]]:
+        async with get_async_connection() as conn:
+            cur = await conn.execute(
+                """
+                SELECT player_id, message, recorded_at
+                FROM chat_messages
+                WHERE game_id = %s
+                ORDER BY recorded_at ASC
+                LIMIT %s
+                """,
+                (game_id, limit),
+            )
+            rows = await cur.fetchall()
+        return [
+            {
+                "player": player_id,
+                "message": message,
+                "timestamp": recorded_at.timestamp() if recorded_at else None,
+            }
+            for player_id, message, recorded_at in rows
+        ]
+
+
+class AsyncGameSummariesProxy:
+    """Pages of the game_summaries projection, for /games/list."""
+
+    async def page(self, limit: int, offset: int = 0) -> List[Dict[str, Any]]:
+        """Lobby entries, most recently updated first."""
+        async with get_async_connection() as conn:
+            async with conn.cursor(row_factory=dict_row) as cur:
+                await cur.execute(PAGE_QUERY, (limit, offset))
+                rows = await cur.fetchall()
+        return [summary_entry(row) for row in rows]
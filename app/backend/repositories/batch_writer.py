@@ -0,0 +1,370 @@
+"""
+Per-process write-behind queue for replay steps, action history and chat.
+
+The engine hands rows to the writer once the transaction that produced them
+commits, so a game action only pays for its state write. A background task
+drains the queue every few milliseconds and writes everything queued in one
+unit of work: one multi-row INSERT per table and a single commit, with replay
+step indices assigned in memory (see ReplaysProxy.append_steps).
+
+The queue is bounded and never drops a row. Once rows queued plus rows
+being written reach max_pending, submit() writes the new row itself, in the
+caller's unit of work, together with the rows of the same game still queued
+so a game's replay steps stay in order. The producer pays for that write
+instead of the queue growing; the number of rows written that way and the
+time producers spent on them are the backpressure metric. Rows submitted
+before the queue filled up are still queued when their transaction commits,
+so the queue can briefly hold more than max_pending. stop() flushes
+whatever is left so a clean shutdown loses nothing.
+
+Rows that fail to write stay queued, in order, and are retried with a
+growing delay. After max_attempts failed flushes the batch is split until
+the failing rows are isolated; those are logged and moved to dead_letters
+and the rest are written.
+
+Readers that must see their own writes (the action history sent with every
+broadcast) read under read_lock() and add pending(): a flush never runs
+between the two, so a row is seen exactly once. Async readers cannot hold
+that lock across an await; read_with_pending() retries instead when a flush
+overlapped the read.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from app.backend.core.db import after_commit, on_rollback, unit_of_work
+from app.backend.repositories.dict_proxies import (
+    ActionHistoryProxy,
+    ChatMessagesProxy,
+    ReplaysProxy,
+)
+
+REPLAY_STEP = "replay"
+HISTORY_ENTRY = "history"
+CHAT_MESSAGE = "chat"
+
+# Reads retried by read_with_pending() before giving up
+CONSISTENT_READ_ATTEMPTS = 3
+
+# Delay before retrying a failed flush, doubled on each failure up to the max
+RETRY_BACKOFF_SECONDS = 0.1
+MAX_RETRY_BACKOFF_SECONDS = 2.0
+
+# Rows kept in dead_letters, oldest dropped first
+DEAD_LETTER_SIZE = 1000
+
+# (kind, game_id, payload, state_version, queued_at)
+QueuedRow = Tuple[str, str, Dict[str, Any], Optional[int], datetime]
+
+
+class BatchWriter:
+    """Bounded write-behind buffer drained in batches by an asyncio task."""
+
+    def __init__(
+        self,
+        replays: Optional[ReplaysProxy],
+        history: Optional[ActionHistoryProxy],
+        chat: Optional[ChatMessagesProxy],
+        max_pending: int = 5000,
+        flush_interval: float = 0.005,
+        max_attempts: int = 5,
+    ):
+        self.replays = replays
+        self.history = history
+        self.chat = chat
+        self.max_pending = max_pending
+        self.flush_interval = flush_interval
+        self.max_attempts = max_attempts
+        self._buffer: List[QueuedRow] = []
+        self._buffer_lock = threading.Lock()
+        # Rows taken by the running flush, counted against max_pending
+        self._in_flight = 0
+        # Failed flushes in a row, and when the drain task may retry
+        self._failed_attempts = 0
+        self._retry_at = 0.0
+        # Serializes flushes with each other and with consistent reads
+        self._flush_lock = threading.RLock()
+        # Odd while a flush is writing; bumped at its start and end
+        self._flush_generation = 0
+        self._task: Optional[asyncio.Task] = None
+        self.batches = 0
+        self.rows_written = 0
+        self.failures = 0
+        self.max_depth = 0
+        self.last_flush_ms = 0.0
+        self.backpressure_writes = 0
+        self.backpressure_wait_ms = 0.0
+        self.dead_letters: Deque[QueuedRow] = deque(maxlen=DEAD_LETTER_SIZE)
+        self.dead_lettered = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def accepts(self, kind: str) -> bool:
+        """True when rows of this kind should be queued rather than written inline."""
+        if not self.running:
+            return False
+        store = {
+            REPLAY_STEP: self.replays,
+            HISTORY_ENTRY: self.history,
+            CHAT_MESSAGE: self.chat,
+        }[kind]
+        return store is not None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+            print(f"[BatchWriter] Flushing every {self.flush_interval * 1000:.0f} ms")
+
+    async def stop(self) -> None:
+        """Stop the drain task and write everything still queued."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await asyncio.to_thread(self.flush)
+        with self._buffer_lock:
+            left = len(self._buffer)
+        if left:
+            print(f"[BatchWriter] {left} rows could not be written on shutdown")
+
+    def submit(
+        self,
+        kind: str,
+        game_id: str,
+        payload: Dict[str, Any],
+        state_version: Optional[int] = None,
+    ) -> None:
+        """
+        Queue a row once the current unit of work (if any) commits, or write
+        it now when the queue is full (see _write_through()).
+        """
+        row = (kind, game_id, payload, state_version, datetime.now(timezone.utc))
+        with self._buffer_lock:
+            full = len(self._buffer) + self._in_flight >= self.max_pending
+        if full:
+            self._write_through(row)
+        else:
+            after_commit(lambda: self._enqueue(row))
+
+    def _enqueue(self, row: QueuedRow) -> None:
+        with self._buffer_lock:
+            self._buffer.append(row)
+            self.max_depth = max(self.max_depth, len(self._buffer) + self._in_flight)
+
+    def _write_through(self, row: QueuedRow) -> None:
+        """
+        Write row and the queued rows of its game in the caller's unit of
+        work, waiting for a running flush first. The taken rows go back to
+        the head of the queue if the write or the caller's transaction fails.
+        """
+        game_id = row[1]
+        start = time.perf_counter()
+        with self._flush_lock:
+            self._flush_generation += 1
+            try:
+                with self._buffer_lock:
+                    taken = [queued for queued in self._buffer if queued[1] == game_id]
+                    self._buffer = [
+                        queued for queued in self._buffer if queued[1] != game_id
+                    ]
+                restored = False
+
+                def restore() -> None:
+                    nonlocal restored
+                    if taken and not restored:
+                        restored = True
+                        with self._buffer_lock:
+                            self._buffer[:0] = taken
+
+                on_rollback(restore)
+                try:
+                    self._write(taken + [row])
+                except BaseException:
+                    restore()
+                    raise
+            finally:
+                self._flush_generation += 1
+        self.backpressure_writes += len(taken) + 1
+        self.backpressure_wait_ms += (time.perf_counter() - start) * 1000
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            if self._buffer and time.monotonic() >= self._retry_at:
+                await asyncio.to_thread(self.flush)
+
+    def flush(self) -> int:
+        """Write all queued rows in one transaction; return how many were written."""
+        with self._flush_lock:
+            self._flush_generation += 1
+            try:
+                with self._buffer_lock:
+                    batch, self._buffer = self._buffer, []
+                    self._in_flight = len(batch)
+                if not batch:
+                    return 0
+
+                start = time.perf_counter()
+                if self._failed_attempts >= self.max_attempts:
+                    written = self._write_isolating(batch)
+                else:
+                    try:
+                        self._write(batch)
+                    except Exception as e:
+                        self._retry_later(batch, e)
+                        return 0
+                    written = len(batch)
+                self._failed_attempts = 0
+                self._retry_at = 0.0
+                self.batches += 1
+                self.rows_written += written
+                self.last_flush_ms = (time.perf_counter() - start) * 1000
+                return written
+            finally:
+                self._in_flight = 0
+                self._flush_generation += 1
+
+    def _write(self, batch: List[QueuedRow]) -> None:
+        """Write rows in one unit of work."""
+        steps, history, chat = [], [], []
+        for kind, game_id, payload, state_version, queued_at in batch:
+            if kind == REPLAY_STEP:
+                steps.append((game_id, payload, state_version))
+            elif kind == HISTORY_ENTRY:
+                history.append((game_id, payload, queued_at))
+            else:
+                chat.append((game_id, payload, queued_at))
+        with unit_of_work():
+            if steps:
+                self.replays.append_steps(steps)
+            if history:
+                self.history.append_many(history)
+            if chat:
+                self.chat.append_many(chat)
+
+    def _retry_later(self, batch: List[QueuedRow], error: Exception) -> None:
+        # Keep the rows, ahead of anything queued meanwhile
+        with self._buffer_lock:
+            self._buffer[:0] = batch
+        self.failures += 1
+        self._failed_attempts += 1
+        delay = min(
+            RETRY_BACKOFF_SECONDS * 2 ** (self._failed_attempts - 1),
+            MAX_RETRY_BACKOFF_SECONDS,
+        )
+        self._retry_at = time.monotonic() + delay
+        print(
+            f"[BatchWriter] Flush of {len(batch)} rows failed "
+            f"(attempt {self._failed_attempts}/{self.max_attempts}): {error}"
+        )
+
+    def _write_isolating(self, batch: List[QueuedRow]) -> int:
+        """
+        Write batch, halving it on failure until the failing rows are alone;
+        those go to dead_letters. Returns the number of rows written.
+        """
+        try:
+            self._write(batch)
+            return len(batch)
+        except Exception as e:
+            if len(batch) > 1:
+                middle = len(batch) // 2
+                written = self._write_isolating(batch[:middle])
+                return written + self._write_isolating(batch[middle:])
+            kind, game_id, payload, _, _ = batch[0]
+            self.failures += 1
+            self.dead_letters.append(batch[0])
+            self.dead_lettered += 1
+            print(
+                f"[BatchWriter] Giving up on a {kind} row of game {game_id} "
+                f"after {self.max_attempts} failed flushes: {e}; row: {payload}"
+            )
+            return 0
+
+    @contextmanager
+    def read_lock(self) -> Generator[None, None, None]:
+        """Hold off flushes while reading the table and pending() together."""
+        with self._flush_lock:
+            yield
+
+    async def read_with_pending(
+        self,
+        kind: str,
+        game_id: str,
+        read: Callable[[], Awaitable[List[Dict[str, Any]]]],
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Await read() (rows of the table) and add pending(), like read_lock().
+
+        The read is retried when a flush ran while it was in flight, since the
+        rows that flush moved may then be in both or in neither. Returns None
+        when flushes kept overlapping; callers fall back to a locked read.
+        """
+        for _ in range(CONSISTENT_READ_ATTEMPTS):
+            generation = self._flush_generation
+            if generation % 2 == 0:
+                rows = await read()
+                pending = self.pending(kind, game_id)
+                if self._flush_generation == generation:
+                    return rows + pending
+            await asyncio.sleep(self.flush_interval)
+        return None
+
+    def pending(self, kind: str, game_id: str) -> List[Dict[str, Any]]:
+        """Queued rows of one kind for game_id, oldest first."""
+        with self._buffer_lock:
+            return [
+                payload
+                for row_kind, row_game_id, payload, _, _ in self._buffer
+                if row_kind == kind and row_game_id == game_id
+            ]
+
+    def discard(self, kind: str, game_id: str) -> None:
+        """Drop queued rows of one kind for a game whose table rows are deleted."""
+        with self._flush_lock, self._buffer_lock:
+            self._buffer = [
+                row
+                for row in self._buffer
+                if not (row[0] == kind and row[1] == game_id)
+            ]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._buffer_lock:
+            depth = len(self._buffer)
+        return {
+            "running": self.running,
+            "queue_depth": depth,
+            "max_queue_depth": self.max_depth,
+            "max_pending": self.max_pending,
+            "batches": self.batches,
+            "rows_written": self.rows_written,
+            "avg_batch_size": (
+                round(self.rows_written / self.batches, 2) if self.batches else None
+            ),
+            "last_flush_ms": round(self.last_flush_ms, 3),
+            "failures": self.failures,
+            "backpressure_writes": self.backpressure_writes,
+            "backpressure_wait_ms": round(self.backpressure_wait_ms, 3),
+            "retrying": self._failed_attempts,
+            "dead_lettered": self.dead_lettered,
+        }
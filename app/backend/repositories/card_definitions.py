@@ -0,0 +1,258 @@
+"""
+Shared storage of static card data for game state rows.
+
+A game state used to persist every Card in full (oracle text, card_faces,
+image URLs, set names), libraries included, so state_json rows were large,
+TOASTed, and rewritten whole on every action. GameStatesProxy now stores
+each card as its instance state (fields at their default left out) plus a
+"definition" key. The static fields (those of CardDefinition) live once in
+the card_definitions table, which all games share.
+
+Definition keys are content digests: a definition row never changes, two
+cards with the same id but different static data (tokens, copies with
+overridden text) get different keys, and rows can be inserted with ON
+CONFLICT DO NOTHING from any worker. Each process keeps an LRU of the
+definitions it has read or written, so only unseen ones cost a query.
+
+Cards without a "definition" key (rows saved before this format) are left
+as they are and load unchanged.
+
+Resolved definitions are shared between the card dicts of every state that
+uses them, and their nested values (card_faces) end up shared between Card
+objects too. They must be treated as read-only.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from app.backend.core.config import settings
+from app.backend.models.game import Card, CardDefinition, Player
+
+DEFINITION_KEY = "definition"
+
+# Static Card fields, stored in card_definitions (CardDefinition.card_id is
+# Card.id, which stays on the instance as well)
+DEFINITION_FIELDS = tuple(
+    field for field in CardDefinition.model_fields if field != "card_id"
+)
+
+# Instance fields left out while at their default; validation restores them
+INSTANCE_DEFAULTS = {
+    name: field.default_factory() if field.default_factory else field.default
+    for name, field in Card.model_fields.items()
+    if name not in DEFINITION_FIELDS
+    and not field.is_required()
+    and field.default_factory in (None, list, dict)
+}
+
+PLAYER_CARD_ZONES = tuple(
+    name
+    for name, field in Player.model_fields.items()
+    if field.annotation == List[Card]
+)
+
+FETCH_QUERY = """
+    SELECT definition_key, definition_json FROM card_definitions
+    WHERE definition_key = ANY(%s)
+"""
+
+INSERT_QUERY = """
+    INSERT INTO card_definitions (definition_key, card_id, definition_json)
+    SELECT definition_key, card_id, definition_json
+    FROM jsonb_to_recordset(%s::jsonb)
+        AS d(definition_key TEXT, card_id TEXT, definition_json JSONB)
+    ON CONFLICT (definition_key) DO NOTHING
+"""
+
+
+def iter_card_dicts(data: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Every card dict of a serialized game state: player zones and stack."""
+    for player in data.get("players") or ():
+        for zone in PLAYER_CARD_ZONES:
+            yield from player.get(zone) or ()
+    yield from data.get("stack") or ()
+
+
+def definition_key(definition: Dict[str, Any]) -> Tuple[str, int]:
+    """Content digest of a definition (card id and static fields), and its size."""
+    canonical = json.dumps(definition, sort_keys=True, separators=(",", ":"))
+    digest = hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+    return digest, len(canonical)
+
+
+class CardDefinitionStore:
+    """
+    Per-process LRU of card definitions known to be in card_definitions.
+
+    Entries hold the static fields only (no card_id), which resolve()
+    merges back into the card dicts of a state, and their JSON size. Both
+    intern() and resolve() report the bytes they move, so GameStatesProxy
+    can keep sizing game_state_cache entries by the full document.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Dict[str, Any], int]]" = OrderedDict()
+        # Last key and size computed per card id, to skip hashing unchanged cards
+        self._recent_keys: Dict[str, Tuple[Dict[str, Any], str, int]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.inserts = 0
+
+    def intern(
+        self, data: Dict[str, Any]
+    ) -> Tuple[Dict[str, Dict[str, Any]], int]:
+        """
+        Replace the static fields of every card in data by a definition key
+        and drop its instance fields that hold their default, in place.
+
+        Returns the definitions this process has not seen stored yet, keyed
+        by definition key, as rows for write(), and the size of the static
+        data taken out. Pass the definitions to saved() once the transaction
+        that wrote them commits.
+        """
+        referenced: Dict[str, Dict[str, Any]] = {}
+        size = 0
+        for card in iter_card_dicts(data):
+            static = {field: card.pop(field, None) for field in DEFINITION_FIELDS}
+            card_id = card["id"]
+            recent = self._recent_keys.get(card_id)
+            if recent is not None and recent[0] == static:
+                _, key, static_size = recent
+            else:
+                key, static_size = definition_key({"card_id": card_id, **static})
+                self._recent_keys[card_id] = (static, key, static_size)
+            for field, default in INSTANCE_DEFAULTS.items():
+                if field in card and card[field] == default:
+                    del card[field]
+            card[DEFINITION_KEY] = key
+            size += static_size
+            if key not in referenced:
+                referenced[key] = {"card_id": card_id, **static}
+        if len(self._recent_keys) > self.max_entries:
+            self._recent_keys.clear()
+        with self._lock:
+            unsaved = {
+                key: definition
+                for key, definition in referenced.items()
+                if key not in self._entries
+            }
+        return unsaved, size
+
+    def write(self, cur, definitions: Dict[str, Dict[str, Any]]) -> int:
+        """
+        Insert definitions (from intern()) with cursor cur; return how many
+        rows were new (others were inserted by another worker first).
+        """
+        if not definitions:
+            return 0
+        rows = [
+            {
+                "definition_key": key,
+                "card_id": definition["card_id"],
+                "definition_json": definition,
+            }
+            for key, definition in definitions.items()
+        ]
+        cur.execute(INSERT_QUERY, (json.dumps(rows),))
+        return cur.rowcount
+
+    def saved(self, definitions: Dict[str, Dict[str, Any]], inserted: int = 0) -> None:
+        """Remember definitions whose insert (inserted new rows) has committed."""
+        self.remember(definitions.items())
+        with self._lock:
+            self.inserts += inserted
+
+    def missing(self, data: Dict[str, Any]) -> List[str]:
+        """Definition keys referenced by data that are not in memory."""
+        keys = {
+            card[DEFINITION_KEY]
+            for card in iter_card_dicts(data)
+            if DEFINITION_KEY in card
+        }
+        with self._lock:
+            missing = [key for key in keys if key not in self._entries]
+            self.hits += len(keys) - len(missing)
+            self.misses += len(missing)
+        return missing
+
+    def fetch(self, cur, keys: List[str]) -> Dict[str, Tuple[Dict[str, Any], int]]:
+        """Load the definitions of keys with cursor cur (see remember())."""
+        if not keys:
+            return {}
+        cur.execute(FETCH_QUERY, (keys,))
+        return self.remember(cur.fetchall())
+
+    def remember(
+        self, rows: Iterable[Tuple[str, Dict[str, Any]]]
+    ) -> Dict[str, Tuple[Dict[str, Any], int]]:
+        """
+        Add (definition_key, definition_json) rows to the LRU.
+
+        Returns the new entries for the caller to pass to resolve(): a busy
+        process may evict them before it gets there.
+        """
+        entries = {}
+        for key, definition in rows:
+            static = {field: definition.get(field) for field in DEFINITION_FIELDS}
+            entries[key] = (static, len(json.dumps(definition)))
+        with self._lock:
+            for key, entry in entries.items():
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entries
+
+    def resolve(
+        self,
+        data: Dict[str, Any],
+        fetched: Optional[Dict[str, Tuple[Dict[str, Any], int]]] = None,
+    ) -> int:
+        """
+        Merge the static fields back into every card of data, in place, and
+        return their size.
+
+        Keys must be in memory or in fetched: call missing() and fetch()
+        first.
+        """
+        size = 0
+        with self._lock:
+            for card in iter_card_dicts(data):
+                key = card.pop(DEFINITION_KEY, None)
+                if key is None:
+                    continue
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                elif fetched is not None and key in fetched:
+                    entry = fetched[key]
+                else:
+                    raise LookupError(f"Card definition {key} is not stored")
+                card.update(entry[0])
+                size += entry[1]
+        return size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._recent_keys.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+                "inserts": self.inserts,
+            }
+
+
+card_definition_store = CardDefinitionStore(settings.card_definition_cache_entries)
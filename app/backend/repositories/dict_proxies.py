@@ -7,17 +7,63 @@ This allows gradual migration from in-memory dicts to DB-backed storage.
 Performance optimizations:
 - Connection pooling via get_connection() context manager
 - Optimized cleanup with batched deletes
+- Writes join the active unit_of_work() transaction when one is open
+- Game states are served from a NOTIFY-invalidated per-process cache
+- Replay steps are stored as periodic keyframes plus JSON Patch deltas
+- Event-sourced replays store only the setup and the action stream
+- Multi-row inserts for the batch writer (repositories/batch_writer.py)
+- Narrow projection rows (game_summaries, draft_room_summaries) written in the
+  save's transaction
+- Game states store card instance state only; static card data is interned
+  in the shared card_definitions table
+- A request-scoped identity map (identity_scope()) so each key is fetched and
+  deserialized at most once per HTTP request or WebSocket message
 """
 
 import json
 import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterator, List, Optional, TypeVar, Generic
+from typing import (
+    Any,
+    Dict,
+    Generator,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 from psycopg import sql
 
-from app.backend.core.db import get_connection
+from app.backend.core.db import after_commit, commit, get_connection, on_rollback
 from app.backend.models.game import GameState, GameSetupStatus, DraftRoom, Deck
+from app.backend.repositories.card_definitions import (
+    CardDefinitionStore,
+    card_definition_store,
+)
+from app.backend.repositories.draft_room_summaries import (
+    delete_room_summary,
+    write_room_summary,
+)
+from app.backend.repositories.game_summaries import (
+    clear_setup_summary,
+    clear_state_summary,
+    write_setup_summary,
+    write_state_summary,
+)
+from app.backend.repositories.game_state_cache import (
+    GAME_STATE_CHANGED_CHANNEL,
+    GameStateCache,
+    game_state_cache,
+    snapshot,
+)
+from app.backend.utils.json_patch import apply_patch, make_patch
 
 T = TypeVar("T")
 
@@ -27,6 +73,65 @@ DEFAULT_CHAT_MESSAGES_LIMIT = 1000
 # Cleanup configuration - only run cleanup every N inserts
 CLEANUP_INTERVAL = 100
 
+# Replay steps between two full-state keyframes
+REPLAY_KEYFRAME_INTERVAL = 50
+# Games whose last replay state is kept in memory to diff the next step against
+REPLAY_DIFF_CACHE_SIZE = 256
+# Rows fetched per round-trip when streaming a replay through a server-side cursor
+REPLAY_STREAM_BATCH_SIZE = 100
+
+
+# Values read or written through a DBDictProxy in the current scope, keyed by
+# (table, key); ABSENT records a key known not to exist
+_identity_map: ContextVar[Optional[Dict[Tuple[str, str], Any]]] = ContextVar(
+    "manaforge_identity_map", default=None
+)
+ABSENT = object()
+UNKNOWN = object()
+
+
+@contextmanager
+def identity_scope() -> Generator[None, None, None]:
+    """
+    Fetch and deserialize each proxy key at most once inside the block.
+
+    Opened around every HTTP request and WebSocket message. Within it,
+    `key in proxy` followed by `proxy[key]` costs one query, and repeated
+    reads return the same object, as the in-memory dicts do. Saves and
+    deletes update the map; rolled back ones drop the key again. Nested
+    scopes share the outermost map.
+
+    Usage:
+        with identity_scope():
+            if game_id in games:
+                game_state = games[game_id]
+    """
+    if _identity_map.get() is not None:
+        yield
+        return
+    token = _identity_map.set({})
+    try:
+        yield
+    finally:
+        _identity_map.reset(token)
+
+
+def in_identity_scope() -> bool:
+    """Return True when the current context is inside an identity_scope()."""
+    return _identity_map.get() is not None
+
+
+class GameStateConflictError(RuntimeError):
+    """Raised when a game state save loses a compare-and-swap race."""
+
+    def __init__(self, game_id: str, expected_version: int):
+        super().__init__(
+            f"Game {game_id} was modified concurrently "
+            f"(expected version {expected_version})"
+        )
+        self.game_id = game_id
+        self.expected_version = expected_version
+
 
 class DBDictProxy(Generic[T]):
     """
@@ -38,6 +143,9 @@ class DBDictProxy(Generic[T]):
     - _data_column: The JSONB column storing the data
     - _serialize(value): Convert value to JSON-serializable dict
     - _deserialize(data): Convert JSON data back to the model
+
+    and may override _write_projections / _delete_projections to keep
+    derived tables in step with each save and delete.
     """
 
     _table_name: str
@@ -59,7 +167,43 @@ class DBDictProxy(Generic[T]):
     def _sql_data_col(self) -> sql.Identifier:
         return sql.Identifier(self._data_column)
 
+    def _recall(self, key: str) -> Any:
+        """Value of key in the identity map, ABSENT, or UNKNOWN."""
+        identities = _identity_map.get()
+        if identities is None:
+            return UNKNOWN
+        return identities.get((self._table_name, key), UNKNOWN)
+
+    def _remember(self, key: str, value: Any) -> None:
+        identities = _identity_map.get()
+        if identities is not None:
+            identities[(self._table_name, key)] = value
+
+    def _forget_identity(self, key: str) -> None:
+        identities = _identity_map.get()
+        if identities is not None:
+            identities.pop((self._table_name, key), None)
+
+    def _write_projections(self, cur, key: str, value: T) -> None:
+        """Update derived rows in the transaction of a save (none by default)."""
+
+    def _delete_projections(self, cur, key: str) -> None:
+        """Update derived rows in the transaction of a delete (none by default)."""
+
+    def _remember_write(self, key: str, value: Any) -> None:
+        """Remember a saved value (or ABSENT after a delete) until rollback."""
+        if not in_identity_scope():
+            return
+        self._remember(key, value)
+        on_rollback(lambda: self._forget_identity(key))
+
     def __contains__(self, key: str) -> bool:
+        recalled = self._recall(key)
+        if recalled is not UNKNOWN:
+            return recalled is not ABSENT
+        if in_identity_scope():
+            # The value is usually read next: fetch it now instead of twice
+            return self.get(key) is not None
         with get_connection() as conn:
             with conn.cursor() as cur:
                 query = sql.SQL("SELECT 1 FROM {} WHERE {} = %s").format(
@@ -69,6 +213,11 @@ class DBDictProxy(Generic[T]):
                 return cur.fetchone() is not None
 
     def __getitem__(self, key: str) -> T:
+        recalled = self._recall(key)
+        if recalled is ABSENT:
+            raise KeyError(key)
+        if recalled is not UNKNOWN:
+            return recalled
         with get_connection() as conn:
             with conn.cursor() as cur:
                 query = sql.SQL("SELECT {} FROM {} WHERE {} = %s").format(
@@ -76,9 +225,12 @@ class DBDictProxy(Generic[T]):
                 )
                 cur.execute(query, (key,))
                 row = cur.fetchone()
-                if row is None:
-                    raise KeyError(key)
-                return self._deserialize(row[0])
+        if row is None:
+            self._remember(key, ABSENT)
+            raise KeyError(key)
+        value = self._deserialize(row[0])
+        self._remember(key, value)
+        return value
 
     def __setitem__(self, key: str, value: T) -> None:
         data = self._serialize(value)
@@ -100,7 +252,9 @@ class DBDictProxy(Generic[T]):
                     self._sql_data_col(),
                 )
                 cur.execute(query, (key, json.dumps(data)))
-            conn.commit()
+                self._write_projections(cur, key, value)
+            commit(conn)
+        self._remember_write(key, value)
 
     def __delitem__(self, key: str) -> None:
         with get_connection() as conn:
@@ -110,8 +264,11 @@ class DBDictProxy(Generic[T]):
                 )
                 cur.execute(query, (key,))
                 if cur.rowcount == 0:
+                    self._remember(key, ABSENT)
                     raise KeyError(key)
-            conn.commit()
+                self._delete_projections(cur, key)
+            commit(conn)
+        self._remember_write(key, ABSENT)
 
     def get(self, key: str, default: Optional[T] = None) -> Optional[T]:
         try:
@@ -129,13 +286,7 @@ class DBDictProxy(Generic[T]):
                 return [row[0] for row in cur.fetchall()]
 
     def values(self) -> List[T]:
-        with get_connection() as conn:
-            with conn.cursor() as cur:
-                query = sql.SQL("SELECT {} FROM {}").format(
-                    self._sql_data_col(), self._sql_table()
-                )
-                cur.execute(query)
-                return [self._deserialize(row[0]) for row in cur.fetchall()]
+        return [value for _, value in self.items()]
 
     def items(self) -> List[tuple]:
         with get_connection() as conn:
@@ -144,7 +295,17 @@ class DBDictProxy(Generic[T]):
                     self._sql_id_col(), self._sql_data_col(), self._sql_table()
                 )
                 cur.execute(query)
-                return [(row[0], self._deserialize(row[1])) for row in cur.fetchall()]
+                rows = cur.fetchall()
+        return [(key, self._identify(key, data)) for key, data in rows]
+
+    def _identify(self, key: str, data: Dict[str, Any]) -> T:
+        """Deserialize a fetched row, or reuse the object already in scope."""
+        recalled = self._recall(key)
+        if recalled is not UNKNOWN and recalled is not ABSENT:
+            return recalled
+        value = self._deserialize(data)
+        self._remember(key, value)
+        return value
 
     def __iter__(self) -> Iterator[str]:
         return iter(self.keys())
@@ -171,21 +332,289 @@ class DBDictProxy(Generic[T]):
 class GameStatesProxy(DBDictProxy[GameState]):
     """
     Dict-like proxy for game states stored in PostgreSQL.
+
+    Reads go through the per-process game_state_cache; every save emits a
+    game_state_changed NOTIFY in the same transaction so other workers drop
+    their stale copies once it commits.
+
+    Cards are stored as instance state plus a card_definitions key; saves
+    insert the definitions this process has not stored yet, and loads
+    resolve them through the shared CardDefinitionStore.
     """
 
     _table_name = "game_states"
     _id_column = "id"
     _data_column = "state_json"
 
-    def _serialize(self, value: GameState) -> Dict[str, Any]:
+    def __init__(
+        self,
+        cache: Optional[GameStateCache] = None,
+        definitions: Optional[CardDefinitionStore] = None,
+    ):
+        self._cache = cache if cache is not None else game_state_cache
+        self._definitions = (
+            definitions if definitions is not None else card_definition_store
+        )
+
+    def _intern(
+        self, value: GameState
+    ) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]], int]:
+        """
+        The stored form of value, the card definitions it needs that may not
+        be stored yet, and the size of the static card data left out.
+        """
         data = value.model_dump(mode="json")
         data.pop("action_history", None)
         data.pop("chat_log", None)
-        return data
+        definitions, static_size = self._definitions.intern(data)
+        return data, definitions, static_size
+
+    def _serialize(self, value: GameState) -> Dict[str, Any]:
+        return self._intern(value)[0]
 
     def _deserialize(self, data: Dict[str, Any]) -> GameState:
+        self._resolve(data, None)
         return GameState.model_validate(data)
 
+    def _resolve(self, data: Dict[str, Any], cur) -> int:
+        """Put the card definitions back into data, fetching unknown ones."""
+        missing = self._definitions.missing(data)
+        if not missing:
+            return self._definitions.resolve(data)
+        if cur is not None:
+            fetched = self._definitions.fetch(cur, missing)
+        else:
+            with get_connection() as conn:
+                with conn.cursor() as definitions_cur:
+                    fetched = self._definitions.fetch(definitions_cur, missing)
+        return self._definitions.resolve(data, fetched)
+
+    def _load(self, state_text: str, version: int, cur=None) -> GameState:
+        """
+        Validate a state_json text row and cache the result. Unknown card
+        definitions are fetched with cur, or a pooled connection.
+        """
+        data = json.loads(state_text)
+        static_size = self._resolve(data, cur)
+        return self._build(data, version, len(state_text) + static_size)
+
+    def _build(self, data: Dict[str, Any], version: int, size: int) -> GameState:
+        """Validate resolved state data and cache it as size bytes."""
+        game_state = GameState.model_validate(data)
+        game_state.version = version
+        # Validation copied data into the new object: it can be cached as is
+        self._cache.put_data(game_state.id, version, data, size)
+        return game_state
+
+    def __contains__(self, key: str) -> bool:
+        if self._cache.get(key) is not None:
+            return True
+        return super().__contains__(key)
+
+    def __getitem__(self, key: str) -> GameState:
+        recalled = self._recall(key)
+        if recalled is ABSENT:
+            raise KeyError(key)
+        if recalled is not UNKNOWN:
+            return recalled
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._remember(key, cached)
+            return cached
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                # Fetch as text: validating JSON directly skips building the
+                # intermediate dict and gives the entry size for free
+                cur.execute(
+                    "SELECT state_json::text, version FROM game_states WHERE id = %s",
+                    (key,),
+                )
+                row = cur.fetchone()
+                if row is not None:
+                    game_state = self._load(row[0], row[1], cur)
+        if row is None:
+            self._remember(key, ABSENT)
+            raise KeyError(key)
+        self._remember(key, game_state)
+        return game_state
+
+    def items(self) -> List[tuple]:
+        """List all games, fetching only the rows missing from the cache."""
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT id, version FROM game_states")
+                versions = cur.fetchall()
+                states: Dict[str, GameState] = {}
+                missing = []
+                for game_id, version in versions:
+                    recalled = self._recall(game_id)
+                    if recalled is not UNKNOWN and recalled is not ABSENT:
+                        states[game_id] = recalled
+                        continue
+                    cached = self._cache.get(game_id)
+                    if cached is not None and cached.version >= version:
+                        states[game_id] = cached
+                    else:
+                        missing.append(game_id)
+                if missing:
+                    cur.execute(
+                        """
+                        SELECT id, state_json::text, version FROM game_states
+                        WHERE id = ANY(%s)
+                        """,
+                        (missing,),
+                    )
+                    for game_id, state_text, version in cur.fetchall():
+                        states[game_id] = self._load(state_text, version, cur)
+        for game_id, game_state in states.items():
+            self._remember(game_id, game_state)
+        return [
+            (game_id, states[game_id]) for game_id, _ in versions if game_id in states
+        ]
+
+    def values(self) -> List[GameState]:
+        return [game_state for _, game_state in self.items()]
+
+    def invalidate(self, key: str) -> None:
+        """Drop a cached state that was mutated without being saved."""
+        self._cache.invalidate(key)
+        self._forget_identity(key)
+
+    def _write_projections(self, cur, key: str, value: GameState) -> None:
+        write_state_summary(cur, value)
+
+    def _delete_projections(self, cur, key: str) -> None:
+        clear_state_summary(cur, key)
+
+    def _notify_changed(self, cur, game_id: str, version: Optional[int]) -> None:
+        # Delivered on commit and discarded on rollback
+        cur.execute(
+            "SELECT pg_notify(%s, %s)",
+            (
+                GAME_STATE_CHANGED_CHANNEL,
+                json.dumps({"game_id": game_id, "version": version}),
+            ),
+        )
+
+    def _cache_after_commit(
+        self,
+        value: GameState,
+        size: int,
+        definitions: Dict[str, Dict[str, Any]],
+        inserted: int,
+    ) -> None:
+        self._cache.invalidate(value.id)
+        if self._cache.active:
+            # Snapshot now: the caller keeps mutating value after the save
+            game_id, version, data = value.id, value.version, snapshot(value)
+            after_commit(lambda: self._cache.put_data(game_id, version, data, size))
+        if definitions:
+            # Only known to be stored once the save commits
+            after_commit(lambda: self._definitions.saved(definitions, inserted))
+        self._remember_write(value.id, value)
+
+    def __setitem__(self, key: str, value: GameState) -> None:
+        """Unconditional upsert that keeps the version column in sync."""
+        data, definitions, static_size = self._intern(value)
+        state_text = json.dumps(data)
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                inserted = self._definitions.write(cur, definitions)
+                cur.execute(
+                    """
+                    INSERT INTO game_states (id, state_json, version)
+                    VALUES (%s, %s, %s)
+                    ON CONFLICT (id) DO UPDATE SET
+                        state_json = EXCLUDED.state_json,
+                        version = EXCLUDED.version
+                    """,
+                    (key, state_text, value.version),
+                )
+                self._write_projections(cur, key, value)
+                self._notify_changed(cur, key, value.version)
+            commit(conn)
+        self._cache_after_commit(
+            value, len(state_text) + static_size, definitions, inserted
+        )
+
+    def __delitem__(self, key: str) -> None:
+        self._cache.forget(key)
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("DELETE FROM game_states WHERE id = %s", (key,))
+                if cur.rowcount == 0:
+                    self._remember(key, ABSENT)
+                    raise KeyError(key)
+                self._delete_projections(cur, key)
+                self._notify_changed(cur, key, None)
+            commit(conn)
+        self._remember_write(key, ABSENT)
+
+    def compare_and_set(
+        self, value: GameState, expected_version: Optional[int] = None
+    ) -> None:
+        """
+        Save a game state only if nobody else saved it since it was loaded.
+
+        The stored version must still equal value.version; on success both are
+        bumped by one. Raises GameStateConflictError (leaving value.version
+        untouched) when another writer got there first. The row lock taken by
+        the UPDATE is held until commit, so concurrent writers on the same game
+        serialize on that row only; other games are unaffected.
+
+        Write-behind callers that already advanced value.version in memory pass
+        the last persisted version as expected_version; value.version is then
+        stored as is and a deleted game counts as a conflict.
+        """
+        if expected_version is None:
+            expected = value.version
+            value.version = expected + 1
+        else:
+            expected = expected_version
+        data, definitions, static_size = self._intern(value)
+        state_text = json.dumps(data)
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                inserted = self._definitions.write(cur, definitions)
+                if expected_version is None:
+                    cur.execute(
+                        """
+                        INSERT INTO game_states (id, state_json, version)
+                        VALUES (%s, %s, %s)
+                        ON CONFLICT (id) DO UPDATE SET
+                            state_json = EXCLUDED.state_json,
+                            version = EXCLUDED.version
+                        WHERE game_states.version = %s
+                        RETURNING version
+                        """,
+                        (value.id, state_text, value.version, expected),
+                    )
+                else:
+                    # Never resurrect a game deleted while changes were pending
+                    cur.execute(
+                        """
+                        UPDATE game_states SET state_json = %s, version = %s
+                        WHERE id = %s AND version = %s
+                        RETURNING version
+                        """,
+                        (state_text, value.version, value.id, expected),
+                    )
+                row = cur.fetchone()
+                if row is not None:
+                    self._write_projections(cur, value.id, value)
+                    self._notify_changed(cur, value.id, value.version)
+            if row is None:
+                # Our copy is stale: make the next read go to the database
+                self._cache.invalidate(value.id)
+                self._forget_identity(value.id)
+                if expected_version is None:
+                    value.version = expected
+                raise GameStateConflictError(value.id, expected)
+            commit(conn)
+        self._cache_after_commit(
+            value, len(state_text) + static_size, definitions, inserted
+        )
+
 
 class GameSetupsProxy(DBDictProxy[GameSetupStatus]):
     """Dict-like proxy for game setups stored in PostgreSQL."""
@@ -200,6 +629,12 @@ class GameSetupsProxy(DBDictProxy[GameSetupStatus]):
     def _deserialize(self, data: Dict[str, Any]) -> GameSetupStatus:
         return GameSetupStatus.model_validate(data)
 
+    def _write_projections(self, cur, key: str, value: GameSetupStatus) -> None:
+        write_setup_summary(cur, value)
+
+    def _delete_projections(self, cur, key: str) -> None:
+        clear_setup_summary(cur, key)
+
 
 class DraftRoomsProxy(DBDictProxy[DraftRoom]):
     """Dict-like proxy for draft rooms stored in PostgreSQL."""
@@ -214,14 +649,65 @@ class DraftRoomsProxy(DBDictProxy[DraftRoom]):
     def _deserialize(self, data: Dict[str, Any]) -> DraftRoom:
         return DraftRoom.model_validate(data)
 
+    def _write_projections(self, cur, key: str, value: DraftRoom) -> None:
+        write_room_summary(cur, value)
+
+    def _delete_projections(self, cur, key: str) -> None:
+        delete_room_summary(cur, key)
+
+
+def iter_replay_rows(rows: Iterable[tuple]) -> Iterator[Dict[str, Any]]:
+    """
+    Yield replay steps from (action_json, state_json, delta_json, recorded_at)
+    rows ordered by step_index, starting at a keyframe.
+
+    Keyframe rows carry the full state; delta rows are applied to the state
+    of the previous step. Consecutive steps share unchanged sub-documents.
+    """
+    state: Optional[Dict[str, Any]] = None
+    for action_data, state_data, delta_data, recorded_at in rows:
+        if state_data is not None:
+            state = state_data
+        elif delta_data is not None:
+            state = apply_patch(state, delta_data)
+        step = {
+            "state": state,
+            "timestamp": recorded_at.timestamp() if recorded_at else None,
+        }
+        if action_data:
+            step["action"] = action_data
+        yield step
+
+
+def materialize_replay_rows(rows: List[tuple]) -> List[Dict[str, Any]]:
+    """Build a whole replay timeline from rows (see iter_replay_rows)."""
+    return list(iter_replay_rows(rows))
+
 
 class ReplaysProxy:
     """
     Dict-like proxy for replay timelines stored in PostgreSQL.
 
     Supports append operations and retrieval of full timelines.
+
+    Steps are stored as a keyframe (full state) every keyframe_interval steps
+    and as JSON Patch deltas against the previous step in between. The last
+    state written per game is kept in memory to diff against; a delta is only
+    stored when the latest row in the table is that same state version,
+    otherwise (another worker appended, or after a restart) the step falls
+    back to a keyframe.
     """
 
+    def __init__(self, keyframe_interval: int = REPLAY_KEYFRAME_INTERVAL):
+        self.keyframe_interval = keyframe_interval
+        # game_id -> (state_version, state, steps since keyframe)
+        self._last_steps: "OrderedDict[str, Tuple[int, Dict[str, Any], int]]" = (
+            OrderedDict()
+        )
+        # game_id -> next step_index, only maintained by append_steps
+        self._next_index: "OrderedDict[str, int]" = OrderedDict()
+        self._last_steps_lock = threading.Lock()
+
     def __contains__(self, game_id: str) -> bool:
         with get_connection() as conn:
             with conn.cursor() as cur:
@@ -235,7 +721,7 @@ class ReplaysProxy:
             with conn.cursor() as cur:
                 cur.execute(
                     """
-                    SELECT action_json, state_json, recorded_at
+                    SELECT action_json, state_json, delta_json, recorded_at
                     FROM game_replays
                     WHERE game_id = %s
                     ORDER BY step_index ASC
@@ -247,17 +733,7 @@ class ReplaysProxy:
                 if not rows:
                     raise KeyError(game_id)
 
-                timeline = []
-                for row in rows:
-                    step = {
-                        "state": row[1],
-                        "timestamp": row[2].timestamp() if row[2] else None,
-                    }
-                    if row[0]:
-                        step["action"] = row[0]
-                    timeline.append(step)
-
-                return timeline
+                return materialize_replay_rows(rows)
 
     def get(
         self, game_id: str, default: Optional[List] = None
@@ -267,45 +743,419 @@ class ReplaysProxy:
         except KeyError:
             return default if default is not None else []
 
-    def append_step(self, game_id: str, step_data: Dict[str, Any]) -> None:
-        """Append a replay step to the timeline."""
+    def count_steps(self, game_id: str) -> int:
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SELECT COALESCE(MAX(step_index) + 1, 0) FROM game_replays "
+                    "WHERE game_id = %s",
+                    (game_id,),
+                )
+                return cur.fetchone()[0]
+
+    def iter_steps(
+        self, game_id: str, from_step: int = 0, to_step: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield steps from_step (inclusive) to to_step (exclusive) one at a time.
+
+        Rows are read through a server-side cursor starting at the closest
+        keyframe at or before from_step, so only one state plus a batch of
+        rows is held in memory however long the replay is. The pooled
+        connection is held until the iterator is exhausted or closed.
+        """
+        with get_connection() as conn:
+            with conn.cursor(name="replay_steps") as cur:
+                cur.itersize = REPLAY_STREAM_BATCH_SIZE
+                cur.execute(
+                    """
+                    SELECT step_index, action_json, state_json, delta_json,
+                           recorded_at
+                    FROM game_replays
+                    WHERE game_id = %(game_id)s
+                      AND step_index >= COALESCE((
+                          SELECT MAX(step_index) FROM game_replays
+                          WHERE game_id = %(game_id)s
+                            AND step_index <= %(from_step)s
+                            AND state_json IS NOT NULL
+                      ), 0)
+                      AND (%(to_step)s::int IS NULL OR step_index < %(to_step)s)
+                    ORDER BY step_index ASC
+                """,
+                    {"game_id": game_id, "from_step": from_step, "to_step": to_step},
+                )
+                indices: List[int] = []
+
+                def rows() -> Iterator[tuple]:
+                    for step_index, *row in cur:
+                        indices.append(step_index)
+                        yield row
+
+                for step in iter_replay_rows(rows()):
+                    if indices.pop() >= from_step:
+                        yield step
+
+    def append_step(
+        self,
+        game_id: str,
+        step_data: Dict[str, Any],
+        state_version: Optional[int] = None,
+    ) -> None:
+        """
+        Append a replay step to the timeline.
+
+        Pass the game state version the step was recorded at to allow storing
+        it as a delta; steps without one are always keyframes.
+        """
         action_data = step_data.get("action")
         state_data = step_data.get("state", {})
 
+        base_version = None
+        delta_text = None
+        since_keyframe = 0
+        if state_version is not None:
+            with self._last_steps_lock:
+                last = self._last_steps.get(game_id)
+            if last is not None and last[2] + 1 < self.keyframe_interval:
+                base_version, base_state, since_keyframe = last
+                since_keyframe += 1
+                delta_text = json.dumps(make_patch(base_state, state_data))
+
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                # Next step index is computed server-side so the insert needs no
+                # extra round-trip and can be pipelined inside a unit of work.
+                # The delta is only used if the latest row is its base version.
+                cur.execute(
+                    """
+                    WITH latest AS (
+                        SELECT step_index, state_version FROM game_replays
+                        WHERE game_id = %(game_id)s
+                        ORDER BY step_index DESC
+                        LIMIT 1
+                    ), chained AS (
+                        SELECT COALESCE(
+                            (SELECT state_version FROM latest) = %(base)s, FALSE
+                        ) AS is_delta
+                    )
+                    INSERT INTO game_replays (
+                        game_id, step_index, action_json, state_json, delta_json,
+                        state_version
+                    )
+                    SELECT
+                        %(game_id)s,
+                        COALESCE((SELECT step_index FROM latest), -1) + 1,
+                        %(action)s,
+                        CASE WHEN chained.is_delta THEN NULL ELSE %(state)s::jsonb END,
+                        CASE WHEN chained.is_delta THEN %(delta)s::jsonb END,
+                        %(version)s
+                    FROM chained
+                """,
+                    {
+                        "game_id": game_id,
+                        "action": json.dumps(action_data) if action_data else None,
+                        "state": json.dumps(state_data),
+                        "delta": delta_text,
+                        "base": base_version,
+                        "version": state_version,
+                    },
+                )
+            commit(conn)
+
+        if state_version is None:
+            self._forget(game_id)
+            return
+        with self._last_steps_lock:
+            self._last_steps[game_id] = (state_version, state_data, since_keyframe)
+            self._last_steps.move_to_end(game_id)
+            while len(self._last_steps) > REPLAY_DIFF_CACHE_SIZE:
+                self._last_steps.popitem(last=False)
+        # A rolled back step must never become the base of a later delta
+        on_rollback(lambda: self._forget(game_id))
+
+    def append_steps(
+        self, steps: List[Tuple[str, Dict[str, Any], Optional[int]]]
+    ) -> None:
+        """
+        Append (game_id, step_data, state_version) steps in one statement.
+
+        Used by the batch writer. Step indices come from memory (seeded by one
+        MAX query the first time a game is seen) instead of a lookup per row.
+        The first row of each game is only written if the row before it is
+        the one this process wrote last; otherwise (another worker appended,
+        or the replay was deleted elsewhere) that game's rows are rewritten
+        after the real last step, starting with a keyframe.
+        """
+        if not steps:
+            return
+        by_game: Dict[str, List[Tuple[Dict[str, Any], Optional[int]]]] = {}
+        for game_id, step_data, state_version in steps:
+            by_game.setdefault(game_id, []).append((step_data, state_version))
+        # Rolled back rows must not be diffed against or counted
+        for game_id in by_game:
+            on_rollback(lambda game_id=game_id: self._forget(game_id))
+
+        try:
+            self._write_steps(by_game)
+        except BaseException:
+            for game_id in by_game:
+                self._forget(game_id)
+            raise
+
+    def _write_steps(
+        self, by_game: Dict[str, List[Tuple[Dict[str, Any], Optional[int]]]]
+    ) -> None:
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                self._load_next_indices(
+                    cur, [g for g in by_game if g not in self._next_index]
+                )
+                rows = []
+                for game_id, game_steps in by_game.items():
+                    rows.extend(self._encode_steps(game_id, game_steps))
+                inserted = self._insert_step_rows(cur, rows)
+
+                stale = {
+                    row["game_id"]
+                    for row in rows
+                    if (row["game_id"], row["step_index"]) not in inserted
+                }
+                if stale:
+                    for game_id in stale:
+                        self._forget(game_id)
+                        cur.execute(
+                            "DELETE FROM game_replays "
+                            "WHERE game_id = %s AND step_index = ANY(%s)",
+                            (
+                                game_id,
+                                [i for g, i in inserted if g == game_id],
+                            ),
+                        )
+                    self._load_next_indices(cur, list(stale))
+                    retry = []
+                    for game_id in stale:
+                        retry.extend(self._encode_steps(game_id, by_game[game_id]))
+                    if len(self._insert_step_rows(cur, retry)) != len(retry):
+                        raise RuntimeError(
+                            "Replay steps kept conflicting for games "
+                            + ", ".join(sorted(stale))
+                        )
+            commit(conn)
+
+    def _load_next_indices(self, cur, game_ids: List[str]) -> None:
+        if not game_ids:
+            return
+        cur.execute(
+            """
+            SELECT game_id, MAX(step_index) FROM game_replays
+            WHERE game_id = ANY(%s)
+            GROUP BY game_id
+            """,
+            (game_ids,),
+        )
+        found = dict(cur.fetchall())
+        with self._last_steps_lock:
+            for game_id in game_ids:
+                last_index = found.get(game_id)
+                if last_index is None:
+                    self._next_index[game_id] = 0
+                    self._last_steps.pop(game_id, None)
+                else:
+                    self._next_index[game_id] = last_index + 1
+
+    def _encode_steps(
+        self, game_id: str, game_steps: List[Tuple[Dict[str, Any], Optional[int]]]
+    ) -> List[Dict[str, Any]]:
+        """Assign indices and keyframe/delta encoding to one game's new steps."""
+        with self._last_steps_lock:
+            last = self._last_steps.get(game_id)
+            index = self._next_index[game_id]
+
+        rows = []
+        for position, (step_data, state_version) in enumerate(game_steps):
+            state_data = step_data.get("state", {})
+            row: Dict[str, Any] = {
+                "game_id": game_id,
+                "step_index": index,
+                "state_version": state_version,
+                "recorded_at": (
+                    _timestamp_to_datetime(step_data.get("timestamp"))
+                    or datetime.now(timezone.utc)
+                ).isoformat(),
+                # Later rows chain onto rows of this same statement
+                "check_previous": position == 0,
+            }
+            if step_data.get("action"):
+                row["action_json"] = step_data["action"]
+            since_keyframe = 0
+            if (
+                state_version is not None
+                and last is not None
+                and last[2] + 1 < self.keyframe_interval
+            ):
+                base_version, base_state, since_keyframe = last
+                since_keyframe += 1
+                row["delta_json"] = make_patch(base_state, state_data)
+                row["base_version"] = base_version
+            else:
+                row["state_json"] = state_data
+            rows.append(row)
+            last = (
+                (state_version, state_data, since_keyframe)
+                if state_version is not None
+                else None
+            )
+            index += 1
+
+        with self._last_steps_lock:
+            self._next_index[game_id] = index
+            self._next_index.move_to_end(game_id)
+            if last is None:
+                self._last_steps.pop(game_id, None)
+            else:
+                self._last_steps[game_id] = last
+                self._last_steps.move_to_end(game_id)
+            while len(self._last_steps) > REPLAY_DIFF_CACHE_SIZE:
+                self._last_steps.popitem(last=False)
+            while len(self._next_index) > REPLAY_DIFF_CACHE_SIZE:
+                self._next_index.popitem(last=False)
+        return rows
+
+    def _insert_step_rows(self, cur, rows: List[Dict[str, Any]]) -> set:
+        """Insert encoded rows; return the (game_id, step_index) pairs written."""
+        cur.execute(
+            """
+            INSERT INTO game_replays (
+                game_id, step_index, action_json, state_json, delta_json,
+                state_version, recorded_at
+            )
+            SELECT r.game_id, r.step_index, r.action_json, r.state_json,
+                   r.delta_json, r.state_version, r.recorded_at
+            FROM jsonb_to_recordset(%s::jsonb) AS r(
+                game_id TEXT, step_index INT, action_json JSONB, state_json JSONB,
+                delta_json JSONB, state_version BIGINT, base_version BIGINT,
+                recorded_at TIMESTAMPTZ, check_previous BOOLEAN
+            )
+            WHERE NOT r.check_previous
+               OR r.step_index = 0
+               OR EXISTS (
+                   SELECT 1 FROM game_replays previous
+                   WHERE previous.game_id = r.game_id
+                     AND previous.step_index = r.step_index - 1
+                     AND (r.delta_json IS NULL
+                          OR previous.state_version = r.base_version)
+               )
+            ON CONFLICT (game_id, step_index) DO NOTHING
+            RETURNING game_id, step_index
+            """,
+            (json.dumps(rows),),
+        )
+        return {(game_id, step_index) for game_id, step_index in cur.fetchall()}
+
+    def _forget(self, game_id: str) -> None:
+        with self._last_steps_lock:
+            self._last_steps.pop(game_id, None)
+            self._next_index.pop(game_id, None)
+
+    def __delitem__(self, game_id: str) -> None:
+        self._forget(game_id)
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("DELETE FROM game_replays WHERE game_id = %s", (game_id,))
+            commit(conn)
+
+    def keys(self) -> List[str]:
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT DISTINCT game_id FROM game_replays")
+                return [row[0] for row in cur.fetchall()]
+
+
+class ReplayEventsProxy:
+    """
+    Append-only event log backing event-sourced replays.
+
+    Each event is stored as {"type", "payload", "timestamp"}; see
+    services/replay_service.py for how a timeline is rebuilt from it.
+    """
+
+    def __contains__(self, game_id: str) -> bool:
         with get_connection() as conn:
             with conn.cursor() as cur:
-                # Get next step index
                 cur.execute(
-                    "SELECT COALESCE(MAX(step_index), -1) + 1 FROM game_replays WHERE game_id = %s",
+                    "SELECT 1 FROM game_replay_events WHERE game_id = %s LIMIT 1",
                     (game_id,),
                 )
-                row = cur.fetchone()
-                step_index = row[0] if row else 0
+                return cur.fetchone() is not None
+
+    def __getitem__(self, game_id: str) -> List[Dict[str, Any]]:
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    SELECT event_type, payload_json, recorded_at
+                    FROM game_replay_events
+                    WHERE game_id = %s
+                    ORDER BY seq ASC
+                """,
+                    (game_id,),
+                )
+                rows = cur.fetchall()
+        if not rows:
+            raise KeyError(game_id)
+        return [
+            {
+                "type": event_type,
+                "payload": payload,
+                "timestamp": recorded_at.timestamp() if recorded_at else None,
+            }
+            for event_type, payload, recorded_at in rows
+        ]
 
+    def append(
+        self,
+        game_id: str,
+        event_type: str,
+        payload: Dict[str, Any],
+        timestamp: Optional[float] = None,
+    ) -> None:
+        recorded_at = _timestamp_to_datetime(timestamp) or datetime.now(timezone.utc)
+        with get_connection() as conn:
+            with conn.cursor() as cur:
                 cur.execute(
                     """
-                    INSERT INTO game_replays (game_id, step_index, action_json, state_json)
-                    VALUES (%s, %s, %s, %s)
+                    INSERT INTO game_replay_events (
+                        game_id, seq, event_type, payload_json, recorded_at
+                    )
+                    SELECT %(game_id)s,
+                           COALESCE(MAX(seq), -1) + 1,
+                           %(event_type)s,
+                           %(payload)s,
+                           %(recorded_at)s
+                    FROM game_replay_events
+                    WHERE game_id = %(game_id)s
                 """,
-                    (
-                        game_id,
-                        step_index,
-                        json.dumps(action_data) if action_data else None,
-                        json.dumps(state_data),
-                    ),
+                    {
+                        "game_id": game_id,
+                        "event_type": event_type,
+                        "payload": json.dumps(payload),
+                        "recorded_at": recorded_at,
+                    },
                 )
-            conn.commit()
+            commit(conn)
 
     def __delitem__(self, game_id: str) -> None:
         with get_connection() as conn:
             with conn.cursor() as cur:
-                cur.execute("DELETE FROM game_replays WHERE game_id = %s", (game_id,))
-            conn.commit()
+                cur.execute(
+                    "DELETE FROM game_replay_events WHERE game_id = %s", (game_id,)
+                )
+            commit(conn)
 
     def keys(self) -> List[str]:
         with get_connection() as conn:
             with conn.cursor() as cur:
-                cur.execute("SELECT DISTINCT game_id FROM game_replays")
+                cur.execute("SELECT DISTINCT game_id FROM game_replay_events")
                 return [row[0] for row in cur.fetchall()]
 
 
@@ -377,7 +1227,68 @@ class ActionHistoryProxy:
                         """,
                         (game_id, game_id, max_entries - 1),
                     )
-            conn.commit()
+            commit(conn)
+
+    def append_many(
+        self,
+        entries: List[Tuple[str, Dict[str, Any], datetime]],
+        max_entries: int = DEFAULT_ACTION_HISTORY_LIMIT,
+    ) -> None:
+        """
+        Insert (game_id, entry, fallback recorded_at) rows in one statement.
+
+        Used by the batch writer; the fallback time is when the entry was
+        queued, so entries without a timestamp keep their order.
+        """
+        if not entries:
+            return
+        rows = [
+            {
+                "game_id": game_id,
+                "action_json": entry,
+                "recorded_at": (
+                    _timestamp_to_datetime(entry.get("timestamp")) or queued_at
+                ).isoformat(),
+            }
+            for game_id, entry, queued_at in entries
+        ]
+        cleanup = _count_inserts(
+            self._insert_counts,
+            self._insert_counts_lock,
+            [game_id for game_id, _, _ in entries],
+        )
+
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    INSERT INTO action_history (game_id, action_json, recorded_at)
+                    SELECT game_id, action_json, recorded_at
+                    FROM jsonb_to_recordset(%s::jsonb) AS r(
+                        game_id TEXT, action_json JSONB, recorded_at TIMESTAMPTZ
+                    )
+                    """,
+                    (json.dumps(rows),),
+                )
+                if max_entries is not None and max_entries > 0:
+                    for game_id in cleanup:
+                        cur.execute(
+                            """
+                            DELETE FROM action_history
+                            WHERE game_id = %s
+                            AND id < (
+                                SELECT COALESCE(
+                                    (SELECT id FROM action_history
+                                     WHERE game_id = %s
+                                     ORDER BY id DESC
+                                     LIMIT 1 OFFSET %s),
+                                    0
+                                )
+                            )
+                            """,
+                            (game_id, game_id, max_entries - 1),
+                        )
+            commit(conn)
 
     def get_recent(
         self, game_id: str, limit: int = DEFAULT_ACTION_HISTORY_LIMIT
@@ -407,7 +1318,7 @@ class ActionHistoryProxy:
         with get_connection() as conn:
             with conn.cursor() as cur:
                 cur.execute("DELETE FROM action_history WHERE game_id = %s", (game_id,))
-            conn.commit()
+            commit(conn)
         # Reset insert count
         with self._insert_counts_lock:
             self._insert_counts.pop(game_id, None)
@@ -480,7 +1391,65 @@ class ChatMessagesProxy:
                         """,
                         (game_id, game_id, max_entries - 1),
                     )
-            conn.commit()
+            commit(conn)
+
+    def append_many(
+        self,
+        entries: List[Tuple[str, Dict[str, Any], datetime]],
+        max_entries: int = DEFAULT_CHAT_MESSAGES_LIMIT,
+    ) -> None:
+        """Insert (game_id, entry, fallback recorded_at) rows in one statement."""
+        if not entries:
+            return
+        rows = [
+            {
+                "game_id": game_id,
+                "player_id": entry.get("player"),
+                "message": entry.get("message", ""),
+                "recorded_at": (
+                    _timestamp_to_datetime(entry.get("timestamp")) or queued_at
+                ).isoformat(),
+            }
+            for game_id, entry, queued_at in entries
+        ]
+        cleanup = _count_inserts(
+            self._insert_counts,
+            self._insert_counts_lock,
+            [game_id for game_id, _, _ in entries],
+        )
+
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    INSERT INTO chat_messages (game_id, player_id, message, recorded_at)
+                    SELECT game_id, player_id, message, recorded_at
+                    FROM jsonb_to_recordset(%s::jsonb) AS r(
+                        game_id TEXT, player_id TEXT, message TEXT,
+                        recorded_at TIMESTAMPTZ
+                    )
+                    """,
+                    (json.dumps(rows),),
+                )
+                if max_entries is not None and max_entries > 0:
+                    for game_id in cleanup:
+                        cur.execute(
+                            """
+                            DELETE FROM chat_messages
+                            WHERE game_id = %s
+                            AND id < (
+                                SELECT COALESCE(
+                                    (SELECT id FROM chat_messages
+                                     WHERE game_id = %s
+                                     ORDER BY id DESC
+                                     LIMIT 1 OFFSET %s),
+                                    0
+                                )
+                            )
+                            """,
+                            (game_id, game_id, max_entries - 1),
+                        )
+            commit(conn)
 
     def get_recent(
         self, game_id: str, limit: int = DEFAULT_CHAT_MESSAGES_LIMIT
@@ -512,7 +1481,7 @@ class ChatMessagesProxy:
         with get_connection() as conn:
             with conn.cursor() as cur:
                 cur.execute("DELETE FROM chat_messages WHERE game_id = %s", (game_id,))
-            conn.commit()
+            commit(conn)
         # Reset insert count
         with self._insert_counts_lock:
             self._insert_counts.pop(game_id, None)
@@ -564,13 +1533,13 @@ class PendingDecksProxy:
                     """,
                         (game_id, player_id, json.dumps(deck_json)),
                     )
-            conn.commit()
+            commit(conn)
 
     def __delitem__(self, game_id: str) -> None:
         with get_connection() as conn:
             with conn.cursor() as cur:
                 cur.execute("DELETE FROM pending_decks WHERE game_id = %s", (game_id,))
-            conn.commit()
+            commit(conn)
 
     def get(self, game_id: str, default: Optional[Dict] = None) -> Dict[str, Deck]:
         result = self[game_id]
@@ -601,7 +1570,7 @@ class PendingDecksProxy:
                 """,
                     (game_id, player_id, json.dumps(deck_json)),
                 )
-            conn.commit()
+            commit(conn)
 
 
 def _timestamp_to_datetime(value: Any) -> Optional[datetime]:
@@ -610,6 +1579,22 @@ def _timestamp_to_datetime(value: Any) -> Optional[datetime]:
     return None
 
 
+def _count_inserts(
+    counts: Dict[str, int], lock: threading.Lock, game_ids: List[str]
+) -> List[str]:
+    """Bump per-game insert counts; return games due for a cleanup pass."""
+    due = []
+    with lock:
+        for game_id in game_ids:
+            count = counts.get(game_id, 0) + 1
+            if count >= CLEANUP_INTERVAL:
+                count = 0
+                if game_id not in due:
+                    due.append(game_id)
+            counts[game_id] = count
+    return due
+
+
 class CubePoolsProxy:
     """
     Dict-like proxy for cube card pools.
@@ -647,7 +1632,7 @@ class CubePoolsProxy:
                 """,
                     (json.dumps(pool), room_id),
                 )
-            conn.commit()
+            commit(conn)
 
     def __delitem__(self, room_id: str) -> None:
         with get_connection() as conn:
@@ -660,7 +1645,7 @@ class CubePoolsProxy:
                 """,
                     (room_id,),
                 )
-            conn.commit()
+            commit(conn)
 
     def get(self, room_id: str, default: Optional[List] = None) -> Optional[List[str]]:
         try:
@@ -690,7 +1675,7 @@ class CubePoolCursorsProxy:
                     "UPDATE draft_rooms SET pool_cursor = %s WHERE id = %s",
                     (cursor, room_id),
                 )
-            conn.commit()
+            commit(conn)
 
     def get(self, room_id: str, default: int = 0) -> int:
         try:
@@ -720,7 +1705,7 @@ class CubeCardCacheProxy:
                     "UPDATE draft_rooms SET cube_cache = %s WHERE id = %s",
                     (json.dumps(cache), room_id),
                 )
-            conn.commit()
+            commit(conn)
 
     def get(
         self, room_id: str, default: Optional[Dict] = None
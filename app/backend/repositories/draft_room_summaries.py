@@ -0,0 +1,120 @@
+"""
+Narrow per-room rows behind the draft lobby's GET /draft/rooms.
+
+Listing rooms used to deserialize and ship every room in full, packs and
+drafted pools included. DraftRoomsProxy now also upserts one
+draft_room_summaries row per room in the transaction of the save (see
+DBDictProxy._write_projections), and the list reads pages of that table,
+newest first, optionally for one draft state. Full rooms are only served
+by GET /draft/rooms/{room_id}.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.backend.models.game import DraftRoom, DraftRoomSummary, DraftState
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+SUMMARY_COLUMNS = (
+    "id, name, set_code, set_name, draft_type, state, max_players, "
+    "player_count, human_player_count, created_at, updated_at"
+)
+
+PAGE_QUERY = f"""
+    SELECT {SUMMARY_COLUMNS}
+    FROM draft_room_summaries
+    ORDER BY updated_at DESC, id
+    LIMIT %s OFFSET %s
+"""
+
+STATE_PAGE_QUERY = f"""
+    SELECT {SUMMARY_COLUMNS}
+    FROM draft_room_summaries
+    WHERE state = %s
+    ORDER BY updated_at DESC, id
+    LIMIT %s OFFSET %s
+"""
+
+
+def summarize_room(room: DraftRoom) -> DraftRoomSummary:
+    """The summary of room; timestamps are left to the summary table."""
+    return DraftRoomSummary(
+        id=room.id,
+        name=room.name,
+        set_code=room.set_code,
+        set_name=room.set_name,
+        draft_type=room.draft_type,
+        state=room.state,
+        max_players=room.max_players,
+        player_count=len(room.players),
+        human_player_count=sum(1 for player in room.players if not player.is_bot),
+    )
+
+
+def write_room_summary(cur, room: DraftRoom) -> None:
+    """Upsert the summary row of room with cursor cur."""
+    summary = summarize_room(room)
+    cur.execute(
+        """
+        INSERT INTO draft_room_summaries (
+            id, name, set_code, set_name, draft_type, state, max_players,
+            player_count, human_player_count
+        )
+        VALUES (
+            %(id)s, %(name)s, %(set_code)s, %(set_name)s, %(draft_type)s,
+            %(state)s, %(max_players)s, %(player_count)s, %(human_player_count)s
+        )
+        ON CONFLICT (id) DO UPDATE SET
+            name = EXCLUDED.name,
+            set_code = EXCLUDED.set_code,
+            set_name = EXCLUDED.set_name,
+            draft_type = EXCLUDED.draft_type,
+            state = EXCLUDED.state,
+            max_players = EXCLUDED.max_players,
+            player_count = EXCLUDED.player_count,
+            human_player_count = EXCLUDED.human_player_count,
+            updated_at = NOW()
+        """,
+        summary.model_dump(mode="json", exclude={"created_at", "updated_at"}),
+    )
+
+
+def delete_room_summary(cur, room_id: str) -> None:
+    """Delete the summary row of room_id with cursor cur."""
+    cur.execute("DELETE FROM draft_room_summaries WHERE id = %s", (room_id,))
+
+
+def page_query(
+    state: Optional[DraftState], limit: int, offset: int
+) -> Tuple[str, Tuple[Any, ...]]:
+    """The query and parameters of one page of summaries."""
+    if state is None:
+        return PAGE_QUERY, (limit, offset)
+    return STATE_PAGE_QUERY, (DraftState(state).value, limit, offset)
+
+
+def summary_from_row(row: Dict[str, Any]) -> DraftRoomSummary:
+    """Build a summary from a draft_room_summaries row (SUMMARY_COLUMNS)."""
+    return DraftRoomSummary.model_validate(row)
+
+
+def summarize_rooms(
+    rooms: Iterable[DraftRoom],
+    state: Optional[DraftState] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    offset: int = 0,
+) -> List[DraftRoomSummary]:
+    """
+    A page of summaries built from in-memory rooms.
+
+    Dicts keep insertion order, so the newest rooms come first; there are
+    no timestamps to sort on.
+    """
+    summaries = [
+        summarize_room(room)
+        for room in rooms
+        if state is None or room.state == state
+    ]
+    summaries.reverse()
+    return summaries[offset : offset + limit]
@@ -8,8 +8,9 @@ Uses connection pooling for improved performance.
 import json
 from typing import Any, Dict, List, Optional
 
-from app.backend.core.db import get_connection
+from app.backend.core.db import commit, get_connection
 from app.backend.models.game import GameState, GameSetupStatus
+from app.backend.repositories.dict_proxies import materialize_replay_rows
 
 
 class GameStateRepository:
@@ -47,7 +48,7 @@ class GameStateRepository:
                 """,
                     (game_state.id, "active", json.dumps(state_json)),
                 )
-            conn.commit()
+            commit(conn)
 
     def delete(self, game_id: str) -> bool:
         """Delete a game state. Returns True if a row was deleted."""
@@ -55,7 +56,7 @@ class GameStateRepository:
             with conn.cursor() as cur:
                 cur.execute("DELETE FROM game_states WHERE id = %s", (game_id,))
                 deleted = cur.rowcount > 0
-            conn.commit()
+            commit(conn)
         return deleted
 
     def exists(self, game_id: str) -> bool:
@@ -110,7 +111,7 @@ class GameSetupRepository:
                 """,
                     (setup.game_id, json.dumps(setup_json)),
                 )
-            conn.commit()
+            commit(conn)
 
     def delete(self, game_id: str) -> bool:
         """Delete a game setup."""
@@ -118,7 +119,7 @@ class GameSetupRepository:
             with conn.cursor() as cur:
                 cur.execute("DELETE FROM game_setups WHERE id = %s", (game_id,))
                 deleted = cur.rowcount > 0
-            conn.commit()
+            commit(conn)
         return deleted
 
 
@@ -150,7 +151,7 @@ class ReplayRepository:
                         json.dumps(state_data),
                     ),
                 )
-            conn.commit()
+            commit(conn)
 
     def get_timeline(self, game_id: str) -> List[Dict[str, Any]]:
         """Get the full replay timeline for a game."""
@@ -158,7 +159,7 @@ class ReplayRepository:
             with conn.cursor() as cur:
                 cur.execute(
                     """
-                    SELECT action_json, state_json, recorded_at
+                    SELECT action_json, state_json, delta_json, recorded_at
                     FROM game_replays
                     WHERE game_id = %s
                     ORDER BY step_index ASC
@@ -166,17 +167,7 @@ class ReplayRepository:
                     (game_id,),
                 )
 
-                timeline = []
-                for row in cur.fetchall():
-                    step = {
-                        "state": row[1],
-                        "timestamp": row[2].timestamp() if row[2] else None,
-                    }
-                    if row[0]:
-                        step["action"] = row[0]
-                    timeline.append(step)
-
-                return timeline
+                return materialize_replay_rows(cur.fetchall())
 
     def get_step_count(self, game_id: str) -> int:
         """Get the number of replay steps for a game."""
@@ -205,7 +196,7 @@ class ActionHistoryRepository:
                 """,
                     (game_id, json.dumps(action_data)),
                 )
-            conn.commit()
+            commit(conn)
 
     def get_recent(self, game_id: str, limit: int = 100) -> List[Dict[str, Any]]:
         """Get recent actions for a game."""
@@ -243,7 +234,7 @@ class ActionHistoryRepository:
                 """,
                     (game_id, self.MAX_HISTORY - 1, game_id),
                 )
-            conn.commit()
+            commit(conn)
 
 
 class ChatRepository:
@@ -262,7 +253,7 @@ class ChatRepository:
                 """,
                     (game_id, player_id, message),
                 )
-            conn.commit()
+            commit(conn)
 
     def get_recent(self, game_id: str, limit: int = 100) -> List[Dict[str, Any]]:
         """Get recent chat messages for a game."""
@@ -0,0 +1,237 @@
+"""
+Per-process read-through cache of game states.
+
+GameStatesProxy consults this cache before running a SELECT, parsing the
+row and resolving its card definitions. Entries are keyed by (game_id,
+version) and evicted in LRU order once their estimated size exceeds the
+byte cap.
+
+Coherence across workers relies on the game_state_changed NOTIFY that
+GameStatesProxy emits inside every save transaction: a daemon thread LISTENs
+on that channel and drops entries older than the announced version. While
+the listener is not connected the cache is bypassed entirely, and it is
+cleared on every (re)connect because notifications may have been missed.
+
+Entries hold a snapshot of the state's data, not the GameState object, and
+every get() validates a new GameState from it. Callers in other threads or
+coroutines therefore never share an object: a state mutated and saved by
+one writer does not change the version another writer compares against
+(GameStatesProxy.compare_and_set), nor show a half-applied action to
+readers. Values validated as Any (card_faces) stay shared and, like card
+definitions, must be treated as read-only.
+"""
+
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+import psycopg
+
+from app.backend.core.config import settings
+from app.backend.core.db import get_database_url
+from app.backend.models.game import GameState
+
+GAME_STATE_CHANGED_CHANNEL = "game_state_changed"
+
+# How long one notifies() wait lasts before checking for shutdown
+LISTEN_POLL_SECONDS = 5.0
+RECONNECT_DELAY_SECONDS = 1.0
+
+
+class GameStateCache:
+    """LRU of game state snapshots with a byte-size cap and NOTIFY invalidation."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        # (game_id, version) -> (state data, estimated size)
+        self._entries: "OrderedDict[Tuple[str, int], Tuple[Dict[str, Any], int]]" = (
+            OrderedDict()
+        )
+        # Latest cached version per game, and the newest version announced
+        self._versions: Dict[str, int] = {}
+        self._known_versions: Dict[str, int] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._listening = False
+        self._listener: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    @property
+    def active(self) -> bool:
+        """True when lookups may be served from memory."""
+        if not self.enabled:
+            return False
+        self.ensure_listener()
+        return self._listening
+
+    def get(self, game_id: str) -> Optional[GameState]:
+        """
+        Return a new GameState built from the cached data of game_id,
+        counting a hit or a miss.
+        """
+        if not self.active:
+            return None
+        with self._lock:
+            version = self._versions.get(game_id)
+            if version is None:
+                self.misses += 1
+                return None
+            key = (game_id, version)
+            self._entries.move_to_end(key)
+            self.hits += 1
+            data = self._entries[key][0]
+        game_state = GameState.model_validate(data)
+        game_state.version = version
+        return game_state
+
+    def put(self, game_state: GameState, size: int) -> None:
+        """Cache a snapshot of game_state (see put_data())."""
+        if self.active:
+            self.put_data(game_state.id, game_state.version, snapshot(game_state), size)
+
+    def put_data(
+        self, game_id: str, version: int, data: Dict[str, Any], size: int
+    ) -> None:
+        """
+        Cache the data of a state at version, unless a newer version was
+        already announced. data must no longer be mutated by the caller.
+        """
+        if not self.active or size > self.max_bytes:
+            return
+        with self._lock:
+            if version < self._known_versions.get(game_id, -1):
+                return
+            self._discard(game_id)
+            self._entries[(game_id, version)] = (data, size)
+            self._versions[game_id] = version
+            self._bytes += size
+            while self._bytes > self.max_bytes and self._entries:
+                (evicted_id, _), (_, evicted_size) = self._entries.popitem(last=False)
+                self._versions.pop(evicted_id, None)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def invalidate(self, game_id: str, version: Optional[int] = None) -> None:
+        """
+        Drop game_id from the cache.
+
+        With a version (from a NOTIFY), entries at that version or newer are
+        kept and older versions can no longer be cached.
+        """
+        with self._lock:
+            if version is not None:
+                known = self._known_versions.get(game_id, -1)
+                self._known_versions[game_id] = max(known, version)
+                if self._versions.get(game_id, -1) >= version:
+                    return
+            if self._discard(game_id):
+                self.invalidations += 1
+
+    def forget(self, game_id: str) -> None:
+        """Drop all knowledge of a deleted game."""
+        with self._lock:
+            if self._discard(game_id):
+                self.invalidations += 1
+            self._known_versions.pop(game_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+            self._known_versions.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "listening": self._listening,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+    def _discard(self, game_id: str) -> bool:
+        version = self._versions.pop(game_id, None)
+        if version is None:
+            return False
+        _, size = self._entries.pop((game_id, version))
+        self._bytes -= size
+        return True
+
+    # ------------------------------------------------------------------
+    # NOTIFY listener
+    # ------------------------------------------------------------------
+
+    def ensure_listener(self) -> None:
+        """Start the invalidation listener thread on first use."""
+        if self._listener is not None and self._listener.is_alive():
+            return
+        with self._lock:
+            if self._listener is not None and self._listener.is_alive():
+                return
+            self._stop.clear()
+            self._listener = threading.Thread(
+                target=self._listen_loop, name="game-state-cache-listener", daemon=True
+            )
+            self._listener.start()
+
+    def stop_listener(self) -> None:
+        self._stop.set()
+        self._set_listening(False)
+
+    def _set_listening(self, listening: bool) -> None:
+        self.clear()
+        self._listening = listening
+
+    def _listen_loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                with psycopg.connect(get_database_url(), autocommit=True) as conn:
+                    conn.execute(f"LISTEN {GAME_STATE_CHANGED_CHANNEL}")
+                    self._set_listening(True)
+                    while not self._stop.is_set():
+                        for notify in conn.notifies(timeout=LISTEN_POLL_SECONDS):
+                            self._handle_notify(notify.payload)
+            except Exception as e:
+                print(f"[GameStateCache] Listener disconnected: {e}")
+            finally:
+                self._set_listening(False)
+            self._stop.wait(RECONNECT_DELAY_SECONDS)
+
+    def _handle_notify(self, payload: str) -> None:
+        try:
+            message = json.loads(payload)
+        except json.JSONDecodeError:
+            return
+        game_id = message.get("game_id")
+        if not game_id:
+            return
+        version = message.get("version")
+        if version is None:
+            self.forget(game_id)
+        else:
+            self.invalidate(game_id, version)
+
+
+def snapshot(game_state: GameState) -> Dict[str, Any]:
+    """Data of game_state for put_data(), detached from the object."""
+    return game_state.model_dump(exclude={"action_history", "chat_log"})
+
+
+game_state_cache = GameStateCache(settings.game_state_cache_mb * 1024 * 1024)
@@ -0,0 +1,270 @@
+"""
+Narrow per-game rows behind the lobby's /games/list.
+
+Listing games used to deserialize every setup and every full game state
+(libraries included) on each lobby poll. GameSetupsProxy and
+GameStatesProxy now also upsert one game_summaries row per game, in the
+transaction of the save itself (see DBDictProxy._write_projections), and the
+list only reads that table, newest first through idx_game_summaries_updated_at.
+
+A row has a setup half and a state half; either is NULL while the game has
+no setup (or no started state) and the row is deleted once both are gone.
+summary_entry() merges the two halves into the entry the lobby expects, the
+same way the list was built from the full documents.
+"""
+
+import json
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from app.backend.models.game import GameSetupStatus, GameState
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+SUMMARY_COLUMNS = (
+    "game_id, setup_status, ready, game_format, phase_mode, max_players, "
+    "submitted_count, validated_count, seat_claimed_count, player_status, "
+    "setup_created_at, setup_updated_at, players, active_player, turn, "
+    "state_created_at, state_updated_at"
+)
+
+PAGE_QUERY = f"""
+    SELECT {SUMMARY_COLUMNS}
+    FROM game_summaries
+    ORDER BY updated_at DESC, game_id
+    LIMIT %s OFFSET %s
+"""
+
+
+def _enum_value(value: Any) -> str:
+    return getattr(value, "value", str(value))
+
+
+def setup_summary_columns(setup: GameSetupStatus) -> Dict[str, Any]:
+    """The setup half of a game's summary row."""
+    player_status = {
+        player_id: status.model_dump(mode="json")
+        for player_id, status in setup.player_status.items()
+    }
+    return {
+        "setup_status": setup.status,
+        "ready": setup.ready,
+        "game_format": _enum_value(setup.game_format),
+        "phase_mode": _enum_value(setup.phase_mode),
+        "max_players": setup.max_players,
+        "submitted_count": sum(
+            1 for status in player_status.values() if status.get("submitted")
+        ),
+        "validated_count": sum(
+            1 for status in player_status.values() if status.get("validated")
+        ),
+        "seat_claimed_count": sum(
+            1 for status in player_status.values() if status.get("seat_claimed")
+        ),
+        "player_status": player_status,
+        "setup_created_at": setup.created_at,
+        "setup_updated_at": setup.updated_at,
+    }
+
+
+def state_summary_columns(game_state: GameState) -> Dict[str, Any]:
+    """The state half of a game's summary row."""
+    return {
+        "state_game_format": _enum_value(game_state.game_format),
+        "state_phase_mode": _enum_value(game_state.phase_mode),
+        "players": [player.id for player in game_state.players],
+        "active_player": game_state.active_player,
+        "turn": game_state.turn,
+        "state_created_at": game_state.created_at,
+        "state_updated_at": game_state.updated_at,
+    }
+
+
+def write_setup_summary(cur, setup: GameSetupStatus) -> None:
+    """Upsert the setup half of setup.game_id's summary with cursor cur."""
+    columns = setup_summary_columns(setup)
+    columns["player_status"] = json.dumps(columns["player_status"])
+    cur.execute(
+        """
+        INSERT INTO game_summaries (
+            game_id, setup_status, ready, game_format, phase_mode, max_players,
+            submitted_count, validated_count, seat_claimed_count, player_status,
+            setup_created_at, setup_updated_at, updated_at
+        )
+        VALUES (
+            %(game_id)s, %(setup_status)s, %(ready)s, %(game_format)s,
+            %(phase_mode)s, %(max_players)s, %(submitted_count)s,
+            %(validated_count)s, %(seat_claimed_count)s, %(player_status)s,
+            %(setup_created_at)s, %(setup_updated_at)s, %(setup_updated_at)s
+        )
+        ON CONFLICT (game_id) DO UPDATE SET
+            setup_status = EXCLUDED.setup_status,
+            ready = EXCLUDED.ready,
+            game_format = EXCLUDED.game_format,
+            phase_mode = EXCLUDED.phase_mode,
+            max_players = EXCLUDED.max_players,
+            submitted_count = EXCLUDED.submitted_count,
+            validated_count = EXCLUDED.validated_count,
+            seat_claimed_count = EXCLUDED.seat_claimed_count,
+            player_status = EXCLUDED.player_status,
+            setup_created_at = EXCLUDED.setup_created_at,
+            setup_updated_at = EXCLUDED.setup_updated_at,
+            updated_at = GREATEST(game_summaries.updated_at, EXCLUDED.updated_at)
+        """,
+        {"game_id": setup.game_id, **columns},
+    )
+
+
+def write_state_summary(cur, game_state: GameState) -> None:
+    """Upsert the state half of game_state.id's summary with cursor cur."""
+    columns = state_summary_columns(game_state)
+    columns["players"] = json.dumps(columns["players"])
+    # Format and phase mode come from the setup when there is one
+    cur.execute(
+        """
+        INSERT INTO game_summaries (
+            game_id, game_format, phase_mode, players, active_player, turn,
+            state_created_at, state_updated_at, updated_at
+        )
+        VALUES (
+            %(game_id)s, %(state_game_format)s, %(state_phase_mode)s,
+            %(players)s, %(active_player)s, %(turn)s, %(state_created_at)s,
+            %(state_updated_at)s, %(state_updated_at)s
+        )
+        ON CONFLICT (game_id) DO UPDATE SET
+            game_format = COALESCE(game_summaries.game_format, EXCLUDED.game_format),
+            phase_mode = COALESCE(game_summaries.phase_mode, EXCLUDED.phase_mode),
+            players = EXCLUDED.players,
+            active_player = EXCLUDED.active_player,
+            turn = EXCLUDED.turn,
+            state_created_at = EXCLUDED.state_created_at,
+            state_updated_at = EXCLUDED.state_updated_at,
+            updated_at = GREATEST(game_summaries.updated_at, EXCLUDED.updated_at)
+        """,
+        {"game_id": game_state.id, **columns},
+    )
+
+
+def clear_setup_summary(cur, game_id: str) -> None:
+    """Drop the setup half of a summary, and the row if no state is left."""
+    cur.execute(
+        "DELETE FROM game_summaries WHERE game_id = %s AND state_updated_at IS NULL",
+        (game_id,),
+    )
+    cur.execute(
+        """
+        UPDATE game_summaries SET
+            setup_status = NULL, ready = NULL, max_players = NULL,
+            submitted_count = NULL, validated_count = NULL,
+            seat_claimed_count = NULL, player_status = NULL,
+            setup_created_at = NULL, setup_updated_at = NULL
+        WHERE game_id = %s
+        """,
+        (game_id,),
+    )
+
+
+def clear_state_summary(cur, game_id: str) -> None:
+    """Drop the state half of a summary, and the row if no setup is left."""
+    cur.execute(
+        "DELETE FROM game_summaries WHERE game_id = %s AND setup_status IS NULL",
+        (game_id,),
+    )
+    cur.execute(
+        """
+        UPDATE game_summaries SET
+            players = NULL, active_player = NULL, turn = NULL,
+            state_created_at = NULL, state_updated_at = NULL
+        WHERE game_id = %s
+        """,
+        (game_id,),
+    )
+
+
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    if value is None:
+        return None
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.isoformat()
+
+
+def summary_entry(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a /games/list entry from a summary row (SUMMARY_COLUMNS)."""
+    has_state = row.get("state_updated_at") is not None
+    if row.get("setup_status") is None:
+        players = row.get("players") or []
+        return {
+            "game_id": row["game_id"],
+            "status": "ongoing",
+            "ready": True,
+            "game_format": row.get("game_format") or row.get("state_game_format"),
+            "phase_mode": row.get("phase_mode") or row.get("state_phase_mode"),
+            "submitted_count": len(players),
+            "validated_count": len(players),
+            "seat_claimed_count": len(players),
+            "player_status": {},
+            "players": players,
+            "active_player": row.get("active_player"),
+            "turn": row.get("turn"),
+            "max_players": len(players),
+            "created_at": _isoformat(row.get("state_created_at")),
+            "updated_at": _isoformat(row.get("state_updated_at")),
+        }
+
+    player_status = row.get("player_status") or {}
+    entry: Dict[str, Any] = {
+        "game_id": row["game_id"],
+        "status": row["setup_status"],
+        "ready": row["ready"],
+        "game_format": row["game_format"],
+        "phase_mode": row["phase_mode"],
+        "submitted_count": row["submitted_count"],
+        "validated_count": row["validated_count"],
+        "seat_claimed_count": row["seat_claimed_count"],
+        "player_status": player_status,
+        "created_at": _isoformat(row["setup_created_at"]),
+        "updated_at": _isoformat(row["setup_updated_at"]),
+        "players": [
+            player_id
+            for player_id, status in player_status.items()
+            if status.get("submitted")
+        ],
+        "max_players": row["max_players"],
+    }
+    if row["ready"] and has_state:
+        entry["status"] = "ongoing"
+        entry["players"] = row.get("players") or []
+        entry["active_player"] = row.get("active_player")
+        entry["turn"] = row.get("turn")
+        entry["created_at"] = _isoformat(row.get("state_created_at"))
+        entry["updated_at"] = _isoformat(row.get("state_updated_at"))
+    return entry
+
+
+def summarize_games(
+    setups: Dict[str, GameSetupStatus],
+    games: Dict[str, GameState],
+    limit: int = DEFAULT_PAGE_SIZE,
+    offset: int = 0,
+) -> List[Dict[str, Any]]:
+    """A page of /games/list entries built from in-memory stores."""
+    rows: Dict[str, Dict[str, Any]] = {}
+    for game_id, setup in setups.items():
+        rows[game_id] = {"game_id": game_id, **setup_summary_columns(setup)}
+    for game_id, game_state in games.items():
+        row = rows.setdefault(game_id, {"game_id": game_id})
+        row.update(state_summary_columns(game_state))
+
+    def updated_at(row: Dict[str, Any]) -> datetime:
+        stamps = [
+            row[column]
+            for column in ("setup_updated_at", "state_updated_at")
+            if row.get(column) is not None
+        ]
+        return max(stamps)
+
+    ordered = sorted(rows.values(), key=lambda row: row["game_id"])
+    ordered.sort(key=updated_at, reverse=True)
+    return [summary_entry(row) for row in ordered[offset : offset + limit]]
@@ -0,0 +1,141 @@
+"""
+Thread pool for game work started from the WebSocket and HTTP event loops.
+
+Applying an action loads and saves the game through the synchronous psycopg
+proxies, and projecting a state is CPU work; done on an event loop, either
+stalls every other socket and request it serves. The executor runs that
+work in a small thread pool instead, so the loop only does network I/O.
+
+Work is ordered per game: each call waits for the previous call for the
+same game to finish, which also keeps two threads from mutating one cached
+GameState at once. Different games run in parallel, up to max_workers.
+
+Coroutine functions (the engine's action path is async) run to completion
+on an event loop owned by the worker thread. They must not share
+loop-bound objects (locks, sessions, tasks) with the main loop.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Optional
+
+from app.backend.core.config import settings
+
+# Run times kept for the percentile metrics
+RUN_TIME_WINDOW = 1000
+
+_thread_state = threading.local()
+
+
+def _call(func: Callable[..., Any], args: tuple) -> Any:
+    """Run func in this worker thread, on the thread's own loop if async."""
+    result = func(*args)
+    if asyncio.iscoroutine(result):
+        loop = getattr(_thread_state, "loop", None)
+        if loop is None:
+            loop = _thread_state.loop = asyncio.new_event_loop()
+        return loop.run_until_complete(result)
+    return result
+
+
+class GameActionExecutor:
+    """Runs game work in a thread pool, one call at a time per game."""
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._pool: Optional[ThreadPoolExecutor] = None
+        # Per game: completion of the last call submitted, which the next
+        # call for that game waits for
+        self._tails: Dict[str, asyncio.Future] = {}
+        self._run_times: Deque[float] = deque(maxlen=RUN_TIME_WINDOW)
+        self.in_flight = 0
+        self.completed = 0
+        self.failures = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_workers > 0
+
+    def _ensure_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="game-action"
+            )
+        return self._pool
+
+    async def run(self, game_id: str, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run func(*args) after every earlier call for game_id; return its result.
+
+        With max_workers=0 func runs inline on the calling loop.
+        """
+        if not self.enabled:
+            result = func(*args)
+            return await result if asyncio.iscoroutine(result) else result
+
+        loop = asyncio.get_running_loop()
+        previous = self._tails.get(game_id)
+        done = loop.create_future()
+        self._tails[game_id] = done
+        self.in_flight += 1
+        started = None
+        try:
+            if previous is not None:
+                await asyncio.shield(previous)
+            job = loop.run_in_executor(self._ensure_pool(), _call, func, args)
+            # The game stays busy until the thread is done, even if the
+            # caller stops waiting
+            job.add_done_callback(lambda _: self._release(game_id, done))
+            started = time.perf_counter()
+            result = await asyncio.shield(job)
+            self.completed += 1
+            return result
+        except BaseException:
+            self.failures += 1
+            raise
+        finally:
+            self.in_flight -= 1
+            if started is not None:
+                self._run_times.append(time.perf_counter() - started)
+            elif previous is not None and not previous.done():
+                # Cancelled while queued: the next call still waits for ours
+                previous.add_done_callback(lambda _: self._release(game_id, done))
+            else:
+                self._release(game_id, done)
+
+    def _release(self, game_id: str, done: asyncio.Future) -> None:
+        if not done.done():
+            done.set_result(None)
+        if self._tails.get(game_id) is done:
+            del self._tails[game_id]
+
+    async def stop(self) -> None:
+        """Wait for running calls, then stop the threads."""
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            await asyncio.to_thread(pool.shutdown, wait=True)
+
+    def stats(self) -> Dict[str, Any]:
+        run_times = sorted(self._run_times)
+
+        def percentile(fraction: float) -> Optional[float]:
+            if not run_times:
+                return None
+            index = min(len(run_times) - 1, int(fraction * len(run_times)))
+            return round(run_times[index] * 1000, 3)
+
+        return {
+            "max_workers": self.max_workers,
+            "in_flight": self.in_flight,
+            "busy_games": len(self._tails),
+            "completed": self.completed,
+            "failures": self.failures,
+            "run_ms_p50": percentile(0.5),
+            "run_ms_p95": percentile(0.95),
+        }
+
+
+game_action_executor = GameActionExecutor(settings.ws_action_workers)
@@ -0,0 +1,126 @@
+"""
+Per-game coalescing of game state broadcasts.
+
+A burst of actions on one game (a player tapping five lands, an API client
+resolving a stack) used to cost one full game_state_update per action, each
+projected, serialized, relayed and diffed on its own. The coalescer sends
+the first update of a quiet game straight away and then opens a window of
+settings.broadcast_coalesce_ms. Updates submitted while the window is open
+are merged: only the latest state is kept, and the action_result of every
+merged update (or its action_results, for a batch) is attached, in order, as
+action_results. When the window
+closes the merged update goes out and, if it carried anything, a new window
+opens, so a busy game sends at most one state broadcast per window.
+
+States are compared by state_order: (created_at, seq), seq being the
+GameState.version, which starts over when a game is restarted. A late submit
+carrying an older state never replaces a newer one; only its action_result
+is kept.
+A window of 0 disables coalescing.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from app.backend.utils.state_delta import state_order
+
+SendFn = Callable[[str, Dict[str, Any]], Awaitable[None]]
+
+
+class _Window:
+    __slots__ = ("message", "action_results", "task")
+
+    def __init__(self):
+        self.message: Optional[Dict[str, Any]] = None
+        self.action_results: List[Dict[str, Any]] = []
+        self.task: Optional[asyncio.Task] = None
+
+
+class BroadcastCoalescer:
+    """Merges the game state broadcasts of one game sent within a window."""
+
+    def __init__(self, window_seconds: float, send: SendFn):
+        self.window_seconds = window_seconds
+        self.send = send
+        self._windows: Dict[str, _Window] = {}
+        self.submitted = 0
+        self.sent = 0
+        self.coalesced = 0
+        self.failures = 0
+
+    async def submit(self, game_id: str, message: Dict[str, Any]) -> None:
+        """Send message now, or merge it into the game's open window."""
+        self.submitted += 1
+        if self.window_seconds <= 0:
+            await self._deliver(game_id, message)
+            return
+
+        window = self._windows.get(game_id)
+        if window is None:
+            window = self._windows[game_id] = _Window()
+            window.task = asyncio.get_running_loop().create_task(
+                self._close_window(game_id, window)
+            )
+            await self._deliver(game_id, message)
+            return
+
+        if window.message is not None:
+            self.coalesced += 1
+        if window.message is None or state_order(message) >= state_order(
+            window.message
+        ):
+            window.message = message
+        if "action_results" in message:
+            window.action_results.extend(message["action_results"])
+        elif message.get("action_result") is not None:
+            window.action_results.append(message["action_result"])
+
+    async def _close_window(self, game_id: str, window: _Window) -> None:
+        try:
+            while True:
+                await asyncio.sleep(self.window_seconds)
+                if window.message is None:
+                    break
+                # Reset before sending so submits made meanwhile are kept
+                message = _merged(window)
+                window.message = None
+                window.action_results = []
+                await self._deliver(game_id, message)
+        finally:
+            if self._windows.get(game_id) is window:
+                del self._windows[game_id]
+
+    async def _deliver(self, game_id: str, message: Dict[str, Any]) -> None:
+        try:
+            await self.send(game_id, message)
+            self.sent += 1
+        except Exception as e:
+            self.failures += 1
+            print(f"[BroadcastCoalescer] Error broadcasting game {game_id}: {e}")
+
+    async def stop(self) -> None:
+        """Send every pending merged update now."""
+        windows, self._windows = self._windows, {}
+        for game_id, window in windows.items():
+            if window.task is not None:
+                window.task.cancel()
+            if window.message is not None:
+                await self._deliver(game_id, _merged(window))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "window_ms": round(self.window_seconds * 1000, 3),
+            "open_windows": len(self._windows),
+            "submitted": self.submitted,
+            "sent": self.sent,
+            "coalesced": self.coalesced,
+            "failures": self.failures,
+        }
+
+
+def _merged(window: _Window) -> Dict[str, Any]:
+    message = dict(window.message)
+    if window.action_results:
+        message["action_results"] = list(window.action_results)
+        message["action_result"] = window.action_results[-1]
+    return message
@@ -10,6 +10,7 @@ from typing import Dict, List, Optional, Any
 
 from app.backend.models.game import (
     DraftRoom,
+    DraftRoomSummary,
     DraftPlayer,
     Card,
     DraftState,
@@ -17,6 +18,8 @@ from app.backend.models.game import (
     CubeConfiguration,
 )
 from app.backend.services.draft_service import DraftService
+from app.backend.repositories.async_proxies import AsyncDraftRoomsProxy
+from app.backend.repositories.draft_room_summaries import summarize_rooms
 from app.backend.repositories.dict_proxies import (
     DraftRoomsProxy,
     CubePoolsProxy,
@@ -52,11 +55,16 @@ class DraftEngine:
             self.cube_card_pools: CubePoolStore = CubePoolsProxy()
             self.cube_pool_cursor: CubeCursorStore = CubePoolCursorsProxy()
             self.cube_card_cache: CubeCacheStore = CubeCardCacheProxy()
+            # Same table on the async pool, for readers on the event loop
+            self.async_draft_rooms: Optional[AsyncDraftRoomsProxy] = (
+                AsyncDraftRoomsProxy(self.draft_rooms)
+            )
         else:
             self.draft_rooms: DraftRoomStore = {}
             self.cube_card_pools: CubePoolStore = {}
             self.cube_pool_cursor: CubeCursorStore = {}
             self.cube_card_cache: CubeCacheStore = {}
+            self.async_draft_rooms = None
 
     def _save_room(self, room: DraftRoom) -> None:
         """Persist a draft room to storage."""
@@ -139,6 +147,25 @@ class DraftEngine:
         """Retrieves a draft room by its ID."""
         return self.draft_rooms.get(room_id)
 
+    async def fetch_draft_room(self, room_id: str) -> Optional[DraftRoom]:
+        """Async counterpart of get_draft_room()."""
+        if self.async_draft_rooms is not None:
+            return await self.async_draft_rooms.get(room_id)
+        return self.draft_rooms.get(room_id)
+
+    async def fetch_draft_room_summaries(
+        self, state: Optional[DraftState], limit: int, offset: int = 0
+    ) -> List[DraftRoomSummary]:
+        """
+        A page of room summaries, optionally only rooms in one state.
+
+        DB-backed engines read the draft_room_summaries projection; no room
+        document is loaded.
+        """
+        if self.async_draft_rooms is not None:
+            return await self.async_draft_rooms.summaries(state, limit, offset)
+        return summarize_rooms(self.draft_rooms.values(), state, limit, offset)
+
     def add_player_to_room(self, room_id: str, player_id: str) -> Optional[DraftPlayer]:
         """Adds a player to a draft room."""
         room = self.get_draft_room(room_id)
@@ -0,0 +1,554 @@
+"""
+Single-writer game actors.
+
+When settings.game_actor_mode is enabled every game is owned by exactly one
+process, recorded as a lease in the game_actor_leases table. The owner keeps
+the GameState in memory and applies actions one at a time from a per-game
+asyncio queue, so the interactive path never reloads or re-serializes the
+full state. State, replay steps and history entries are written behind in a
+single unit of work, coalesced every game_actor_flush_ms.
+
+Requests that reach a process which does not own the game are forwarded to
+the owner over its NOTIFY channel (the owner_id of the lease) and the reply
+comes back on the sender's channel.
+
+Trade-offs:
+- A crash loses at most the actions of the current flush window.
+- Readers on other processes see the persisted state, which trails the owner
+  by at most one flush window.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple, Union
+
+import psycopg
+
+from app.backend.core.config import settings
+from app.backend.core.db import commit, get_connection, get_database_url
+from app.backend.models.game import GameAction, GameState
+from app.backend.repositories.dict_proxies import (
+    GameStateConflictError,
+    GameStatesProxy,
+)
+
+# Resolves a raw action request against the current state (see
+# api.decorators.build_game_action).
+BuildActionFn = Callable[
+    [str, Dict[str, Any], GameState], Awaitable[Tuple[GameAction, Dict[str, Any]]]
+]
+# Called after each applied request, e.g. to broadcast the new state, with
+# its action_result (a list of them for a batch).
+AppliedFn = Callable[
+    [str, GameState, Union[Dict[str, Any], List[Dict[str, Any]]]], Awaitable[None]
+]
+
+MAX_NOTIFY_PAYLOAD = 7500
+
+
+class ForwardedActionError(RuntimeError):
+    """An action executed by another process failed there."""
+
+    def __init__(self, message: str, status_code: int = 400):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+@dataclass
+class ActorOutcome:
+    """Result of an action submitted to the actor runtime."""
+
+    action_result: Dict[str, Any]
+    version: int
+    # Only set when the action ran in this process
+    game_state: Optional[GameState] = None
+    # Every entry of a batch request; action_result is the last one
+    action_results: Optional[List[Dict[str, Any]]] = None
+
+
+class GameActor:
+    """Owns one game's in-memory state and applies its actions in order."""
+
+    def __init__(self, runtime: "GameActorRuntime", game_state: GameState):
+        self.runtime = runtime
+        self.game_id = game_state.id
+        self.state = game_state
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.task: Optional[asyncio.Task] = None
+        self._persisted_version = game_state.version
+        self._pending_actions: List[GameAction] = []
+        self._pending_steps: List[Dict[str, Any]] = []
+        self._pending_history: List[Dict[str, Any]] = []
+        self._dirty_since: Optional[float] = None
+
+    @property
+    def dirty(self) -> bool:
+        return self._dirty_since is not None
+
+    async def submit(self, request: Dict[str, Any]) -> ActorOutcome:
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((request, future))
+        return await future
+
+    async def run(self) -> None:
+        """Apply queued actions until stopped or idle for too long."""
+        flush_interval = self.runtime.flush_interval
+        try:
+            while True:
+                if self.dirty:
+                    elapsed = time.monotonic() - self._dirty_since
+                    timeout = max(0.0, flush_interval - elapsed)
+                else:
+                    timeout = self.runtime.idle_seconds
+                try:
+                    item = await asyncio.wait_for(self.queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    if self.dirty:
+                        await self.flush()
+                        continue
+                    if self.queue.empty():
+                        # Idle: retire without awaiting so no request can
+                        # slip in between the last flush and unregistering
+                        break
+                    continue
+                if item is None:
+                    await self.flush()
+                    break
+                await self._handle(*item)
+                if (
+                    self.dirty
+                    and time.monotonic() - self._dirty_since >= flush_interval
+                ):
+                    await self.flush()
+        finally:
+            self.runtime._retire(self)
+
+    async def _handle(
+        self, request: Dict[str, Any], future: asyncio.Future
+    ) -> None:
+        engine = self.runtime.engine
+        batch = request.get("actions")
+        if batch is not None:
+            # Run on a copy so a failing action leaves the state untouched
+            working = self.state.model_copy(deep=True)
+            try:
+                actions, steps, entries = await engine.apply_action_requests(
+                    self.game_id, batch, self.runtime.build_action, working
+                )
+            except Exception as e:
+                engine.invalidate_cached_state(self.game_id)
+                if not future.done():
+                    future.set_exception(e)
+                return
+            self.state = working
+        else:
+            try:
+                action, action_result = await self.runtime.build_action(
+                    self.game_id, request, self.state
+                )
+                await engine.process_action(
+                    self.game_id, action, game_state=self.state, persist=False
+                )
+            except Exception as e:
+                # The engine may have mutated the state before failing
+                try:
+                    await self._recover()
+                except Exception as recover_error:
+                    print(
+                        f"[GameActor] Could not rebuild game {self.game_id}, "
+                        f"dropping unflushed actions: {recover_error}"
+                    )
+                    self._discard_pending()
+                    self._reload()
+                if not future.done():
+                    future.set_exception(e)
+                return
+            actions = [action]
+            steps = [engine.build_replay_step(action, self.state)]
+            entries = [engine.build_action_history_entry(action_result, self.state)]
+
+        self._pending_actions.extend(actions)
+        self._pending_steps.extend(steps)
+        self._pending_history.extend(entries)
+        if self._dirty_since is None:
+            self._dirty_since = time.monotonic()
+
+        if not future.done():
+            future.set_result(
+                ActorOutcome(
+                    action_result=entries[-1],
+                    version=self.state.version,
+                    game_state=self.state,
+                    action_results=entries if batch is not None else None,
+                )
+            )
+        try:
+            await self.runtime.on_applied(
+                self.game_id, self.state, entries if batch is not None else entries[0]
+            )
+        except Exception as e:
+            print(f"[GameActor] on_applied failed for game {self.game_id}: {e}")
+
+    async def flush(self) -> None:
+        """Write the state and pending rows in one unit of work."""
+        if not self.dirty:
+            return
+        engine = self.runtime.engine
+        engine.record_table_draws(self.state)
+        for attempt in range(1, engine.MAX_ACTION_ATTEMPTS + 1):
+            try:
+                with engine.unit_of_work():
+                    if isinstance(engine.games, GameStatesProxy):
+                        engine.games.compare_and_set(
+                            self.state, expected_version=self._persisted_version
+                        )
+                    else:
+                        engine.games[self.game_id] = self.state
+                    for step in self._pending_steps:
+                        engine.store_replay_step(self.game_id, step)
+                    for entry in self._pending_history:
+                        engine.store_action_history_entry(self.game_id, entry)
+                break
+            except GameStateConflictError:
+                if attempt >= engine.MAX_ACTION_ATTEMPTS:
+                    print(
+                        f"[GameActor] Dropping {len(self._pending_actions)} "
+                        f"unflushed actions for game {self.game_id}"
+                    )
+                    self._discard_pending()
+                    self._reload()
+                    return
+                print(
+                    f"[GameActor] Game {self.game_id} was saved elsewhere, "
+                    "re-applying pending actions"
+                )
+                await self._recover()
+
+        self._persisted_version = self.state.version
+        self._discard_pending()
+
+    def _discard_pending(self) -> None:
+        self._pending_actions.clear()
+        self._pending_steps.clear()
+        self._pending_history.clear()
+        self._dirty_since = None
+
+    def _reload(self) -> None:
+        self.runtime.engine.invalidate_cached_state(self.game_id)
+        game_state = self.runtime.engine.games.get(self.game_id)
+        if not game_state:
+            raise ValueError(f"Game {self.game_id} not found")
+        self.state = game_state.model_copy(deep=True)
+        self._persisted_version = game_state.version
+
+    async def _recover(self) -> None:
+        """Rebuild the in-memory state from storage plus pending actions."""
+        self._reload()
+        for action in self._pending_actions:
+            await self.runtime.engine.process_action(
+                self.game_id, action, game_state=self.state, persist=False
+            )
+
+
+class GameActorRuntime:
+    """
+    Routes game actions to the process that owns the game.
+
+    One runtime lives in each API or WebSocket worker. It is inert until
+    start() is called, so importing it has no side effects.
+    """
+
+    def __init__(
+        self,
+        engine,
+        build_action: BuildActionFn,
+        on_applied: AppliedFn,
+    ):
+        self.engine = engine
+        self.build_action = build_action
+        self.on_applied = on_applied
+        self.owner_id = f"game_actor_{uuid.uuid4().hex[:16]}"
+        self.flush_interval = settings.game_actor_flush_ms / 1000
+        self.idle_seconds = settings.game_actor_idle_seconds
+        self.lease_seconds = settings.game_actor_lease_seconds
+        self.forward_timeout = settings.game_actor_forward_timeout
+        self.actors: Dict[str, GameActor] = {}
+        self._pending_replies: Dict[str, asyncio.Future] = {}
+        # Lease releases of retired actors, awaited before re-acquiring
+        self._releasing: Dict[str, asyncio.Task] = {}
+        self._tasks: List[asyncio.Task] = []
+        self._notify_conn: Optional[psycopg.AsyncConnection] = None
+        self._notify_lock = asyncio.Lock()
+        self._running = False
+
+    @property
+    def enabled(self) -> bool:
+        return self._running
+
+    async def start(self) -> None:
+        """Start listening for forwarded actions and renewing leases."""
+        if self._running:
+            return
+        self._running = True
+        self._tasks = [
+            asyncio.create_task(self._listen()),
+            asyncio.create_task(self._renew_leases()),
+        ]
+        print(f"[GameActor] Runtime {self.owner_id} started")
+
+    async def stop(self) -> None:
+        """Flush and release every owned game, then stop background tasks."""
+        was_running, self._running = self._running, False
+        for actor in list(self.actors.values()):
+            await actor.queue.put(None)
+        tasks = [actor.task for actor in self.actors.values() if actor.task]
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        if self._releasing:
+            await asyncio.gather(*self._releasing.values(), return_exceptions=True)
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self._notify_conn is not None:
+            await self._notify_conn.close()
+            self._notify_conn = None
+        if was_running:
+            print(f"[GameActor] Runtime {self.owner_id} stopped")
+
+    def local_state(self, game_id: str) -> Optional[GameState]:
+        """Return the authoritative in-memory state if this process owns it."""
+        actor = self.actors.get(game_id)
+        return actor.state if actor else None
+
+    async def submit(self, game_id: str, request: Dict[str, Any]) -> ActorOutcome:
+        """Apply an action on the owning actor, spawning or forwarding as needed."""
+        actor = self.actors.get(game_id)
+        if actor is None:
+            releasing = self._releasing.get(game_id)
+            if releasing is not None:
+                await asyncio.shield(releasing)
+            owner_id = await asyncio.to_thread(self._acquire_lease, game_id)
+            if owner_id != self.owner_id:
+                return await self._forward(owner_id, game_id, request)
+            actor = self.actors.get(game_id) or await self._spawn(game_id)
+        return await actor.submit(request)
+
+    async def _spawn(self, game_id: str) -> GameActor:
+        game_state = await asyncio.to_thread(self.engine.games.get, game_id)
+        if not game_state:
+            await asyncio.to_thread(self._release_lease, game_id)
+            raise KeyError(game_id)
+        actor = self.actors.get(game_id)
+        if actor is not None:
+            # Another request spawned it while the state was loading
+            return actor
+        # The actor mutates its state in place before flushing; a private
+        # copy keeps readers of the stored object from seeing that
+        actor = GameActor(self, game_state.model_copy(deep=True))
+        self.actors[game_id] = actor
+        actor.task = asyncio.create_task(actor.run())
+        return actor
+
+    def _retire(self, actor: GameActor) -> None:
+        """Unregister and release an actor; runs without awaiting."""
+        if actor.dirty:
+            print(
+                f"[GameActor] Game {actor.game_id} retired with "
+                f"{len(actor._pending_actions)} unflushed actions"
+            )
+        if self.actors.get(actor.game_id) is actor:
+            del self.actors[actor.game_id]
+        while not actor.queue.empty():
+            item = actor.queue.get_nowait()
+            if item is not None and not item[1].done():
+                item[1].set_exception(RuntimeError("Game actor stopped"))
+        task = asyncio.create_task(self._release_retired_lease(actor.game_id))
+        self._releasing[actor.game_id] = task
+
+    async def _release_retired_lease(self, game_id: str) -> None:
+        try:
+            await asyncio.to_thread(self._release_lease, game_id)
+        except Exception as e:
+            print(f"[GameActor] Could not release lease for {game_id}: {e}")
+        finally:
+            if self._releasing.get(game_id) is asyncio.current_task():
+                del self._releasing[game_id]
+
+    # ------------------------------------------------------------------
+    # Leases
+    # ------------------------------------------------------------------
+
+    def _acquire_lease(self, game_id: str) -> str:
+        """Take the lease if it is free or expired; return the current owner."""
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    INSERT INTO game_actor_leases (game_id, owner_id, expires_at)
+                    VALUES (%s, %s, NOW() + make_interval(secs => %s))
+                    ON CONFLICT (game_id) DO UPDATE SET
+                        owner_id = EXCLUDED.owner_id,
+                        expires_at = EXCLUDED.expires_at
+                    WHERE game_actor_leases.expires_at < NOW()
+                       OR game_actor_leases.owner_id = EXCLUDED.owner_id
+                    RETURNING owner_id
+                    """,
+                    (game_id, self.owner_id, self.lease_seconds),
+                )
+                row = cur.fetchone()
+                if row is None:
+                    cur.execute(
+                        "SELECT owner_id FROM game_actor_leases WHERE game_id = %s",
+                        (game_id,),
+                    )
+                    row = cur.fetchone()
+            commit(conn)
+        return row[0] if row else self.owner_id
+
+    def _release_lease(self, game_id: str) -> None:
+        with get_connection() as conn:
+            conn.execute(
+                "DELETE FROM game_actor_leases WHERE game_id = %s AND owner_id = %s",
+                (game_id, self.owner_id),
+            )
+            commit(conn)
+
+    def _renew_owned_leases(self, game_ids: List[str]) -> Set[str]:
+        """Extend the leases this runtime still holds; return their game ids."""
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    UPDATE game_actor_leases
+                    SET expires_at = NOW() + make_interval(secs => %s)
+                    WHERE owner_id = %s AND game_id = ANY(%s)
+                    RETURNING game_id
+                    """,
+                    (self.lease_seconds, self.owner_id, game_ids),
+                )
+                renewed = {row[0] for row in cur.fetchall()}
+            commit(conn)
+        return renewed
+
+    async def _renew_leases(self) -> None:
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            game_ids = list(self.actors.keys())
+            if not game_ids:
+                continue
+            try:
+                renewed = await asyncio.to_thread(self._renew_owned_leases, game_ids)
+            except Exception as e:
+                print(f"[GameActor] Lease renewal failed: {e}")
+                continue
+            for game_id in game_ids:
+                actor = self.actors.get(game_id)
+                if game_id not in renewed and actor is not None:
+                    print(f"[GameActor] Lost lease on game {game_id}, stopping actor")
+                    await actor.queue.put(None)
+
+    # ------------------------------------------------------------------
+    # Forwarding over NOTIFY
+    # ------------------------------------------------------------------
+
+    async def _notify(self, channel: str, payload: Dict[str, Any]) -> None:
+        async with self._notify_lock:
+            if self._notify_conn is None or self._notify_conn.closed:
+                self._notify_conn = await psycopg.AsyncConnection.connect(
+                    get_database_url(), autocommit=True
+                )
+            await self._notify_conn.execute(
+                "SELECT pg_notify(%s, %s)", (channel, json.dumps(payload))
+            )
+
+    async def _forward(
+        self, owner_id: str, game_id: str, request: Dict[str, Any]
+    ) -> ActorOutcome:
+        request_id = uuid.uuid4().hex
+        future = asyncio.get_running_loop().create_future()
+        self._pending_replies[request_id] = future
+        try:
+            await self._notify(
+                owner_id,
+                {
+                    "kind": "request",
+                    "request_id": request_id,
+                    "reply_to": self.owner_id,
+                    "game_id": game_id,
+                    "request": request,
+                },
+            )
+            reply = await asyncio.wait_for(future, self.forward_timeout)
+        except asyncio.TimeoutError:
+            raise ForwardedActionError(
+                f"Owner of game {game_id} did not answer", status_code=504
+            )
+        finally:
+            self._pending_replies.pop(request_id, None)
+
+        if reply.get("error"):
+            raise ForwardedActionError(reply["error"], reply.get("status", 400))
+        return ActorOutcome(
+            action_result=reply.get("action_result") or {"success": True},
+            version=reply.get("version", 0),
+            action_results=reply.get("action_results"),
+        )
+
+    async def _answer(self, message: Dict[str, Any]) -> None:
+        """Run a forwarded action locally and send the reply back."""
+        game_id = message.get("game_id")
+        reply: Dict[str, Any] = {"kind": "reply", "request_id": message.get("request_id")}
+        try:
+            actor = self.actors.get(game_id)
+            if actor is None:
+                # Lease may have expired or moved since the sender looked it up
+                outcome = await self.submit(game_id, message.get("request") or {})
+            else:
+                outcome = await actor.submit(message.get("request") or {})
+            reply["version"] = outcome.version
+            reply["action_result"] = outcome.action_result
+            if outcome.action_results is not None:
+                reply["action_results"] = outcome.action_results
+            if len(json.dumps(reply)) > MAX_NOTIFY_PAYLOAD:
+                reply["action_result"] = {"success": True}
+                reply.pop("action_results", None)
+        except ForwardedActionError as e:
+            reply.update(error=str(e), status=e.status_code)
+        except KeyError:
+            reply.update(error=f"Game {game_id} not found", status=404)
+        except ValueError as e:
+            reply.update(error=str(e), status=400)
+        except Exception as e:
+            reply.update(error=str(e), status=getattr(e, "status_code", 500))
+        await self._notify(message["reply_to"], reply)
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                async with await psycopg.AsyncConnection.connect(
+                    get_database_url(), autocommit=True
+                ) as conn:
+                    await conn.execute(f"LISTEN {self.owner_id}")
+                    async for notify in conn.notifies():
+                        try:
+                            message = json.loads(notify.payload)
+                        except json.JSONDecodeError as e:
+                            print(f"[GameActor] Invalid forwarded payload: {e}")
+                            continue
+                        if message.get("kind") == "request":
+                            asyncio.create_task(self._answer(message))
+                        elif message.get("kind") == "reply":
+                            future = self._pending_replies.get(message.get("request_id"))
+                            if future is not None and not future.done():
+                                future.set_result(message)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"[GameActor] Listener error: {e}, reconnecting in 1 second")
+                await asyncio.sleep(1)
@@ -4,11 +4,21 @@ This will be replaced by XMage integration later.
 """
 
 import random
+import threading
 import asyncio
-import uuid
 import time
 import re
-from typing import List, Optional, Dict, Any, Tuple
+from contextlib import AbstractContextManager, nullcontext
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
 from app.backend.models.game import (
     Card,
     Deck,
@@ -27,8 +37,27 @@ from app.backend.models.game import (
     GameStartPhase,
     MulliganState,
     current_utc_datetime,
+    new_rng_seed,
+)
+from app.backend.core.config import settings
+from app.backend.core.db import unit_of_work
+from app.backend.models.projection_cache import projection_cache
+from app.backend.repositories.batch_writer import (
+    CHAT_MESSAGE,
+    HISTORY_ENTRY,
+    REPLAY_STEP,
+    BatchWriter,
+)
+from app.backend.repositories.async_proxies import (
+    AsyncActionHistoryProxy,
+    AsyncChatMessagesProxy,
+    AsyncGameSetupsProxy,
+    AsyncGameStatesProxy,
+    AsyncGameSummariesProxy,
+    AsyncReplaysProxy,
 )
 from app.backend.repositories.dict_proxies import (
+    GameStateConflictError,
     GameStatesProxy,
     GameSetupsProxy,
     ReplaysProxy,
@@ -36,11 +65,29 @@ from app.backend.repositories.dict_proxies import (
     ActionHistoryProxy,
     ChatMessagesProxy,
 )
+from app.backend.repositories.game_summaries import summarize_games
+from app.backend.services.replay_service import EventSourcedReplays
 
 GameStateStore = GameStatesProxy | Dict[str, GameState]
 GameSetupStore = GameSetupsProxy | Dict[str, GameSetupStatus]
 DeckStore = PendingDecksProxy | Dict[str, Dict[str, Deck]]
-ReplayStore = ReplaysProxy | Dict[str, List[Dict[str, Any]]]
+ReplayStore = ReplaysProxy | EventSourcedReplays | Dict[str, List[Dict[str, Any]]]
+# Resolves a raw action request against the current state (see
+# api.decorators.build_game_action)
+BuildActionFn = Callable[
+    [str, Dict[str, Any], GameState], Awaitable[Tuple[GameAction, Dict[str, Any]]]
+]
+
+
+class BatchActionError(ValueError):
+    """One action of a batch failed; none of the batch was applied."""
+
+    def __init__(self, index: int, action_type: Optional[str], error: Exception):
+        detail = getattr(error, "detail", None) or str(error)
+        super().__init__(f"Action {index} ({action_type}) failed: {detail}")
+        self.index = index
+        self.action_type = action_type
+        self.status_code = getattr(error, "status_code", 400)
 
 
 class SimpleGameEngine:
@@ -49,6 +96,8 @@ class SimpleGameEngine:
     MAX_ACTION_HISTORY = 10000
     MAX_CHAT_MESSAGES = 1000
     MAX_PLAYER_NAME_LENGTH = 32
+    MAX_ACTION_ATTEMPTS = 3
+    MAX_BATCH_ACTIONS = 100
     COMBAT_PHASES = {GamePhase.ATTACK, GamePhase.BLOCK, GamePhase.DAMAGE}
 
     def __init__(self, use_db: bool = True):
@@ -64,9 +113,42 @@ class SimpleGameEngine:
             self.game_setups: GameSetupStore = GameSetupsProxy()
             self._pending_decks: DeckStore = PendingDecksProxy()
             self._submitted_decks: DeckStore = PendingDecksProxy()  # Reuse structure
-            self.replays: ReplayStore = ReplaysProxy()
+            self.replays: ReplayStore = (
+                EventSourcedReplays()
+                if settings.replay_mode == "events"
+                else ReplaysProxy()
+            )
             self._action_history: Optional[ActionHistoryProxy] = ActionHistoryProxy()
             self._chat_messages: Optional[ChatMessagesProxy] = ChatMessagesProxy()
+            # Idle until started by the app lifespan; rows are written inline
+            # while it is not running
+            self.writer: Optional[BatchWriter] = BatchWriter(
+                self.replays if isinstance(self.replays, ReplaysProxy) else None,
+                self._action_history,
+                self._chat_messages,
+                max_pending=settings.write_behind_max_pending,
+                flush_interval=settings.write_behind_flush_ms / 1000,
+                max_attempts=settings.write_behind_max_attempts,
+            )
+            # Same tables on the async pool, for readers on the event loop
+            self.async_games: Optional[AsyncGameStatesProxy] = AsyncGameStatesProxy(
+                self.games
+            )
+            self.async_game_setups: Optional[AsyncGameSetupsProxy] = (
+                AsyncGameSetupsProxy(self.game_setups)
+            )
+            self._async_replays: Optional[AsyncReplaysProxy] = (
+                AsyncReplaysProxy() if isinstance(self.replays, ReplaysProxy) else None
+            )
+            self._async_action_history: Optional[AsyncActionHistoryProxy] = (
+                AsyncActionHistoryProxy()
+            )
+            self._async_chat_messages: Optional[AsyncChatMessagesProxy] = (
+                AsyncChatMessagesProxy()
+            )
+            self._async_game_summaries: Optional[AsyncGameSummariesProxy] = (
+                AsyncGameSummariesProxy()
+            )
         else:
             # In-memory for testing
             self.games: GameStateStore = {}
@@ -76,8 +158,19 @@ class SimpleGameEngine:
             self.replays: ReplayStore = {}
             self._action_history = None
             self._chat_messages = None
+            self.writer = None
+            self.async_games = None
+            self.async_game_setups = None
+            self._async_replays = None
+            self._async_action_history = None
+            self._async_chat_messages = None
+            self._async_game_summaries = None
 
         self._use_db = use_db
+        # Table stream draws taken per game; the next save of the game
+        # records them in table_rng_draws (see roll_table_die)
+        self._table_draws: Dict[str, int] = {}
+        self._table_draws_lock = threading.Lock()
 
     def end_game(self, game_id: str) -> bool:
         """End a game and remove it from all tracking dictionaries."""
@@ -95,6 +188,23 @@ class SimpleGameEngine:
         # Keep replays for export even after game ends
         return found
 
+    def unit_of_work(self) -> AbstractContextManager:
+        """
+        Group the storage writes made inside the block into one transaction.
+
+        Used around process_action and the matching action history entry so a
+        single game action costs one commit. In-memory engines get a no-op.
+        """
+        if self._use_db:
+            return unit_of_work()
+        return nullcontext()
+
+    def invalidate_cached_state(self, game_id: str) -> None:
+        """Drop a cached game state that was mutated but not saved."""
+        projection_cache.forget(game_id)
+        if isinstance(self.games, GameStatesProxy):
+            self.games.invalidate(game_id)
+
     def _touch_setup(self, setup: GameSetupStatus) -> None:
         """Update timestamp and persist setup to DB."""
         setup.updated_at = current_utc_datetime()
@@ -102,15 +212,29 @@ class SimpleGameEngine:
             self.game_setups[setup.game_id] = setup
 
     def _touch_game_state(self, game_state: GameState) -> None:
-        """Update timestamp and persist game state to DB."""
+        """
+        Update timestamp, bump the version and persist game state to DB.
+
+        DB-backed saves are compare-and-swap on the version the state was loaded
+        with and raise GameStateConflictError when another writer won the race.
+        """
         game_state.updated_at = current_utc_datetime()
-        if self._use_db:
-            self.games[game_state.id] = game_state
+        self.record_table_draws(game_state)
+        if self._use_db and isinstance(self.games, GameStatesProxy):
+            self.games.compare_and_set(game_state)
+        else:
+            game_state.version += 1
 
     def _record_replay_step(
         self, game_id: str, action: Optional[GameAction], game_state: GameState
     ) -> None:
         """Record a step in the game replay timeline using compact format."""
+        self.store_replay_step(game_id, self.build_replay_step(action, game_state))
+
+    def build_replay_step(
+        self, action: Optional[GameAction], game_state: GameState
+    ) -> Dict[str, Any]:
+        """Snapshot game_state as a replay step without storing it."""
         # Use compact format for significantly smaller replay files
         # Exclude card_catalog - it can be fetched from API when replaying
         compact_data = game_state.to_compact_ui_data(
@@ -118,18 +242,89 @@ class SimpleGameEngine:
             chat_log=[],
         )
 
-        step = {"timestamp": time.time(), "state": compact_data}
+        step = {
+            "timestamp": time.time(),
+            "state": compact_data,
+            # Lets the replay store write a delta against the previous step
+            "state_version": game_state.version,
+        }
         if action:
             step["action"] = action.model_dump(mode="json")
         else:
             step["action"] = {"action_type": "initial_setup", "player_id": "system"}
+        return step
+
+    def flush_pending_writes(self) -> None:
+        """Write queued replay steps, history and chat rows now."""
+        if self.writer:
+            self.writer.flush()
+
+    def count_replay_steps(self, game_id: str) -> int:
+        """Number of recorded replay steps for game_id (0 if none)."""
+        self.flush_pending_writes()
+        if isinstance(self.replays, (ReplaysProxy, EventSourcedReplays)):
+            return self.replays.count_steps(game_id)
+        return len(self.replays.get(game_id, []))
+
+    async def iter_replay_steps(
+        self, game_id: str, from_step: int = 0, to_step: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield replay steps from_step (inclusive) to to_step (exclusive).
+
+        DB-backed timelines are read through a server-side cursor in a worker
+        thread, so neither the event loop nor memory is tied up by the whole
+        timeline.
+        """
+        await asyncio.to_thread(self.flush_pending_writes)
+        if isinstance(self.replays, EventSourcedReplays):
+            async for step in self.replays.iter_steps(game_id, from_step, to_step):
+                yield step
+            return
+        if not isinstance(self.replays, ReplaysProxy):
+            for step in self.replays.get(game_id, [])[from_step:to_step]:
+                yield step
+            return
+
+        steps = self.replays.iter_steps(game_id, from_step, to_step)
+        try:
+            while (step := await asyncio.to_thread(next, steps, None)) is not None:
+                yield step
+        finally:
+            # Releases the cursor and its pooled connection on early exit; if
+            # a fetch is still running in its thread, garbage collection will
+            try:
+                steps.close()
+            except ValueError:
+                pass
 
-        if isinstance(self.replays, ReplaysProxy):
-            self.replays.append_step(game_id, step)
+    async def get_replay_timeline(
+        self, game_id: str, from_step: int = 0, to_step: Optional[int] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Return (a range of) the replay timeline, or None if none was recorded."""
+        await asyncio.to_thread(self.flush_pending_writes)
+        if game_id not in self.replays:
+            return None
+        return [
+            step async for step in self.iter_replay_steps(game_id, from_step, to_step)
+        ]
+
+    def store_replay_step(self, game_id: str, step: Dict[str, Any]) -> None:
+        """Append a step built by build_replay_step to the replay timeline."""
+        if self.writer and self.writer.accepts(REPLAY_STEP):
+            self.writer.submit(
+                REPLAY_STEP, game_id, step, state_version=step.get("state_version")
+            )
+        elif isinstance(self.replays, (ReplaysProxy, EventSourcedReplays)):
+            self.replays.append_step(
+                game_id, step, state_version=step.get("state_version")
+            )
         else:
             if game_id not in self.replays:
                 self.replays[game_id] = []
-            self.replays[game_id].append(step)
+            self.replays[game_id].append(
+                {key: value for key, value in step.items() if key != "state_version"}
+            )
 
     def _set_phase(self, game_state: GameState, new_phase: GamePhase) -> None:
         """Centralized phase setter that manages combat transitions."""
@@ -159,7 +354,7 @@ class SimpleGameEngine:
             "origin": "engine",
         }
 
-        self.record_action_history(game_state.id, entry)
+        self.record_action_history(game_state.id, entry, game_state=game_state)
 
     def _coerce_phase(self, phase):  # Helper to normalize phase inputs
         if isinstance(phase, GamePhase):
@@ -586,7 +781,10 @@ class SimpleGameEngine:
         if game_state:
             for player in game_state.players:
                 if player.id == player_id:
-                    player.name = sanitized_name
+                    if player.name != sanitized_name:
+                        player.name = sanitized_name
+                        # Save rather than leave a mutated copy in the cache
+                        self._touch_game_state(game_state)
                     break
 
         setup.player_status[player_id] = player_status
@@ -637,8 +835,18 @@ class SimpleGameEngine:
         game_id: str,
         player_decks: Dict[str, Deck],
         setup: GameSetupStatus,
+        seed: Optional[int] = None,
     ) -> GameState:
-        """Initialize the actual game state from validated decks."""
+        """
+        Initialize the actual game state from validated decks.
+
+        The same decks, setup and seed always deal the same game; event-sourced
+        replays rely on this to rebuild a game from its seed.
+        """
+        if seed is None:
+            seed = new_rng_seed()
+        # Draws made before the game state (and its counters) exist
+        setup_rng = random.Random(f"{seed}:setup")
         seat_ids = sorted(
             player_decks.keys(),
             key=lambda seat: (
@@ -664,16 +872,16 @@ class SimpleGameEngine:
                 id=seat_id,
                 name=player_name,
                 deck_name=deck.name,
-                library=self._shuffle_deck(deck.cards, seat_id),
+                library=self._shuffle_deck(deck.cards, seat_id, setup_rng),
                 life=base_life,
             )
-            self._initialize_commander_zone(player, deck)
+            self._initialize_commander_zone(player, deck, setup_rng)
             players.append(player)
 
         # Note: Initial 7 cards will be drawn after coin flip choice
 
         # Perform coin flip to determine who chooses
-        coin_flip_winner = random.randint(0, max(len(players) - 1, 0))
+        coin_flip_winner = setup_rng.randint(0, max(len(players) - 1, 0))
         coin_flip_winner_id = players[coin_flip_winner].id if players else "player1"
 
         game_state = GameState(
@@ -694,25 +902,31 @@ class SimpleGameEngine:
             mulligan_state={seat_id: MulliganState() for seat_id in seat_ids},
             mulligan_deciding_player=None,
             deck_status={seat_id: setup.player_status[seat_id] for seat_id in seat_ids},
+            rng_seed=seed,
         )
-        self._touch_game_state(game_state)
-
-        self.games[game_id] = game_state
-        self._pending_decks.pop(game_id, None)
-
-        # Log coin flip result
-        self.record_action_history(
-            game_id,
-            {
-                "action": "coin_flip",
-                "player": coin_flip_winner_id,
-                "success": True,
-                "message": f"{game_state.players[coin_flip_winner].name} wins the coin flip!",
-                "origin": "engine",
-            },
-        )
+        with self.unit_of_work():
+            self._touch_game_state(game_state)
+            if not self._use_db:
+                self.games[game_id] = game_state
+            self._pending_decks.pop(game_id, None)
+
+            # Log coin flip result
+            self.record_action_history(
+                game_id,
+                {
+                    "action": "coin_flip",
+                    "player": coin_flip_winner_id,
+                    "success": True,
+                    "message": f"{game_state.players[coin_flip_winner].name} wins the coin flip!",
+                    "origin": "engine",
+                },
+                game_state=game_state,
+            )
 
-        self._record_replay_step(game_id, None, game_state)
+            if isinstance(self.replays, EventSourcedReplays):
+                self.replays.record_setup(game_id, seed, player_decks, setup)
+            else:
+                self._record_replay_step(game_id, None, game_state)
         return game_state
 
     def restart_game(self, game_id: str) -> GameState:
@@ -739,11 +953,13 @@ class SimpleGameEngine:
 
         # Reset live state and replay timeline
         self.games.pop(game_id, None)
-        if isinstance(self.replays, ReplaysProxy):
+        if isinstance(self.replays, dict):
+            self.replays[game_id] = []
+        else:
+            if self.writer:
+                self.writer.discard(REPLAY_STEP, game_id)
             if game_id in self.replays:
                 del self.replays[game_id]
-        else:
-            self.replays[game_id] = []
 
         setup = self.game_setups[game_id]
         setup.status = "Game ready - both decks validated"
@@ -755,18 +971,191 @@ class SimpleGameEngine:
             setup,
         )
 
+    def roll_table_die(self, game_id: str, sides: int) -> int:
+        """
+        Roll a die with the given number of sides (2 for a coin) for a table
+        animation, drawing from the game's seeded table stream.
+
+        Nothing is written: the draw counter is advanced in memory, from the
+        stored table_rng_draws, and persisted by the game's next save
+        (record_table_draws()). Rolls are not added to replays, and a game
+        owned by an actor is left to it.
+        """
+        game_state = self.games.get(game_id)
+        if not game_state:
+            raise ValueError(f"Game {game_id} not found")
+        with self._table_draws_lock:
+            draw = max(self._table_draws.get(game_id, 0), game_state.table_rng_draws)
+            self._table_draws[game_id] = draw + 1
+        rng = random.Random(f"{game_state.rng_seed}:table:{draw}")
+        return rng.randint(1, sides)
+
+    def record_table_draws(self, game_state: GameState) -> None:
+        """Carry the table rolls made since the last save into game_state."""
+        with self._table_draws_lock:
+            draws = self._table_draws.get(game_state.id, 0)
+        if draws > game_state.table_rng_draws:
+            game_state.table_rng_draws = draws
+
     async def process_action(
         self,
         game_id: str,
         action: GameAction,
         game_state: Optional[GameState] = None,
+        persist: bool = True,
     ) -> GameState:
-        """Process a player action and return updated game state."""
+        """
+        Process a player action and return updated game state.
+
+        If another worker saved the game between our load and our save, the
+        action is re-applied to a freshly loaded state, up to
+        MAX_ACTION_ATTEMPTS times. Each attempt runs in its own (nested) unit
+        of work so a lost race leaves no replay or history rows behind.
+
+        With persist=False the action is only applied to the in-memory state
+        and the version bumped; the caller owns saving state and replay steps
+        (see GameActor's write-behind flush).
+        """
         if game_state is None:
             game_state = self.games.get(game_id)
             if not game_state:
                 raise ValueError(f"Game {game_id} not found")
 
+        if not persist:
+            await self._apply_action(game_state, action)
+            game_state.updated_at = current_utc_datetime()
+            game_state.version += 1
+            return game_state
+
+        for attempt in range(1, self.MAX_ACTION_ATTEMPTS + 1):
+            try:
+                with self.unit_of_work():
+                    await self._apply_action(game_state, action)
+                    self._touch_game_state(game_state)
+                    self._record_replay_step(game_id, action, game_state)
+                return game_state
+            except GameStateConflictError:
+                self.invalidate_cached_state(game_id)
+                if attempt >= self.MAX_ACTION_ATTEMPTS:
+                    raise
+                print(
+                    f"Concurrent update on game {game_id}, retrying "
+                    f"{action.action_type} (attempt {attempt + 1})"
+                )
+                game_state = self.games.get(game_id)
+                if not game_state:
+                    raise ValueError(f"Game {game_id} not found")
+            except BaseException:
+                # The shared cached copy may be half-mutated or ahead of the
+                # rolled back transaction
+                self.invalidate_cached_state(game_id)
+                raise
+
+        raise GameStateConflictError(game_id, game_state.version)
+
+    async def apply_action_requests(
+        self,
+        game_id: str,
+        requests: List[Dict[str, Any]],
+        build_action: BuildActionFn,
+        game_state: GameState,
+    ) -> Tuple[List[GameAction], List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Resolve and apply raw action requests in order, in memory only.
+
+        Each request is resolved against the state left by the previous one,
+        so a batch can move a card and then tap it. Returns the actions, one
+        replay step and one action history entry per action; nothing is
+        stored. Raises BatchActionError on the first failure, after which
+        game_state is partly mutated and must be discarded.
+        """
+        actions: List[GameAction] = []
+        steps: List[Dict[str, Any]] = []
+        entries: List[Dict[str, Any]] = []
+        for index, request in enumerate(requests):
+            try:
+                action, action_result = await build_action(
+                    game_id, request, game_state
+                )
+                await self.process_action(
+                    game_id, action, game_state=game_state, persist=False
+                )
+            except Exception as e:
+                raise BatchActionError(index, request.get("action_type"), e) from e
+            actions.append(action)
+            steps.append(self.build_replay_step(action, game_state))
+            entries.append(self.build_action_history_entry(action_result, game_state))
+        return actions, steps, entries
+
+    async def process_actions(
+        self,
+        game_id: str,
+        requests: List[Dict[str, Any]],
+        build_action: BuildActionFn,
+        game_state: Optional[GameState] = None,
+    ) -> Tuple[GameState, List[Dict[str, Any]]]:
+        """
+        Apply a batch of raw action requests all-or-nothing, saving once.
+
+        The batch runs against a copy of the state (see apply_action_requests)
+        and is stored in one unit of work: one state write, plus one replay
+        step and one history entry per action. If any action fails nothing is
+        stored and the loaded state is left untouched. A concurrent save
+        re-runs the whole batch on a fresh state, like process_action.
+
+        Returns the new state and the stored history entries.
+        """
+        if not requests:
+            raise ValueError("A batch needs at least one action")
+        if len(requests) > self.MAX_BATCH_ACTIONS:
+            raise ValueError(
+                f"A batch holds at most {self.MAX_BATCH_ACTIONS} actions"
+            )
+
+        for attempt in range(1, self.MAX_ACTION_ATTEMPTS + 1):
+            if game_state is None:
+                game_state = self.games.get(game_id)
+                if not game_state:
+                    raise ValueError(f"Game {game_id} not found")
+            persisted_version = game_state.version
+            working = game_state.model_copy(deep=True)
+            try:
+                _, steps, entries = await self.apply_action_requests(
+                    game_id, requests, build_action, working
+                )
+                working.updated_at = current_utc_datetime()
+                self.record_table_draws(working)
+                with self.unit_of_work():
+                    if isinstance(self.games, GameStatesProxy):
+                        self.games.compare_and_set(
+                            working, expected_version=persisted_version
+                        )
+                    else:
+                        self.games[game_id] = working
+                    for step in steps:
+                        self.store_replay_step(game_id, step)
+                    for entry in entries:
+                        self.store_action_history_entry(game_id, entry)
+                return working, entries
+            except GameStateConflictError:
+                self.invalidate_cached_state(game_id)
+                if attempt >= self.MAX_ACTION_ATTEMPTS:
+                    raise
+                print(
+                    f"Concurrent update on game {game_id}, retrying batch of "
+                    f"{len(requests)} actions (attempt {attempt + 1})"
+                )
+                game_state = None
+            except BaseException:
+                # The loaded state is untouched, but projections of the
+                # discarded copy were cached under version numbers it never got
+                projection_cache.forget(game_id)
+                raise
+
+        raise GameStateConflictError(game_id, persisted_version)
+
+    async def _apply_action(self, game_state: GameState, action: GameAction) -> None:
+        """Dispatch an action to its handler, mutating game_state in place."""
         action_map = {
             "play_card": self._play_card,
             "play_card_from_library": self._play_card_from_library,
@@ -846,18 +1235,31 @@ class SimpleGameEngine:
         else:
             raise ValueError(f"Unknown action_type: {action.action_type}")
 
-        self._touch_game_state(game_state)
-        self._record_replay_step(game_id, action, game_state)
-        return game_state
-
     def record_action_history(
-        self, game_id: str, entry: Dict[str, Any]
+        self,
+        game_id: str,
+        entry: Dict[str, Any],
+        game_state: Optional[GameState] = None,
     ) -> Optional[Dict[str, Any]]:
-        """Persist a single action history entry onto the game state."""
-        game_state = self.games.get(game_id)
+        """
+        Persist a single action history entry onto the game state.
+
+        Pass game_state when the caller already holds it to skip reloading the
+        state just to read phase and turn metadata.
+        """
+        if game_state is None:
+            game_state = self.games.get(game_id)
         if not game_state:
             return
 
+        history_entry = self.build_action_history_entry(entry, game_state)
+        self.store_action_history_entry(game_id, history_entry)
+        return history_entry
+
+    def build_action_history_entry(
+        self, entry: Dict[str, Any], game_state: GameState
+    ) -> Dict[str, Any]:
+        """Stamp an action history entry with timestamp, phase and turn data."""
         history_entry = dict(entry)
         history_entry.setdefault("timestamp", time.time())
         current_phase = getattr(game_state.phase, "value", game_state.phase)
@@ -878,12 +1280,18 @@ class SimpleGameEngine:
             history_entry.setdefault(
                 "turn_player_name", getattr(active_player, "name", None)
             )
+        return history_entry
 
-        if self._use_db and self._action_history:
+    def store_action_history_entry(
+        self, game_id: str, history_entry: Dict[str, Any]
+    ) -> None:
+        """Persist an entry built by build_action_history_entry."""
+        if self.writer and self.writer.accepts(HISTORY_ENTRY):
+            self.writer.submit(HISTORY_ENTRY, game_id, history_entry)
+        elif self._use_db and self._action_history:
             self._action_history.append(
                 game_id, history_entry, max_entries=self.MAX_ACTION_HISTORY
             )
-        return history_entry
 
     def add_chat_message(
         self, game_id: str, message: Dict[str, Any]
@@ -899,26 +1307,115 @@ class SimpleGameEngine:
             "timestamp": message.get("timestamp", time.time()),
         }
 
-        if self._use_db and self._chat_messages:
+        if self.writer and self.writer.accepts(CHAT_MESSAGE):
+            self.writer.submit(CHAT_MESSAGE, game_id, chat_entry)
+        elif self._use_db and self._chat_messages:
             self._chat_messages.append(
                 game_id, chat_entry, max_entries=self.MAX_CHAT_MESSAGES
             )
         return chat_entry
 
     def get_action_history(self, game_id: str) -> List[Dict[str, Any]]:
-        """Fetch action history from persistent storage."""
+        """Fetch action history from persistent storage, plus queued entries."""
         if self._use_db and self._action_history:
-            return self._action_history.get_recent(
-                game_id, limit=self.MAX_ACTION_HISTORY
-            )
+            with self.writer.read_lock():
+                entries = self._action_history.get_recent(
+                    game_id, limit=self.MAX_ACTION_HISTORY
+                )
+                entries.extend(self.writer.pending(HISTORY_ENTRY, game_id))
+            return entries[-self.MAX_ACTION_HISTORY :]
         return []
 
     def get_chat_log(self, game_id: str) -> List[Dict[str, Any]]:
-        """Fetch chat log from persistent storage."""
+        """Fetch chat log from persistent storage, plus queued messages."""
         if self._use_db and self._chat_messages:
-            return self._chat_messages.get_recent(game_id, limit=self.MAX_CHAT_MESSAGES)
+            with self.writer.read_lock():
+                entries = self._chat_messages.get_recent(
+                    game_id, limit=self.MAX_CHAT_MESSAGES
+                )
+                entries.extend(self.writer.pending(CHAT_MESSAGE, game_id))
+            return entries[-self.MAX_CHAT_MESSAGES :]
         return []
 
+    # Async reads for route handlers: awaited on the async pool when
+    # DB-backed, so the event loop is free during the round-trip. Mutations
+    # keep using the sync stores inside unit_of_work(); the action routes
+    # run them in game_action_executor, off the event loop.
+
+    async def fetch_game(self, game_id: str) -> Optional[GameState]:
+        """Async counterpart of games.get()."""
+        if self.async_games is not None:
+            return await self.async_games.get(game_id)
+        return self.games.get(game_id)
+
+    async def fetch_games(self) -> List[Tuple[str, GameState]]:
+        """Async counterpart of games.items()."""
+        if self.async_games is not None:
+            return await self.async_games.items()
+        return list(self.games.items())
+
+    async def fetch_game_setup(self, game_id: str) -> Optional[GameSetupStatus]:
+        """Async counterpart of get_game_setup_status()."""
+        if self.async_game_setups is not None:
+            return await self.async_game_setups.get(game_id)
+        return self.game_setups.get(game_id)
+
+    async def fetch_game_setups(self) -> List[Tuple[str, GameSetupStatus]]:
+        """Async counterpart of game_setups.items()."""
+        if self.async_game_setups is not None:
+            return await self.async_game_setups.items()
+        return list(self.game_setups.items())
+
+    async def fetch_game_summaries(
+        self, limit: int, offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """
+        A page of lobby entries, most recently updated first.
+
+        DB-backed engines read the game_summaries projection; no setup or
+        game state document is loaded.
+        """
+        if self._async_game_summaries is not None:
+            return await self._async_game_summaries.page(limit, offset)
+        return summarize_games(self.game_setups, self.games, limit, offset)
+
+    async def fetch_action_history(self, game_id: str) -> List[Dict[str, Any]]:
+        """Async counterpart of get_action_history()."""
+        if self._async_action_history is None:
+            return self.get_action_history(game_id)
+        entries = await self.writer.read_with_pending(
+            HISTORY_ENTRY,
+            game_id,
+            lambda: self._async_action_history.get_recent(
+                game_id, limit=self.MAX_ACTION_HISTORY
+            ),
+        )
+        if entries is None:
+            return await asyncio.to_thread(self.get_action_history, game_id)
+        return entries[-self.MAX_ACTION_HISTORY :]
+
+    async def fetch_chat_log(self, game_id: str) -> List[Dict[str, Any]]:
+        """Async counterpart of get_chat_log()."""
+        if self._async_chat_messages is None:
+            return self.get_chat_log(game_id)
+        entries = await self.writer.read_with_pending(
+            CHAT_MESSAGE,
+            game_id,
+            lambda: self._async_chat_messages.get_recent(
+                game_id, limit=self.MAX_CHAT_MESSAGES
+            ),
+        )
+        if entries is None:
+            return await asyncio.to_thread(self.get_chat_log, game_id)
+        return entries[-self.MAX_CHAT_MESSAGES :]
+
+    async def fetch_replay_step_count(self, game_id: str) -> int:
+        """Async counterpart of count_replay_steps()."""
+        if self._async_replays is None:
+            return await asyncio.to_thread(self.count_replay_steps, game_id)
+        await asyncio.to_thread(self.flush_pending_writes)
+        return await self._async_replays.count_steps(game_id)
+
     def _target_card(self, game_state: GameState, action: GameAction) -> None:
         """Handle targeting or untargeting a card using its persistent unique_id."""
         unique_id = action.additional_data.get("unique_id")
@@ -1003,22 +1500,41 @@ class SimpleGameEngine:
                 if a.get("source_id") != source_id and a.get("target_id") != source_id
             ]
 
-    def _shuffle_deck(self, deck_cards: List[DeckCard], owner_id: str) -> List[Card]:
+    def _game_rng(self, game_state: GameState) -> random.Random:
+        """
+        Return the next generator of the game's seeded action stream.
+
+        Each call derives a fresh generator from (seed, stream, draw counter)
+        and advances the counter stored on the state, so re-running the same
+        actions from the same seed reproduces every shuffle and new card id.
+        Dice and coin animations use the separate "table" stream (see
+        roll_table_die) and never disturb the action stream.
+        """
+        draw = game_state.rng_draws
+        game_state.rng_draws += 1
+        return random.Random(f"{game_state.rng_seed}:game:{draw}")
+
+    @staticmethod
+    def _random_unique_id(rng: random.Random) -> str:
+        """Card instance id drawn from a seeded generator (uuid4 hex format)."""
+        return f"{rng.getrandbits(128):032x}"
+
+    def _shuffle_deck(
+        self, deck_cards: List[DeckCard], owner_id: str, rng: random.Random
+    ) -> List[Card]:
         """
         Convert deck list to shuffled list of Card objects with persistent unique IDs
         and owner ID.
         """
-        import uuid
-
         cards = []
         for deck_card in deck_cards:
             for _ in range(deck_card.quantity):
                 card_copy = deck_card.card.model_copy(deep=True)
-                card_copy.unique_id = uuid.uuid4().hex
+                card_copy.unique_id = self._random_unique_id(rng)
                 card_copy.owner_id = owner_id
                 cards.append(card_copy)
 
-        random.shuffle(cards)
+        rng.shuffle(cards)
         return cards
 
     def _draw_cards(self, player: Player, count: int) -> None:
@@ -1041,7 +1557,9 @@ class SimpleGameEngine:
         filtered = [card for card in look_zone if card.unique_id != unique_id]
         player.look_zone = filtered
 
-    def _initialize_commander_zone(self, player: Player, deck: Deck) -> None:
+    def _initialize_commander_zone(
+        self, player: Player, deck: Deck, rng: random.Random
+    ) -> None:
         """Populate the command zone with designated commanders."""
         commanders = getattr(deck, "commanders", []) or []
         player.commander_zone = []
@@ -1056,7 +1574,7 @@ class SimpleGameEngine:
             else:
                 commander_copy = commander.copy(deep=True)  # type: ignore[attr-defined]
 
-            commander_copy.unique_id = uuid.uuid4().hex
+            commander_copy.unique_id = self._random_unique_id(rng)
             commander_copy.owner_id = player.id
             commander_copy.is_commander = True
             commander_copy.tapped = False
@@ -2011,7 +2529,9 @@ class SimpleGameEngine:
         else:
             duplicated_card = original_card.copy(deep=True)  # type: ignore[attr-defined]
 
-        duplicated_card.unique_id = uuid.uuid4().hex
+        duplicated_card.unique_id = self._random_unique_id(
+            self._game_rng(game_state)
+        )
         duplicated_card.tapped = False
         duplicated_card.targeted = False
         duplicated_card.attached_to = None
@@ -2169,7 +2689,7 @@ class SimpleGameEngine:
         """Shuffle a player's library."""
         player = self._get_player(game_state, action.player_id)
 
-        random.shuffle(player.library)
+        self._game_rng(game_state).shuffle(player.library)
 
         print(
             f"Player {action.player_id} shuffled their library "
@@ -2259,7 +2779,7 @@ class SimpleGameEngine:
         # Perform the mulligan: return hand to library and reshuffle
         player.library.extend(player.hand)
         player.hand = []
-        random.shuffle(player.library)
+        self._game_rng(game_state).shuffle(player.library)
 
         # Draw 7 new cards
         self._draw_cards(player, 7)
@@ -2372,6 +2892,7 @@ class SimpleGameEngine:
                 "message": f"Game started! {first_player_name} takes the first turn.",
                 "origin": "engine",
             },
+            game_state=game_state,
         )
 
         # Log the begin phase entry
@@ -2902,7 +3423,6 @@ class SimpleGameEngine:
     ) -> None:
         """Handle searching for a card and adding it to the specified zone."""
         from app.backend.services.card_service import CardService
-        import uuid
 
         card_name = action.additional_data.get("card_name")
         target_zone = action.additional_data.get("target_zone")
@@ -2929,7 +3449,7 @@ class SimpleGameEngine:
             card = Card(**card_data)
 
             # Generate unique ID and set owner
-            card.unique_id = uuid.uuid4().hex
+            card.unique_id = self._random_unique_id(self._game_rng(game_state))
             card.owner_id = action.player_id
 
             # Mark as token if requested
@@ -2947,7 +3467,6 @@ class SimpleGameEngine:
 
     async def _create_token(self, game_state: GameState, action: GameAction) -> None:
         """Handle creating a token creature by fetching its data from Scryfall."""
-        import uuid
         from app.backend.services.card_service import CardService
         from app.backend.models.game import Card
 
@@ -2971,7 +3490,7 @@ class SimpleGameEngine:
             token = Card(**card_data)
 
             # Override certain properties for the token instance
-            token.unique_id = uuid.uuid4().hex
+            token.unique_id = self._random_unique_id(self._game_rng(game_state))
             token.owner_id = action.player_id
             token.is_token = True
 
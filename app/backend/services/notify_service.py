@@ -1,17 +1,302 @@
 """
 PostgreSQL NOTIFY service for cross-worker communication.
 
-This service allows API workers to send notifications to the WebSocket worker
-via PostgreSQL's LISTEN/NOTIFY mechanism.
+This service allows API workers to send notifications to the WebSocket workers
+via PostgreSQL's LISTEN/NOTIFY mechanism. Every game or draft room has its own
+channel (room_channel), so a WS process only LISTENs to the rooms it holds
+connections for.
+
+Async callers go through a per-process NotifyPublisher that keeps one
+AsyncConnection open and sends every notification queued while the previous
+batch was in flight as a single statement (one transaction, one round-trip).
+The synchronous helpers still open a connection per call and are meant for
+scripts and other code running outside the event loop.
+
+Payloads over MAX_NOTIFY_PAYLOAD bytes are written to the notify_outbox table
+in the same statement, and the NOTIFY only carries {"outbox_id": id}; the WS
+listener reads the row once and fans it out (see fetch_outbox_payload).
+Outbox rows older than OUTBOX_RETENTION_SECONDS are pruned by the publisher.
 """
 
+import asyncio
+import hashlib
 import json
-from typing import Any, Dict
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 import psycopg
 
 from app.backend.core.db import get_database_url
 
+ROOM_CHANNEL_PREFIX = "ws_room:"
+# Channel names are identifiers, limited to 63 bytes
+MAX_CHANNEL_LENGTH = 63
+
+# NOTIFY payloads are limited to 8000 bytes
+MAX_NOTIFY_PAYLOAD = 7500
+# Notifications sent in one statement at most
+MAX_NOTIFY_BATCH = 100
+# Publish latencies kept for the percentile metrics
+LATENCY_WINDOW = 1000
+RECONNECT_DELAY_SECONDS = 1.0
+MAX_PUBLISH_ATTEMPTS = 3
+# Outbox rows only need to outlive the listeners' fetch
+OUTBOX_RETENTION_SECONDS = 300
+OUTBOX_PRUNE_INTERVAL_SECONDS = 60
+
+# Notifications in position order; the spilled ones are stored in the outbox
+# under ids drawn in that same order, so a burst keeps its ordering
+PUBLISH_SQL = """
+    WITH batch AS (
+        SELECT channel, payload, position,
+               CASE WHEN spill THEN nextval('notify_outbox_id_seq') END AS outbox_id
+        FROM unnest(%s::text[], %s::text[], %s::boolean[])
+            WITH ORDINALITY AS n(channel, payload, spill, position)
+    ),
+    stored AS (
+        INSERT INTO notify_outbox (id, channel, payload)
+        SELECT outbox_id, channel, payload FROM batch WHERE outbox_id IS NOT NULL
+    )
+    SELECT pg_notify(
+        channel,
+        CASE WHEN outbox_id IS NULL THEN payload
+             ELSE json_build_object('outbox_id', outbox_id)::text END
+    )
+    FROM batch
+    ORDER BY position
+"""
+
+
+def room_channel(room_id: str) -> str:
+    """NOTIFY channel of a game or draft room."""
+    channel = f"{ROOM_CHANNEL_PREFIX}{room_id}"
+    if len(channel.encode("utf-8")) > MAX_CHANNEL_LENGTH:
+        digest = hashlib.sha1(room_id.encode("utf-8")).hexdigest()
+        channel = f"{ROOM_CHANNEL_PREFIX}{digest}"
+    return channel
+
+
+def _game_payload(
+    game_id: str, message: Dict[str, Any], origin: Optional[str] = None
+) -> str:
+    payload = {
+        "game_id": game_id,
+        "message": message,
+    }
+    if origin:
+        payload["origin"] = origin
+    return json.dumps(payload)
+
+
+def _draft_payload(
+    room_id: str, message: Dict[str, Any], origin: Optional[str] = None
+) -> str:
+    payload = {
+        "room_id": room_id,
+        "message": message,
+    }
+    if origin:
+        payload["origin"] = origin
+    return json.dumps(payload)
+
+
+def _spills(payload: str) -> bool:
+    """True when payload is too large for NOTIFY and goes through the outbox."""
+    return len(payload.encode("utf-8")) > MAX_NOTIFY_PAYLOAD
+
+
+def _publish_params(
+    notifications: List[Tuple[str, str]],
+) -> Tuple[List[str], List[str], List[bool]]:
+    channels = [channel for channel, _ in notifications]
+    payloads = [payload for _, payload in notifications]
+    return channels, payloads, [_spills(payload) for payload in payloads]
+
+
+async def fetch_outbox_payload(
+    conn: psycopg.AsyncConnection, outbox_id: int
+) -> Optional[str]:
+    """Read the payload of a spilled notification, or None once pruned."""
+    cur = await conn.execute(
+        "SELECT payload FROM notify_outbox WHERE id = %s", (outbox_id,)
+    )
+    row = await cur.fetchone()
+    return row[0] if row else None
+
+
+class NotifyPublisher:
+    """
+    Batching pg_notify publisher over one long-lived AsyncConnection.
+
+    publish() queues a notification and waits until the statement carrying
+    it has run. A single sender task takes everything queued (up to
+    MAX_NOTIFY_BATCH) and sends it with one statement (PUBLISH_SQL), so
+    bursts cost one round-trip. On a connection error the batch is
+    retried on a fresh connection, up to MAX_PUBLISH_ATTEMPTS times.
+    """
+
+    def __init__(self, max_batch: int = MAX_NOTIFY_BATCH):
+        self.max_batch = max_batch
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._conn: Optional[psycopg.AsyncConnection] = None
+        self._latencies: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self.published = 0
+        self.batches = 0
+        self.reconnects = 0
+        self.failures = 0
+        self.spilled = 0
+        self._last_prune = 0.0
+        # Notification held back to start the next batch (see _take_batch)
+        self._held: Optional[Tuple] = None
+
+    def _ensure_started(self) -> asyncio.Queue:
+        if self._task is None or self._task.done():
+            self._queue = asyncio.Queue()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        return self._queue
+
+    async def publish(self, channel: str, payload: str) -> None:
+        """Send NOTIFY channel, payload; raises if it could not be delivered."""
+        done = asyncio.get_running_loop().create_future()
+        self._ensure_started().put_nowait(
+            (channel, payload, done, time.perf_counter())
+        )
+        await done
+
+    async def stop(self) -> None:
+        """Send what is queued, then close the connection."""
+        task, self._task = self._task, None
+        if task is not None:
+            if self._queue is not None:
+                await self._queue.join()
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await self._close()
+
+    async def _connection(self) -> psycopg.AsyncConnection:
+        if self._conn is None or self._conn.closed:
+            if self._conn is not None:
+                self.reconnects += 1
+            self._conn = await psycopg.AsyncConnection.connect(
+                get_database_url(), autocommit=True
+            )
+        return self._conn
+
+    async def _close(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            try:
+                await conn.close()
+            except Exception:
+                pass
+
+    def _take_batch(self, first: Tuple) -> List[Tuple]:
+        batch = [first]
+        seen = {first[:2]}
+        while len(batch) < self.max_batch and not self._queue.empty():
+            item = self._queue.get_nowait()
+            batch.append(item)
+            # PostgreSQL folds identical notifications sent in one
+            # transaction; a repeat starts the next batch instead
+            if item[:2] in seen:
+                self._held = batch.pop()
+                break
+            seen.add(item[:2])
+        return batch
+
+    async def _run(self) -> None:
+        queue = self._queue
+        while True:
+            first, self._held = self._held, None
+            batch = self._take_batch(first or await queue.get())
+            try:
+                error = await self._send(batch)
+                now = time.perf_counter()
+                for _, _, done, queued_at in batch:
+                    if done.done():
+                        continue
+                    if error is None:
+                        self._latencies.append(now - queued_at)
+                        done.set_result(None)
+                    else:
+                        done.set_exception(error)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _send(self, batch: List[Tuple]) -> Optional[Exception]:
+        params = _publish_params([item[:2] for item in batch])
+        spilled = sum(params[2])
+        for attempt in range(1, MAX_PUBLISH_ATTEMPTS + 1):
+            try:
+                conn = await self._connection()
+                await conn.execute(PUBLISH_SQL, params)
+                self.published += len(batch)
+                self.batches += 1
+                self.spilled += spilled
+                if spilled:
+                    await self._prune_outbox(conn)
+                return None
+            except psycopg.OperationalError as e:
+                print(f"[NotifyPublisher] Connection lost (attempt {attempt}): {e}")
+                await self._close()
+                if attempt >= MAX_PUBLISH_ATTEMPTS:
+                    self.failures += len(batch)
+                    return e
+                await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+            except Exception as e:
+                self.failures += len(batch)
+                return e
+
+    async def _prune_outbox(self, conn: psycopg.AsyncConnection) -> None:
+        """Delete expired outbox rows, at most once per prune interval."""
+        now = time.monotonic()
+        if now - self._last_prune < OUTBOX_PRUNE_INTERVAL_SECONDS:
+            return
+        self._last_prune = now
+        try:
+            await conn.execute(
+                "DELETE FROM notify_outbox"
+                " WHERE created_at < NOW() - %s * INTERVAL '1 second'",
+                (OUTBOX_RETENTION_SECONDS,),
+            )
+        except psycopg.Error as e:
+            print(f"[NotifyPublisher] Outbox prune failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        latencies = sorted(self._latencies)
+
+        def percentile(fraction: float) -> Optional[float]:
+            if not latencies:
+                return None
+            index = min(len(latencies) - 1, int(fraction * len(latencies)))
+            return round(latencies[index] * 1000, 3)
+
+        depth = self._queue.qsize() if self._queue is not None else 0
+        return {
+            "connected": self._conn is not None and not self._conn.closed,
+            "queue_depth": depth + (self._held is not None),
+            "published": self.published,
+            "batches": self.batches,
+            "avg_batch_size": (
+                round(self.published / self.batches, 2) if self.batches else None
+            ),
+            "reconnects": self.reconnects,
+            "failures": self.failures,
+            "spilled_to_outbox": self.spilled,
+            "latency_ms_p50": percentile(0.5),
+            "latency_ms_p95": percentile(0.95),
+            "latency_ms_max": percentile(1.0),
+        }
+
+
+notify_publisher = NotifyPublisher()
+
 
 def notify_game_update(game_id: str, message: Dict[str, Any]) -> None:
     """
@@ -21,30 +306,9 @@ def notify_game_update(game_id: str, message: Dict[str, Any]) -> None:
         game_id: The game ID to broadcast to
         message: The message dict to send to clients
     """
-    payload = json.dumps(
-        {
-            "game_id": game_id,
-            "message": message,
-        }
-    )
-
+    notification = (room_channel(game_id), _game_payload(game_id, message))
     with psycopg.connect(get_database_url()) as conn:
-        # NOTIFY payload is limited to 8000 bytes, but game states can be larger
-        # For large payloads, we just notify that an update happened
-        # and the WS server will fetch the full state from DB
-        if len(payload) > 7500:
-            # Send a lightweight notification - client will request full state
-            payload = json.dumps(
-                {
-                    "game_id": game_id,
-                    "message": {
-                        "type": "state_changed",
-                        "game_id": game_id,
-                    },
-                }
-            )
-
-        conn.execute("SELECT pg_notify('game_update', %s)", (payload,))
+        conn.execute(PUBLISH_SQL, _publish_params([notification]))
         conn.commit()
 
 
@@ -56,46 +320,32 @@ def notify_draft_update(room_id: str, message: Dict[str, Any]) -> None:
         room_id: The draft room ID to broadcast to
         message: The message dict to send to clients
     """
-    payload = json.dumps(
-        {
-            "room_id": room_id,
-            "message": message,
-        }
-    )
-
+    notification = (room_channel(room_id), _draft_payload(room_id, message))
     with psycopg.connect(get_database_url()) as conn:
-        if len(payload) > 7500:
-            payload = json.dumps(
-                {
-                    "room_id": room_id,
-                    "message": {
-                        "type": "draft_state_changed",
-                        "room_id": room_id,
-                    },
-                }
-            )
-
-        conn.execute("SELECT pg_notify('draft_update', %s)", (payload,))
+        conn.execute(PUBLISH_SQL, _publish_params([notification]))
         conn.commit()
 
 
-async def async_notify_game_update(game_id: str, message: Dict[str, Any]) -> None:
+async def async_notify_game_update(
+    game_id: str, message: Dict[str, Any], origin: Optional[str] = None
+) -> None:
     """
     Async version of notify_game_update.
-    Uses a thread pool to avoid blocking the event loop.
+    Publishes through the shared NotifyPublisher connection; listeners skip
+    notifications carrying their own origin.
     """
-    import asyncio
-
-    loop = asyncio.get_event_loop()
-    await loop.run_in_executor(None, notify_game_update, game_id, message)
+    await notify_publisher.publish(
+        room_channel(game_id), _game_payload(game_id, message, origin)
+    )
 
 
-async def async_notify_draft_update(room_id: str, message: Dict[str, Any]) -> None:
+async def async_notify_draft_update(
+    room_id: str, message: Dict[str, Any], origin: Optional[str] = None
+) -> None:
     """
     Async version of notify_draft_update.
-    Uses a thread pool to avoid blocking the event loop.
+    Publishes through the shared NotifyPublisher connection.
     """
-    import asyncio
-
-    loop = asyncio.get_event_loop()
-    await loop.run_in_executor(None, notify_draft_update, room_id, message)
+    await notify_publisher.publish(
+        room_channel(room_id), _draft_payload(room_id, message, origin)
+    )
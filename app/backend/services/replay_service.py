@@ -0,0 +1,191 @@
+"""
+Event-sourced replays: store the inputs of a game, rebuild its states.
+
+Instead of one compact state per step, a game's log holds a "setup" event
+(RNG seed, submitted decks, setup) and one "action" event per GameAction the
+engine applied. Because shuffles, coin flips and new card ids are all drawn
+from the game's seeded RNG, re-running the log through an in-memory
+SimpleGameEngine reproduces every step.
+
+Enabled with REPLAY_MODE=events; the default stays snapshot replays.
+"""
+
+import time
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from app.backend.models.game import Deck, GameAction, GameSetupStatus
+from app.backend.repositories.dict_proxies import ReplayEventsProxy
+
+ReplayEventStore = ReplayEventsProxy | Dict[str, List[Dict[str, Any]]]
+
+
+class EventSourcedReplays:
+    """
+    Replay store recording setup and action events instead of states.
+
+    Exposes the subset of the ReplaysProxy interface the engine writes
+    through (append_step, __contains__, __delitem__, keys); timelines are read
+    with the async get_timeline since rebuilding runs engine actions.
+    """
+
+    def __init__(self, events: Optional[ReplayEventStore] = None):
+        self.events: ReplayEventStore = (
+            events if events is not None else ReplayEventsProxy()
+        )
+
+    def __contains__(self, game_id: str) -> bool:
+        return game_id in self.events
+
+    def __delitem__(self, game_id: str) -> None:
+        if isinstance(self.events, ReplayEventsProxy):
+            del self.events[game_id]
+        else:
+            self.events.pop(game_id, None)
+
+    def keys(self) -> List[str]:
+        return list(self.events.keys())
+
+    def _append(
+        self,
+        game_id: str,
+        event_type: str,
+        payload: Dict[str, Any],
+        timestamp: Optional[float],
+    ) -> None:
+        if isinstance(self.events, ReplayEventsProxy):
+            self.events.append(game_id, event_type, payload, timestamp=timestamp)
+        else:
+            self.events.setdefault(game_id, []).append(
+                {"type": event_type, "payload": payload, "timestamp": timestamp}
+            )
+
+    def record_setup(
+        self,
+        game_id: str,
+        seed: int,
+        player_decks: Dict[str, Deck],
+        setup: GameSetupStatus,
+        timestamp: Optional[float] = None,
+    ) -> None:
+        """Start the log of game_id with everything needed to deal the game."""
+        payload = {
+            "seed": seed,
+            "decks": {
+                seat_id: deck.model_dump(mode="json")
+                for seat_id, deck in player_decks.items()
+            },
+            "setup": setup.model_dump(mode="json"),
+        }
+        self._append(
+            game_id, "setup", payload, timestamp if timestamp is not None else time.time()
+        )
+
+    def append_step(
+        self,
+        game_id: str,
+        step_data: Dict[str, Any],
+        state_version: Optional[int] = None,
+    ) -> None:
+        """Record the action of a replay step; its state is not stored."""
+        action = step_data.get("action")
+        if not action:
+            return
+        self._append(game_id, "action", action, step_data.get("timestamp"))
+
+    def count_steps(self, game_id: str) -> int:
+        """One step per event, as long as every event can be re-applied."""
+        if game_id not in self.events:
+            return 0
+        return len(self.events[game_id])
+
+    async def get_timeline(self, game_id: str) -> Optional[List[Dict[str, Any]]]:
+        """Rebuild the replay timeline of game_id, or None without events."""
+        if game_id not in self.events:
+            return None
+        return [step async for step in self.iter_steps(game_id)]
+
+    async def iter_steps(
+        self, game_id: str, from_step: int = 0, to_step: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield rebuilt steps from_step (inclusive) to to_step (exclusive).
+
+        Earlier steps still have to be re-run, but only the current one is
+        kept in memory.
+        """
+        if game_id not in self.events:
+            return
+        index = 0
+        async for step in iter_rebuilt_steps(game_id, self.events[game_id]):
+            if to_step is not None and index >= to_step:
+                break
+            if index >= from_step:
+                yield step
+            index += 1
+
+
+async def iter_rebuilt_steps(
+    game_id: str, events: List[Dict[str, Any]]
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Re-run a replay event log through an in-memory engine.
+
+    Yields the same compact steps the snapshot store would have recorded,
+    with the original timestamps (created_at/updated_at are approximated by
+    the event times). If an event can no longer be applied the timeline
+    stops at the last step that could be rebuilt.
+    """
+    # Imported here: the engine itself imports this module
+    from app.backend.services.game_engine import SimpleGameEngine
+
+    engine = SimpleGameEngine(use_db=False)
+    created_at = None
+    for index, event in enumerate(events):
+        payload = event["payload"]
+        try:
+            if event["type"] == "setup":
+                setup = GameSetupStatus.model_validate(payload["setup"])
+                decks = {
+                    seat_id: Deck.model_validate(deck)
+                    for seat_id, deck in payload["decks"].items()
+                }
+                engine.game_setups[game_id] = setup
+                engine._initialize_game_from_setup(
+                    game_id, decks, setup, seed=payload["seed"]
+                )
+            else:
+                await engine.process_action(
+                    game_id, GameAction.model_validate(payload)
+                )
+        except Exception as e:
+            print(f"Replay rebuild of {game_id} stopped at event {index}: {e}")
+            return
+
+        # The engine recorded exactly one step; don't let them pile up
+        step = engine.replays[game_id].pop()
+        # Wall-clock fields come from the recorded events, not from the rebuild
+        timestamp = event.get("timestamp")
+        if created_at is None:
+            created_at = _isoformat(timestamp)
+        step["timestamp"] = timestamp
+        if timestamp is not None and "updated_at" in step["state"]:
+            step["state"] = {
+                **step["state"],
+                "created_at": created_at,
+                "updated_at": _isoformat(timestamp),
+            }
+        yield step
+
+
+async def rebuild_timeline(
+    game_id: str, events: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """Re-run a whole replay event log (see iter_rebuilt_steps)."""
+    return [step async for step in iter_rebuilt_steps(game_id, events)]
+
+
+def _isoformat(timestamp: Optional[float]) -> Optional[str]:
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
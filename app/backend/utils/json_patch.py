@@ -0,0 +1,120 @@
+"""Minimal JSON Patch (RFC 6902) diff and apply for replay deltas.
+
+Only the add, remove and replace operations are produced and understood,
+which is all that is needed to go from one JSON document to the next.
+"""
+
+from typing import Any, Dict, List
+
+JsonPatch = List[Dict[str, Any]]
+
+
+def _escape(token: Any) -> str:
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def make_patch(source: Any, target: Any) -> JsonPatch:
+    """
+    Return the operations that turn source into target.
+
+    Dicts are diffed key by key. Lists are diffed element by element over
+    their common length, then trimmed or extended at the end; when that would
+    take more operations than the list has elements it is replaced whole.
+    """
+    patch: JsonPatch = []
+    _diff(source, target, "", patch)
+    return patch
+
+
+def _diff(source: Any, target: Any, path: str, patch: JsonPatch) -> None:
+    if source is target:
+        return
+    if isinstance(source, dict) and isinstance(target, dict):
+        for key, value in source.items():
+            child = f"{path}/{_escape(key)}"
+            if key not in target:
+                patch.append({"op": "remove", "path": child})
+            else:
+                _diff(value, target[key], child, patch)
+        for key, value in target.items():
+            if key not in source:
+                patch.append(
+                    {"op": "add", "path": f"{path}/{_escape(key)}", "value": value}
+                )
+        return
+    if isinstance(source, list) and isinstance(target, list):
+        sub_patch: JsonPatch = []
+        common = min(len(source), len(target))
+        for index in range(common):
+            _diff(source[index], target[index], f"{path}/{index}", sub_patch)
+        # Remove from the end so earlier indices stay valid
+        for index in range(len(source) - 1, common - 1, -1):
+            sub_patch.append({"op": "remove", "path": f"{path}/{index}"})
+        for index in range(common, len(target)):
+            sub_patch.append({"op": "add", "path": f"{path}/-", "value": target[index]})
+        if len(sub_patch) > max(1, len(target)):
+            patch.append({"op": "replace", "path": path, "value": target})
+        else:
+            patch.extend(sub_patch)
+        return
+    if source != target or type(source) is not type(target):
+        patch.append({"op": "replace", "path": path, "value": target})
+
+
+def apply_patch(document: Any, patch: JsonPatch) -> Any:
+    """
+    Return a new document with patch applied.
+
+    Containers along each modified path are copied, everything else is
+    shared with the input, so the input document is never mutated.
+    """
+    result = document
+    for operation in patch:
+        result = _apply_operation(result, operation)
+    return result
+
+
+def _apply_operation(document: Any, operation: Dict[str, Any]) -> Any:
+    path = operation["path"]
+    op = operation["op"]
+    if path == "":
+        if op == "remove":
+            return None
+        return operation["value"]
+
+    tokens = [_unescape(token) for token in path.split("/")[1:]]
+    root = _copy_container(document)
+    parent = root
+    for token in tokens[:-1]:
+        key = int(token) if isinstance(parent, list) else token
+        child = _copy_container(parent[key])
+        parent[key] = child
+        parent = child
+
+    last = tokens[-1]
+    if isinstance(parent, list):
+        if op == "remove":
+            del parent[int(last)]
+        elif last == "-":
+            parent.append(operation["value"])
+        elif op == "add":
+            parent.insert(int(last), operation["value"])
+        else:
+            parent[int(last)] = operation["value"]
+    elif op == "remove":
+        del parent[last]
+    else:
+        parent[last] = operation["value"]
+    return root
+
+
+def _copy_container(value: Any) -> Any:
+    if isinstance(value, dict):
+        return dict(value)
+    if isinstance(value, list):
+        return list(value)
+    return value
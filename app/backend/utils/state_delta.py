@@ -0,0 +1,126 @@
+"""Compact game state deltas for WebSocket broadcasts.
+
+A delta lists what changed between two to_compact_ui_data payloads:
+
+    {
+        "fields": {top-level key: new value},
+        "players": {player id: {"fields": {...}, "zones": {zone: [ids]}}},
+        "cards": {unique_id: card instance},    # added or changed
+        "removed_cards": [unique_id, ...],
+    }
+
+Changed values are sent whole (a zone list, a card instance, combat_state),
+which keeps applying a delta trivial on the client (see state-delta.ts).
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+StateDelta = Dict[str, Any]
+
+_NESTED_KEYS = ("players", "card_instances")
+
+
+def state_order(message: Dict[str, Any]) -> Tuple[str, float]:
+    """
+    Sort key of a state message: (created_at of its game, seq).
+
+    seq is the GameState version, which starts over when a game is restarted
+    in the same room (a new GameState with a new created_at), so it only
+    orders the states of one game. created_at is an ISO timestamp in UTC and
+    compares as a string. Messages without a seq sort first.
+    """
+    state = message.get("game_state") or {}
+    seq = message.get("seq")
+    return (
+        state.get("created_at") or "",
+        seq if isinstance(seq, (int, float)) else float("-inf"),
+    )
+
+
+def diff_compact_state(
+    previous: Dict[str, Any], current: Dict[str, Any]
+) -> Optional[StateDelta]:
+    """
+    Return the delta from previous to current, or None when the client needs
+    a full snapshot instead (seats or top-level keys added or removed).
+    """
+    if previous.keys() != current.keys():
+        return None
+    previous_players = previous.get("players", [])
+    current_players = current.get("players", [])
+    if [p["id"] for p in previous_players] != [p["id"] for p in current_players]:
+        return None
+
+    delta: StateDelta = {
+        "fields": {
+            key: value
+            for key, value in current.items()
+            if key not in _NESTED_KEYS and previous[key] != value
+        }
+    }
+
+    players: Dict[str, Dict[str, Any]] = {}
+    for before, after in zip(previous_players, current_players):
+        changes: Dict[str, Any] = {}
+        fields = {
+            key: value
+            for key, value in after.items()
+            if key != "zones" and before.get(key) != value
+        }
+        zones = {
+            zone: ids
+            for zone, ids in after.get("zones", {}).items()
+            if before.get("zones", {}).get(zone) != ids
+        }
+        if fields:
+            changes["fields"] = fields
+        if zones:
+            changes["zones"] = zones
+        if changes:
+            players[after["id"]] = changes
+    if players:
+        delta["players"] = players
+
+    previous_cards = previous.get("card_instances", {})
+    current_cards = current.get("card_instances", {})
+    cards = {
+        unique_id: instance
+        for unique_id, instance in current_cards.items()
+        # Untouched cards share their instance dict across projections
+        if previous_cards.get(unique_id) is not instance
+        and previous_cards.get(unique_id) != instance
+    }
+    removed = [
+        unique_id for unique_id in previous_cards if unique_id not in current_cards
+    ]
+    if cards:
+        delta["cards"] = cards
+    if removed:
+        delta["removed_cards"] = removed
+    return delta
+
+
+def apply_compact_delta(state: Dict[str, Any], delta: StateDelta) -> Dict[str, Any]:
+    """Return a new compact state with delta applied; state is left untouched."""
+    result = {**state, **delta.get("fields", {})}
+
+    player_changes = delta.get("players", {})
+    if player_changes:
+        players = []
+        for player in state.get("players", []):
+            changes = player_changes.get(player["id"])
+            if changes:
+                player = {
+                    **player,
+                    **changes.get("fields", {}),
+                    "zones": {**player.get("zones", {}), **changes.get("zones", {})},
+                }
+            players.append(player)
+        result["players"] = players
+
+    if "cards" in delta or "removed_cards" in delta:
+        cards = {**state.get("card_instances", {}), **delta.get("cards", {})}
+        for unique_id in delta.get("removed_cards", []):
+            cards.pop(unique_id, None)
+        result["card_instances"] = cards
+    return result
@@ -0,0 +1,97 @@
+"""
+Run several WebSocket server processes, one port each.
+
+ConnectionManager state is process-local, so the WS tier cannot use uvicorn's
+--workers (the kernel would spread a room's sockets over every worker).
+Instead each process gets its own port, starting at WS_BASE_PORT, and nginx
+picks the process with a consistent hash on the room id (see nginx.conf).
+Every connection of a room therefore lands on the same process, which only
+LISTENs to the NOTIFY channels of its own rooms.
+
+Usage:
+    python -m app.backend.ws_cluster --processes 4 --base-port 8001
+
+If one process exits, the others are stopped too so the container restarts
+as a whole and nginx never hashes rooms to a dead port for long.
+"""
+
+import argparse
+import os
+import signal
+import subprocess
+import sys
+import time
+from typing import List
+
+from app.backend.core.config import settings
+
+
+def _spawn(host: str, port: int, processes: int) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "MANAFORGE_WS_WORKER": "1",
+        "WS_PROCESSES": str(processes),
+    }
+    return subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "app.backend.ws_main:app",
+            "--host",
+            host,
+            "--port",
+            str(port),
+            "--workers",
+            "1",
+        ],
+        env=env,
+    )
+
+
+def _terminate(children: List[subprocess.Popen]) -> None:
+    for child in children:
+        if child.poll() is None:
+            child.terminate()
+    for child in children:
+        try:
+            child.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            child.kill()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the sharded WebSocket tier")
+    parser.add_argument("--processes", type=int, default=settings.ws_processes)
+    parser.add_argument("--base-port", type=int, default=settings.ws_base_port)
+    parser.add_argument("--host", default=settings.host)
+    args = parser.parse_args()
+
+    children = [
+        _spawn(args.host, args.base_port + index, args.processes)
+        for index in range(args.processes)
+    ]
+    print(
+        f"[WS Cluster] Started {args.processes} processes on ports "
+        f"{args.base_port}-{args.base_port + args.processes - 1}"
+    )
+
+    def stop(signum, frame):
+        _terminate(children)
+        sys.exit(0)
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    while True:
+        for child in children:
+            code = child.poll()
+            if code is not None:
+                print(f"[WS Cluster] Process {child.pid} exited with {code}")
+                _terminate(children)
+                sys.exit(code or 1)
+        time.sleep(1)
+
+
+if __name__ == "__main__":
+    main()
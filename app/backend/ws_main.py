@@ -3,83 +3,186 @@ Dedicated WebSocket server.
 
 This is a separate FastAPI application that handles only WebSocket connections.
 It listens to PostgreSQL NOTIFY events to broadcast game state updates.
+
+Several of these processes can run side by side (see ws_cluster.py); nginx
+pins each room to one of them and each listens only to its rooms' channels.
 """
 
 import asyncio
 import json
 import os
 from contextlib import asynccontextmanager
+from typing import Dict, Set
 
 import psycopg
 from fastapi import FastAPI
+from psycopg import sql
 
-from app.backend.core.db import get_database_url
+from app.backend.core.config import settings
+from app.backend.core.db import close_async_pool, get_database_url
 
 # Mark this process as the WS worker for the decorators module
 os.environ["MANAFORGE_WS_WORKER"] = "1"
 
+from app.backend.api.decorators import broadcast_coalescer  # noqa: E402
+from app.backend.api.routes import actor_runtime, game_engine  # noqa: E402
+from app.backend.models.projection_cache import projection_cache  # noqa: E402
+from app.backend.repositories.game_state_cache import game_state_cache  # noqa: E402
 from app.backend.api.websocket import websocket_router, manager  # noqa: E402
+from app.backend.services.action_executor import game_action_executor  # noqa: E402
+from app.backend.services.notify_service import (  # noqa: E402
+    fetch_outbox_payload,
+    notify_publisher,
+    room_channel,
+)
+
+
+# How long the listener waits for notifications before applying new
+# LISTEN/UNLISTEN commands; bounds how long a first join waits
+LISTEN_POLL_SECONDS = 0.2
+# A join never waits longer than this for its room's LISTEN
+SUBSCRIBE_TIMEOUT_SECONDS = 2.0
 
 
-async def listen_for_notifications():
+class RoomNotifyListener:
     """
-    Listen for PostgreSQL NOTIFY events and broadcast to WebSocket clients.
+    LISTENs to the NOTIFY channel of every room with a connection here.
 
-    Channels:
-    - game_update:{game_id} - Broadcast game state to all clients in a game
-    - draft_update:{room_id} - Broadcast draft state to all clients in a room
+    nginx routes each room to one WS process (consistent hash on the room
+    id), so each process only receives the notifications of the rooms it
+    owns. The connection manager subscribes a room on its first connection
+    and unsubscribes it with the last; the listener applies the changes
+    between notify polls.
+
+    Payloads too large for NOTIFY arrive as {"outbox_id": id}; the payload is
+    read from notify_outbox once, on a second connection, then fanned out.
     """
-    db_url = get_database_url()
 
-    while True:
+    def __init__(self):
+        self._rooms: Set[str] = set()
+        self._listening: Dict[str, str] = {}
+        self._waiters: Dict[str, asyncio.Future] = {}
+
+    @property
+    def rooms(self) -> int:
+        return len(self._listening)
+
+    async def subscribe(self, room_id: str) -> None:
+        """Wait until the room's channel is LISTENed to (bounded wait)."""
+        self._rooms.add(room_id)
+        if room_id in self._listening:
+            return
+        waiter = self._waiters.get(room_id)
+        if waiter is None:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters[room_id] = waiter
         try:
-            # Use async connection for non-blocking listen
-            async with await psycopg.AsyncConnection.connect(db_url) as conn:
-                # Subscribe to notification channels
-                await conn.execute("LISTEN game_update")
-                await conn.execute("LISTEN draft_update")
-                print("[WS Server] Listening for PostgreSQL notifications...")
-
-                async for notify in conn.notifies():
-                    try:
-                        channel = notify.channel
-                        payload = json.loads(notify.payload) if notify.payload else {}
-
-                        if channel == "game_update":
-                            game_id = payload.get("game_id")
-                            message = payload.get("message", {})
-                            if game_id and message:
-                                await manager.broadcast_to_game(game_id, message)
-
-                        elif channel == "draft_update":
-                            room_id = payload.get("room_id")
-                            message = payload.get("message", {})
-                            if room_id and message:
-                                await manager.broadcast_to_game(room_id, message)
-
-                    except json.JSONDecodeError as e:
-                        print(f"[WS Server] Invalid JSON in notification: {e}")
-                    except Exception as e:
-                        print(f"[WS Server] Error processing notification: {e}")
-
-        except psycopg.OperationalError as e:
-            print(f"[WS Server] Database connection error: {e}")
-            print("[WS Server] Reconnecting in 5 seconds...")
-            await asyncio.sleep(5)
-        except Exception as e:
-            print(f"[WS Server] Unexpected error: {e}")
-            await asyncio.sleep(5)
+            await asyncio.wait_for(asyncio.shield(waiter), SUBSCRIBE_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            print(f"[WS Server] LISTEN for room {room_id} is still pending")
+
+    def unsubscribe(self, room_id: str) -> None:
+        self._rooms.discard(room_id)
+
+    async def _sync(self, conn: psycopg.AsyncConnection) -> None:
+        added = [room for room in self._rooms if room not in self._listening]
+        removed = [room for room in self._listening if room not in self._rooms]
+        if not added and not removed:
+            return
+        statements = [
+            sql.SQL("LISTEN {}").format(sql.Identifier(room_channel(room)))
+            for room in added
+        ] + [
+            sql.SQL("UNLISTEN {}").format(sql.Identifier(self._listening[room]))
+            for room in removed
+        ]
+        await conn.execute(sql.SQL("; ").join(statements))
+        for room in removed:
+            del self._listening[room]
+        for room in added:
+            self._listening[room] = room_channel(room)
+            waiter = self._waiters.pop(room, None)
+            if waiter is not None and not waiter.done():
+                waiter.set_result(None)
+
+    async def _dispatch(
+        self, fetch_conn: psycopg.AsyncConnection, notify: psycopg.Notify
+    ) -> None:
+        payload = json.loads(notify.payload) if notify.payload else {}
+        if "outbox_id" in payload:
+            raw = await fetch_outbox_payload(fetch_conn, payload["outbox_id"])
+            if raw is None:
+                # Only if this listener fell behind the outbox retention
+                print(f"[WS Server] Outbox row {payload['outbox_id']} no longer exists")
+                return
+            payload = json.loads(raw)
+        if payload.get("origin") == manager.origin:
+            # Relayed by this process; its own connections already have it
+            return
+        room_id = payload.get("game_id") or payload.get("room_id")
+        message = payload.get("message", {})
+        if room_id and message:
+            await manager.deliver_local(room_id, message)
+
+    async def run(self) -> None:
+        """Listen for room notifications, reconnecting on errors."""
+        db_url = get_database_url()
+
+        while True:
+            try:
+                async with await psycopg.AsyncConnection.connect(
+                    db_url, autocommit=True
+                ) as conn, await psycopg.AsyncConnection.connect(
+                    db_url, autocommit=True
+                ) as fetch_conn:
+                    # A new session starts with no LISTENs
+                    self._listening = {}
+                    print("[WS Server] Listening for PostgreSQL notifications...")
+
+                    while True:
+                        await self._sync(conn)
+                        async for notify in conn.notifies(timeout=LISTEN_POLL_SECONDS):
+                            try:
+                                await self._dispatch(fetch_conn, notify)
+                            except json.JSONDecodeError as e:
+                                print(f"[WS Server] Invalid JSON in notification: {e}")
+                            except Exception as e:
+                                print(f"[WS Server] Error processing notification: {e}")
+
+            except psycopg.OperationalError as e:
+                print(f"[WS Server] Database connection error: {e}")
+                print("[WS Server] Reconnecting in 5 seconds...")
+                await asyncio.sleep(5)
+            except Exception as e:
+                print(f"[WS Server] Unexpected error: {e}")
+                await asyncio.sleep(5)
+
+
+room_listener = RoomNotifyListener()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
     # Start the notification listener as a background task
-    listener_task = asyncio.create_task(listen_for_notifications())
+    manager.room_listener = room_listener
+    listener_task = asyncio.create_task(room_listener.run())
     print("[WS Server] Started PostgreSQL notification listener")
 
+    if settings.write_behind:
+        game_engine.writer.start()
+    if settings.game_actor_mode:
+        await actor_runtime.start()
+
     yield
 
+    await game_action_executor.stop()
+    await actor_runtime.stop()
+    await game_engine.writer.stop()
+    await broadcast_coalescer.stop()
+    await notify_publisher.stop()
+    await close_async_pool()
+
     # Cleanup
     listener_task.cancel()
     try:
@@ -107,4 +210,12 @@ async def health_check():
         "status": "healthy",
         "service": "websocket",
         "active_games": len(manager.active_connections),
+        "listened_rooms": room_listener.rooms,
+        "connections": manager.stats(),
+        "broadcast_coalescer": broadcast_coalescer.stats(),
+        "game_action_executor": game_action_executor.stats(),
+        "notify_publisher": notify_publisher.stats(),
+        "game_state_cache": game_state_cache.stats(),
+        "projection_cache": projection_cache.stats(),
+        "batch_writer": game_engine.writer.stats(),
     }
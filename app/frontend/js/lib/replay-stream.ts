@@ -0,0 +1,70 @@
+export type ReplayStreamHeader = {
+    game_id: string;
+    from_step: number;
+    total_steps: number;
+};
+
+export type ReplayStep = {
+    step: number;
+    timestamp: number | null;
+    state: Record<string, unknown>;
+    action?: Record<string, unknown>;
+};
+
+type ReplayStreamOptions = {
+    fromStep?: number;
+    onHeader?: (header: ReplayStreamHeader) => void;
+};
+
+async function readErrorDetail(response: Response): Promise<string> {
+    try {
+        const payload = await response.json();
+        return payload?.detail || '';
+    } catch {
+        return '';
+    }
+}
+
+/**
+ * Read a replay from /replay/stream (NDJSON), calling onStep as each step
+ * arrives so playback can start before the whole replay is downloaded.
+ */
+export async function streamReplaySteps(
+    gameId: string,
+    onStep: (step: ReplayStep) => void,
+    options: ReplayStreamOptions = {}
+): Promise<void> {
+    const fromStep = options.fromStep ?? 0;
+    const response = await fetch(
+        `/api/v1/games/${encodeURIComponent(gameId)}/replay/stream?from_step=${fromStep}`
+    );
+    if (!response.ok || !response.body) {
+        const detail = await readErrorDetail(response);
+        throw new Error(detail || 'Failed to fetch replay.');
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffered = '';
+    let headerRead = false;
+    const handleLine = (line: string) => {
+        if (!line.trim()) return;
+        const payload = JSON.parse(line);
+        if (!headerRead) {
+            headerRead = true;
+            options.onHeader?.(payload as ReplayStreamHeader);
+            return;
+        }
+        onStep(payload as ReplayStep);
+    };
+
+    while (true) {
+        const { done, value } = await reader.read();
+        if (done) break;
+        buffered += decoder.decode(value, { stream: true });
+        const lines = buffered.split('\n');
+        buffered = lines.pop() ?? '';
+        lines.forEach(handleLine);
+    }
+    handleLine(buffered + decoder.decode());
+}
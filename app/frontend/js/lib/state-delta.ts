@@ -0,0 +1,53 @@
+type CompactPlayer = {
+    id: string;
+    zones?: Record<string, unknown[]>;
+    [key: string]: unknown;
+};
+
+export type CompactState = {
+    players?: CompactPlayer[];
+    card_instances?: Record<string, unknown>;
+    [key: string]: unknown;
+};
+
+export type CompactStateDelta = {
+    fields?: Record<string, unknown>;
+    players?: Record<
+        string,
+        { fields?: Record<string, unknown>; zones?: Record<string, unknown[]> }
+    >;
+    cards?: Record<string, unknown>;
+    removed_cards?: string[];
+};
+
+/**
+ * Apply a game_state_delta (see app/backend/utils/state_delta.py) to a compact
+ * game state. Returns a new state; unchanged players and cards are shared.
+ */
+export function applyCompactDelta(state: CompactState, delta: CompactStateDelta): CompactState {
+    const result: CompactState = { ...state, ...(delta.fields || {}) };
+
+    const playerChanges = delta.players || {};
+    if (Object.keys(playerChanges).length > 0) {
+        result.players = (state.players || []).map((player) => {
+            const changes = playerChanges[player.id];
+            if (!changes) {
+                return player;
+            }
+            return {
+                ...player,
+                ...(changes.fields || {}),
+                zones: { ...(player.zones || {}), ...(changes.zones || {}) }
+            };
+        });
+    }
+
+    if (delta.cards || delta.removed_cards) {
+        const cards = { ...(state.card_instances || {}), ...(delta.cards || {}) };
+        (delta.removed_cards || []).forEach((uniqueId) => {
+            delete cards[uniqueId];
+        });
+        result.card_instances = cards;
+    }
+    return result;
+}
@@ -0,0 +1,30 @@
+import { describe, expect, it } from 'vitest';
+import { hydrateGameState } from '../stores/cardCatalogStore.js';
+
+describe('hydrateGameState hidden zones', () => {
+    const compactState = (library: unknown) => ({
+        game_id: 'game-1',
+        players: [{ id: 'player1', name: 'Alice', zones: { hand: [], library } }],
+        stack: [],
+        card_instances: {}
+    });
+
+    it('expands a library count into face-down placeholders', async () => {
+        const state = await hydrateGameState(compactState({ count: 3 }));
+        const library = state.players[0].library;
+
+        expect(library).toHaveLength(3);
+        expect(library.map((card: { unique_id: string }) => card.unique_id)).toEqual([
+            'player1:library:0',
+            'player1:library:1',
+            'player1:library:2'
+        ]);
+        expect(library.every((card: { face_down: boolean }) => card.face_down)).toBe(true);
+    });
+
+    it('still reads an empty legacy card id list', async () => {
+        const state = await hydrateGameState(compactState([]));
+
+        expect(state.players[0].library).toEqual([]);
+    });
+});
@@ -0,0 +1,41 @@
+import { describe, expect, it } from 'vitest';
+import { applyCompactDelta } from '@lib/state-delta';
+
+describe('applyCompactDelta', () => {
+    const base = {
+        turn: 3,
+        phase: 'main1',
+        players: [
+            { id: 'player1', life: 20, zones: { hand: ['a'], battlefield: ['b'] } },
+            { id: 'player2', life: 20, zones: { hand: [], battlefield: ['c'] } }
+        ],
+        card_instances: {
+            a: { unique_id: 'a', tapped: false },
+            b: { unique_id: 'b', tapped: false },
+            c: { unique_id: 'c', tapped: false }
+        }
+    };
+
+    it('replaces changed fields, zones and cards only', () => {
+        const next = applyCompactDelta(base, {
+            fields: { phase: 'combat' },
+            players: { player1: { fields: { life: 18 }, zones: { hand: [] } } },
+            cards: { b: { unique_id: 'b', tapped: true } },
+            removed_cards: ['a']
+        });
+
+        expect(next.phase).toBe('combat');
+        expect(next.turn).toBe(3);
+        expect(next.players?.[0]).toEqual({
+            id: 'player1',
+            life: 18,
+            zones: { hand: [], battlefield: ['b'] }
+        });
+        expect(next.players?.[1]).toBe(base.players[1]);
+        expect(next.card_instances).toEqual({
+            b: { unique_id: 'b', tapped: true },
+            c: { unique_id: 'c', tapped: false }
+        });
+        expect(base.card_instances.a).toBeDefined();
+    });
+});
@@ -360,6 +360,33 @@ function hydrateCard(instance) {
     };
 }
 
+/**
+ * Hydrate the cards of a hidden zone (library) from their card_ids in order.
+ * Unknown cards (null card_id) become face-down placeholders. unique_ids are
+ * positional ("{player}:{zone}:{index}"), as the server expects for library
+ * actions.
+ *
+ * @param {string} playerId - The zone owner's player id
+ * @param {string} zoneName - The hidden zone name
+ * @param {Array<string|null>} cardIds - card_ids from the top of the zone
+ * @returns {Array} Card objects suitable for UI rendering
+ */
+function hydrateHiddenZone(playerId, zoneName, cardIds) {
+    return cardIds
+        .map((cardId, index) => hydrateCard({
+            unique_id: `${playerId}:${zoneName}:${index}`,
+            card_id: cardId,
+            owner_id: playerId,
+            controller_id: playerId,
+            zone: zoneName,
+            tapped: false,
+            face_down: !cardId,
+            current_face: 0,
+            is_token: false,
+        }))
+        .filter(Boolean);
+}
+
 /**
  * Hydrate a compact game state into the legacy format expected by the UI.
  * Converts players[].zones (arrays of unique_ids) into players[].zone (arrays of Card objects).
@@ -403,7 +430,7 @@ async function hydrateGameState(compactState) {
         'look_zone',
     ];
 
-    // Zones that store card_ids directly (not unique_ids)
+    // Zones projected without card instances
     const HIDDEN_ZONES = new Set(['library']);
 
     // Hydrate players
@@ -425,22 +452,12 @@ async function hydrateGameState(compactState) {
             const isHiddenZone = HIDDEN_ZONES.has(zoneName);
 
             if (isHiddenZone) {
-                // Hidden zones: zoneData contains card_ids directly
-                hydratedPlayer[zoneName] = zoneData.map((cardId, index) => {
-                    const uniqueId = `${player.id}:${zoneName}:${index}`;
-                    const minimalInstance = {
-                        unique_id: uniqueId,
-                        card_id: cardId,
-                        owner_id: player.id,
-                        controller_id: player.id,
-                        zone: zoneName,
-                        tapped: false,
-                        face_down: false,
-                        current_face: 0,
-                        is_token: false,
-                    };
-                    return hydrateCard(minimalInstance);
-                }).filter(Boolean);
+                // Hidden zones carry only {count}; older payloads (stored
+                // replays) still list card_ids in order
+                const cardIds = Array.isArray(zoneData)
+                    ? zoneData
+                    : new Array(zoneData.count || 0).fill(null);
+                hydratedPlayer[zoneName] = hydrateHiddenZone(player.id, zoneName, cardIds);
             } else {
                 // Regular zones: use card_instances
                 hydratedPlayer[zoneName] = zoneData
@@ -518,12 +535,12 @@ function collectMissingCardIds(cardInstances, players) {
         }
     }
 
-    // Check hidden zones (library contains card_ids directly)
+    // Check hidden zones (only older payloads list their card_ids)
     const HIDDEN_ZONES = ['library'];
     for (const player of players) {
         const zones = player.zones || {};
         for (const zoneName of HIDDEN_ZONES) {
-            const cardIds = zones[zoneName] || [];
+            const cardIds = Array.isArray(zones[zoneName]) ? zones[zoneName] : [];
             for (const cardId of cardIds) {
                 if (cardId && !catalog.has(String(cardId))) {
                     missing.add(cardId);
@@ -558,6 +575,7 @@ export {
     fetchCardDefinition,
     fetchMissingDefinitions,
     hydrateCard,
+    hydrateHiddenZone,
     hydrateGameState,
     clearCatalog,
     getCatalogSize,
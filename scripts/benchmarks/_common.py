@@ -0,0 +1,119 @@
+"""Shared helpers for the benchmark scripts in this directory.
+
+Benchmarks that talk to PostgreSQL read DATABASE_URL like the application
+does (``.env`` is loaded through the app settings) and apply migrations
+before running. Point them at a disposable local database.
+"""
+
+from __future__ import annotations
+
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+# Add repository root to path so we can import from app
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from app.backend.models.game import (  # noqa: E402
+    Card,
+    CardType,
+    GameFormat,
+    GamePhase,
+    GameState,
+    Player,
+)
+
+BASIC_TYPES = [CardType.LAND, CardType.CREATURE, CardType.INSTANT, CardType.ARTIFACT]
+
+
+def build_card(index: int, owner_id: str) -> Card:
+    """Build a realistic-looking card with oracle text and image URLs."""
+    card_id = f"bench-card-{index % 250:04d}"
+    return Card(
+        id=card_id,
+        scryfall_id=f"00000000-0000-0000-0000-{index % 250:012d}",
+        unique_id=f"{owner_id}-card-{index:04d}",
+        owner_id=owner_id,
+        name=f"Benchmark Card {index % 250}",
+        mana_cost="{2}{G}{G}",
+        cmc=4,
+        card_type=BASIC_TYPES[index % len(BASIC_TYPES)],
+        subtype="Elf Druid",
+        text=(
+            "{T}: Add one mana of any color. Whenever another creature enters the "
+            "battlefield under your control, you may draw a card."
+        ),
+        power="2",
+        toughness="3",
+        image_url=f"https://cards.scryfall.io/normal/front/{index % 250:04d}.jpg",
+        set="bch",
+        set_name="Benchmark Set",
+    )
+
+
+def build_game_state(
+    game_id: str = "bench-game",
+    players: int = 2,
+    library_size: int = 60,
+    battlefield_size: int = 10,
+    hand_size: int = 7,
+) -> GameState:
+    """Build a mid-game state with populated zones for every player."""
+    roster: List[Player] = []
+    counter = 0
+    for seat in range(players):
+        player_id = f"player{seat + 1}"
+        zones: Dict[str, List[Card]] = {
+            "library": [],
+            "battlefield": [],
+            "hand": [],
+            "graveyard": [],
+        }
+        for zone_name, size in (
+            ("library", library_size),
+            ("battlefield", battlefield_size),
+            ("hand", hand_size),
+            ("graveyard", max(1, battlefield_size // 2)),
+        ):
+            for _ in range(size):
+                zones[zone_name].append(build_card(counter, player_id))
+                counter += 1
+        roster.append(Player(id=player_id, name=f"Player {seat + 1}", **zones))
+
+    game_format = GameFormat.COMMANDER_MULTI if players > 2 else GameFormat.MODERN
+    return GameState(
+        id=game_id,
+        players=roster,
+        phase=GamePhase.MAIN1,
+        turn=5,
+        game_format=game_format,
+        players_played_this_round=[False for _ in roster],
+    )
+
+
+def time_calls(func: Callable[[], object], iterations: int) -> List[float]:
+    """Run func repeatedly and return per-call durations in seconds."""
+    durations: List[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def summarize(label: str, durations: List[float]) -> None:
+    """Print throughput and latency percentiles for a list of durations."""
+    if not durations:
+        print(f"{label}: no samples")
+        return
+    ordered = sorted(durations)
+    total = sum(durations)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    print(
+        f"{label}: {len(durations) / total:,.1f} ops/s | "
+        f"mean {statistics.mean(durations) * 1000:.2f} ms | "
+        f"p50 {ordered[len(ordered) // 2] * 1000:.2f} ms | "
+        f"p95 {p95 * 1000:.2f} ms"
+    )
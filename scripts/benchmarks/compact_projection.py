@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""GameState.to_compact_ui_data cost on a 4-player commander board.
+
+Three cases, each projecting the state once per seat (as a broadcast plus
+one request_game_state per player would):
+
+- cold: the projection cache is cleared before every call, which is what
+  every call cost before the cache existed;
+- same version: repeated projections of an unchanged state (cache hits);
+- one action: a single card is tapped and the version bumped between
+  rounds, so the first projection misses but reuses the other cards'
+  instance dicts, and the other seats share it.
+
+With --face-down N, N permanents are face down: projections then differ per
+viewer and every seat misses once per action.
+
+Usage:
+    python scripts/benchmarks/compact_projection.py --iterations 200
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from _common import build_game_state, summarize, time_calls
+
+from app.backend.models.projection_cache import projection_cache
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--battlefield", type=int, default=40)
+    parser.add_argument("--face-down", type=int, default=0)
+    args = parser.parse_args()
+
+    game_state = build_game_state(
+        players=4, library_size=70, battlefield_size=args.battlefield, hand_size=7
+    )
+    viewers = [None] + [player.id for player in game_state.players]
+    cards = [card for player in game_state.players for card in player.battlefield]
+    for card in cards[: args.face_down]:
+        card.face_down = True
+
+    def project_all() -> None:
+        for viewer_id in viewers:
+            game_state.to_compact_ui_data(
+                viewer_id=viewer_id, action_history=[], chat_log=[]
+            )
+
+    def cold() -> None:
+        for viewer_id in viewers:
+            projection_cache.clear()
+            game_state.to_compact_ui_data(
+                viewer_id=viewer_id, action_history=[], chat_log=[]
+            )
+
+    step = iter(range(10**9))
+
+    def one_action() -> None:
+        card = cards[next(step) % len(cards)]
+        card.tapped = not card.tapped
+        game_state.version += 1
+        project_all()
+
+    print(
+        f"4 players, {len(cards)} permanents ({args.face_down} face down), "
+        f"{len(viewers)} projections per round"
+    )
+    summarize("cold", time_calls(cold, args.iterations))
+    project_all()
+    summarize("same version", time_calls(project_all, args.iterations))
+    summarize("one action", time_calls(one_action, args.iterations))
+    print(projection_cache.stats())
+
+
+if __name__ == "__main__":
+    main()
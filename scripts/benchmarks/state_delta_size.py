@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""WebSocket state broadcasts: full compact snapshots vs sequenced deltas.
+
+Replays the synthetic 4-player commander game of replay_storage.py and, for
+every action, compares the encoded size of a full game_state_update with the
+game_state_delta the WS tier sends instead, plus the client-side cost of
+json.loads on each.
+
+Usage:
+    python scripts/benchmarks/state_delta_size.py --actions 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+
+from _common import summarize
+from replay_storage import build_steps
+
+from app.backend.utils.state_delta import diff_compact_state
+
+
+def _parse_time(text: str, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        json.loads(text)
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--actions", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5, help="json.loads repeats")
+    args = parser.parse_args()
+
+    steps = build_steps(args.actions)
+    full_bytes = delta_bytes = 0
+    full_parse, delta_parse = [], []
+    previous = None
+    for step in steps:
+        seq = step["state_version"]
+        full = json.dumps(
+            {"type": "game_state_update", "game_state": step["state"], "seq": seq}
+        )
+        full_bytes += len(full)
+        full_parse.append(_parse_time(full, args.repeat))
+        if previous is None:
+            delta_bytes += len(full)
+            delta_parse.append(full_parse[-1])
+        else:
+            delta = json.dumps(
+                {
+                    "type": "game_state_delta",
+                    "base_seq": seq - 1,
+                    "seq": seq,
+                    "delta": diff_compact_state(previous, step["state"]),
+                }
+            )
+            delta_bytes += len(delta)
+            delta_parse.append(_parse_time(delta, args.repeat))
+        previous = step["state"]
+
+    print(
+        f"{len(steps)} broadcasts: full {full_bytes / 1024:,.0f} KiB | "
+        f"deltas {delta_bytes / 1024:,.0f} KiB ({delta_bytes / full_bytes:.1%})"
+    )
+    summarize("full snapshot json.loads", full_parse)
+    summarize("delta json.loads", delta_parse)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Tests for the per-game ordered thread pool used by the WebSocket tier."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.backend.services.action_executor import GameActionExecutor
+
+
+@pytest.mark.asyncio
+async def test_calls_for_one_game_run_in_order_off_the_loop():
+    executor = GameActionExecutor(max_workers=4)
+    loop_thread = threading.get_ident()
+    order = []
+
+    def work(index, delay):
+        time.sleep(delay)
+        order.append((index, threading.get_ident() != loop_thread))
+        return index
+
+    results = await asyncio.gather(
+        *(executor.run("g1", work, index, 0.02 - index * 0.005) for index in range(4))
+    )
+
+    assert results == [0, 1, 2, 3]
+    assert order == [(index, True) for index in range(4)]
+    assert executor.stats()["busy_games"] == 0
+    await executor.stop()
+
+
+@pytest.mark.asyncio
+async def test_games_run_in_parallel_and_loop_stays_responsive():
+    executor = GameActionExecutor(max_workers=4)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.005)
+            ticks += 1
+
+    ticking = asyncio.create_task(ticker())
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(executor.run(f"g{index}", time.sleep, 0.1) for index in range(4))
+    )
+    elapsed = time.perf_counter() - start
+    ticking.cancel()
+
+    assert elapsed < 0.3
+    assert ticks >= 5
+    await executor.stop()
+
+
+@pytest.mark.asyncio
+async def test_coroutines_and_errors_come_back_to_the_caller():
+    executor = GameActionExecutor(max_workers=2)
+
+    async def apply(value):
+        await asyncio.sleep(0)
+        if value < 0:
+            raise ValueError("negative")
+        return value * 2
+
+    assert await executor.run("g1", apply, 21) == 42
+    with pytest.raises(ValueError):
+        await executor.run("g1", apply, -1)
+    # The lane is released after a failure
+    assert await executor.run("g1", apply, 1) == 2
+    assert executor.stats()["failures"] == 1
+    await executor.stop()
+
+
+@pytest.mark.asyncio
+async def test_zero_workers_runs_inline():
+    executor = GameActionExecutor(max_workers=0)
+    loop_thread = threading.get_ident()
+
+    async def where():
+        return threading.get_ident()
+
+    assert await executor.run("g1", where) == loop_thread
+    assert await executor.run("g1", threading.get_ident) == loop_thread
@@ -0,0 +1,67 @@
+"""Tests for all-or-nothing action batches (in-memory engine)."""
+
+import asyncio
+
+import pytest
+
+from app.backend.api import action_handlers  # noqa: F401 - registers handlers
+from app.backend.api.decorators import build_game_action
+from app.backend.models.game import GameState, Player
+from app.backend.services.game_engine import BatchActionError, SimpleGameEngine
+
+
+def _setup():
+    engine = SimpleGameEngine(use_db=False)
+    state = GameState(
+        id="batch-game",
+        players=[Player(id="player1", name="Alice"), Player(id="player2", name="Bob")],
+    )
+    engine.games[state.id] = state
+    return engine, state
+
+
+def _life_request(amount, target="player1"):
+    return {
+        "action_type": "modify_life",
+        "player_id": "player1",
+        "target_player": target,
+        "amount": amount,
+    }
+
+
+def test_batch_is_applied_in_order_and_saved_once():
+    engine, state = _setup()
+    requests = [_life_request(-3), _life_request(-2, "player2"), _life_request(1)]
+
+    game_state, entries = asyncio.run(
+        engine.process_actions(state.id, requests, build_game_action)
+    )
+
+    assert engine.games[state.id] is game_state
+    assert game_state.version == 3
+    assert [p.life for p in game_state.players] == [18, 18]
+    assert [entry["amount"] for entry in entries] == [-3, -2, 1]
+    steps = engine.replays[state.id]
+    assert [step["state"]["players"][0]["life"] for step in steps] == [17, 17, 18]
+
+
+def test_failing_action_leaves_the_game_untouched():
+    engine, state = _setup()
+    requests = [_life_request(-3), {"action_type": "modify_life"}]
+
+    with pytest.raises(BatchActionError) as error:
+        asyncio.run(engine.process_actions(state.id, requests, build_game_action))
+
+    assert error.value.index == 1
+    assert engine.games[state.id] is state
+    assert (state.version, state.players[0].life) == (0, 20)
+    assert state.id not in engine.replays
+
+
+def test_batch_size_is_bounded():
+    engine, state = _setup()
+    with pytest.raises(ValueError):
+        asyncio.run(engine.process_actions(state.id, [], build_game_action))
+    too_many = [_life_request(1)] * (engine.MAX_BATCH_ACTIONS + 1)
+    with pytest.raises(ValueError):
+        asyncio.run(engine.process_actions(state.id, too_many, build_game_action))
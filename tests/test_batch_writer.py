@@ -0,0 +1,147 @@
+"""Tests for the write-behind batch writer's queue bookkeeping (no database)."""
+
+from contextlib import nullcontext
+
+import pytest
+
+from app.backend.repositories.batch_writer import (
+    CHAT_MESSAGE,
+    HISTORY_ENTRY,
+    REPLAY_STEP,
+    BatchWriter,
+)
+from app.backend.repositories.dict_proxies import ActionHistoryProxy, ReplaysProxy
+
+
+def test_pending_rows_are_per_game_and_in_order():
+    writer = BatchWriter(ReplaysProxy(), ActionHistoryProxy(), None)
+
+    writer.submit(HISTORY_ENTRY, "g1", {"action": "draw_card"})
+    writer.submit(HISTORY_ENTRY, "g2", {"action": "tap_card"})
+    writer.submit(REPLAY_STEP, "g1", {"state": {}}, state_version=3)
+    writer.submit(HISTORY_ENTRY, "g1", {"action": "pass_phase"})
+
+    assert writer.pending(HISTORY_ENTRY, "g1") == [
+        {"action": "draw_card"},
+        {"action": "pass_phase"},
+    ]
+    assert writer.pending(CHAT_MESSAGE, "g1") == []
+    assert writer.stats()["queue_depth"] == 4
+
+    writer.discard(REPLAY_STEP, "g1")
+    assert writer.pending(REPLAY_STEP, "g1") == []
+    assert len(writer.pending(HISTORY_ENTRY, "g1")) == 2
+
+
+def test_writer_only_accepts_kinds_it_has_a_store_for_while_running():
+    writer = BatchWriter(None, ActionHistoryProxy(), None)
+    assert not writer.accepts(HISTORY_ENTRY)
+
+    writer._task = object()  # as if start() had been called
+    assert writer.accepts(HISTORY_ENTRY)
+    assert not writer.accepts(REPLAY_STEP)
+    assert not writer.accepts(CHAT_MESSAGE)
+
+
+@pytest.mark.asyncio
+async def test_async_read_is_retried_when_a_flush_overlaps_it():
+    writer = BatchWriter(None, ActionHistoryProxy(), None, flush_interval=0)
+    writer.submit(HISTORY_ENTRY, "g1", {"action": "draw_card"})
+    reads = 0
+
+    async def read():
+        nonlocal reads
+        reads += 1
+        if reads == 1:
+            writer._flush_generation += 2  # a flush ran during the query
+        return [{"action": "untap_all"}]
+
+    entries = await writer.read_with_pending(HISTORY_ENTRY, "g1", read)
+
+    assert entries == [{"action": "untap_all"}, {"action": "draw_card"}]
+    assert reads == 2
+
+
+@pytest.mark.asyncio
+async def test_async_read_gives_up_while_a_flush_is_running():
+    writer = BatchWriter(None, ActionHistoryProxy(), None, flush_interval=0)
+    writer._flush_generation = 1  # as if a flush were writing
+
+    async def read():
+        raise AssertionError("must not read during a flush")
+
+    assert await writer.read_with_pending(HISTORY_ENTRY, "g1", read) is None
+
+
+class FlakyHistory(ActionHistoryProxy):
+    """Fails every write that contains a poisoned row, or every write at all."""
+
+    def __init__(self, down=False):
+        super().__init__()
+        self.down = down
+        self.written = []
+
+    def append_many(self, entries):
+        if self.down or any(payload.get("poison") for _, payload, _ in entries):
+            raise ValueError("bad row")
+        self.written.extend(payload["n"] for _, payload, _ in entries)
+
+
+def _flaky_writer(monkeypatch, history, **kwargs):
+    monkeypatch.setattr(
+        "app.backend.repositories.batch_writer.unit_of_work", nullcontext
+    )
+    return BatchWriter(None, history, None, **kwargs)
+
+
+def test_failing_row_is_isolated_after_max_attempts(monkeypatch):
+    history = FlakyHistory()
+    writer = _flaky_writer(monkeypatch, history, max_attempts=2)
+    for n in range(5):
+        writer.submit(HISTORY_ENTRY, "g1", {"n": n, "poison": n == 3})
+
+    assert writer.flush() == 0
+    assert writer.flush() == 0
+    assert writer.stats()["retrying"] == 2
+    assert writer.stats()["queue_depth"] == 5
+
+    assert writer.flush() == 4
+    assert history.written == [0, 1, 2, 4]
+    assert [row[2]["n"] for row in writer.dead_letters] == [3]
+    stats = writer.stats()
+    assert (stats["queue_depth"], stats["retrying"], stats["dead_lettered"]) == (
+        0,
+        0,
+        1,
+    )
+
+
+def test_full_queue_writes_through_with_the_game_rows_in_order(monkeypatch):
+    history = FlakyHistory()
+    writer = _flaky_writer(monkeypatch, history, max_pending=3)
+    writer.submit(HISTORY_ENTRY, "g1", {"n": 0})
+    writer.submit(HISTORY_ENTRY, "g2", {"n": 1})
+    writer.submit(HISTORY_ENTRY, "g1", {"n": 2})
+
+    # Full: the producer writes its row, after the rows of g1 still queued
+    writer.submit(HISTORY_ENTRY, "g1", {"n": 3})
+    assert history.written == [0, 2, 3]
+    assert writer.pending(HISTORY_ENTRY, "g2") == [{"n": 1}]
+    stats = writer.stats()
+    assert (stats["backpressure_writes"], stats["queue_depth"]) == (3, 1)
+
+
+def test_failed_write_through_keeps_every_row(monkeypatch):
+    history = FlakyHistory(down=True)
+    writer = _flaky_writer(monkeypatch, history, max_pending=2)
+    writer.submit(HISTORY_ENTRY, "g1", {"n": 0})
+    writer.submit(HISTORY_ENTRY, "g1", {"n": 1})
+
+    # The caller's action fails with the write; queued rows stay queued
+    with pytest.raises(ValueError):
+        writer.submit(HISTORY_ENTRY, "g1", {"n": 2})
+    assert writer.pending(HISTORY_ENTRY, "g1") == [{"n": 0}, {"n": 1}]
+
+    history.down = False
+    assert writer.flush() == 2
+    assert history.written == [0, 1]
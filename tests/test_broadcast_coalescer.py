@@ -0,0 +1,93 @@
+"""Tests for the per-game broadcast coalescing window (no sockets)."""
+
+import asyncio
+
+import pytest
+
+from app.backend.services.broadcast_coalescer import BroadcastCoalescer
+
+
+class Recorder:
+    def __init__(self):
+        self.sent = []
+
+    async def __call__(self, game_id, message):
+        self.sent.append((game_id, message))
+
+
+def _update(seq, action):
+    return {
+        "type": "game_state_update",
+        "game_state": {"turn": seq},
+        "seq": seq,
+        "action_result": {"action": action},
+    }
+
+
+@pytest.mark.asyncio
+async def test_burst_is_sent_as_first_update_then_one_merged_update():
+    send = Recorder()
+    coalescer = BroadcastCoalescer(0.02, send)
+
+    await coalescer.submit("g1", _update(1, "tap"))
+    await coalescer.submit("g1", _update(3, "draw"))
+    # A late submit with an older state keeps the newer one
+    await coalescer.submit("g1", _update(2, "play"))
+    await coalescer.submit("g2", _update(7, "pass"))
+    assert [message["seq"] for _, message in send.sent] == [1, 7]
+
+    await asyncio.sleep(0.05)
+    game_id, merged = send.sent[2]
+    assert (game_id, merged["seq"]) == ("g1", 3)
+    assert [r["action"] for r in merged["action_results"]] == ["draw", "play"]
+    assert merged["action_result"]["action"] == "play"
+    assert len(send.sent) == 3
+
+    stats = coalescer.stats()
+    assert (stats["submitted"], stats["sent"], stats["coalesced"]) == (4, 3, 1)
+    await asyncio.sleep(0.05)
+    assert coalescer.stats()["open_windows"] == 0
+
+
+@pytest.mark.asyncio
+async def test_stop_flushes_pending_updates():
+    send = Recorder()
+    coalescer = BroadcastCoalescer(10, send)
+    await coalescer.submit("g1", _update(1, "tap"))
+    await coalescer.submit("g1", _update(2, "untap"))
+
+    await coalescer.stop()
+    assert [message["seq"] for _, message in send.sent] == [1, 2]
+    assert coalescer.stats()["open_windows"] == 0
+
+
+@pytest.mark.asyncio
+async def test_zero_window_sends_every_update():
+    send = Recorder()
+    coalescer = BroadcastCoalescer(0, send)
+    for seq in range(3):
+        await coalescer.submit("g1", _update(seq, "tap"))
+    assert [message["seq"] for _, message in send.sent] == [0, 1, 2]
+    assert "action_results" not in send.sent[-1][1]
+
+
+@pytest.mark.asyncio
+async def test_restarted_game_replaces_the_pending_update():
+    send = Recorder()
+    coalescer = BroadcastCoalescer(10, send)
+
+    def update(created_at, seq, action):
+        message = _update(seq, action)
+        message["game_state"]["created_at"] = created_at
+        return message
+
+    await coalescer.submit("g1", update("2026-01-01T10:00:00+00:00", 40, "tap"))
+    await coalescer.submit("g1", update("2026-01-01T10:00:00+00:00", 41, "draw"))
+    # restart_game: the new GameState's version starts over
+    await coalescer.submit("g1", update("2026-01-01T11:00:00+00:00", 1, "restart"))
+
+    await coalescer.stop()
+    merged = send.sent[-1][1]
+    assert merged["seq"] == 1
+    assert merged["game_state"]["created_at"] == "2026-01-01T11:00:00+00:00"
+    assert [r["action"] for r in merged["action_results"]] == ["draw", "restart"]
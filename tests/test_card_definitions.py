@@ -0,0 +1,109 @@
+"""Tests for the interned card definitions of stored game states (no database)."""
+
+import pytest
+
+from app.backend.models.game import Card, CardType, GameState, Player
+from app.backend.repositories.card_definitions import (
+    DEFINITION_KEY,
+    CardDefinitionStore,
+    iter_card_dicts,
+)
+from app.backend.repositories.dict_proxies import GameStatesProxy
+from app.backend.repositories.game_state_cache import GameStateCache
+
+
+def _card(unique_id, text="Draw a card.", **fields):
+    return Card(
+        id="card-opt",
+        unique_id=unique_id,
+        owner_id="player1",
+        name="Opt",
+        mana_cost="{U}",
+        cmc=1,
+        card_type=CardType.INSTANT,
+        text=text,
+        image_url="https://example.test/opt.jpg",
+        set="eld",
+        set_name="Throne of Eldraine",
+        **fields,
+    )
+
+
+def _game_state():
+    player = Player(id="player1", name="Alice")
+    player.library = [_card(f"lib-{index}") for index in range(10)]
+    player.battlefield = [_card("bf-1", tapped=True, counters={"+1/+1": 2})]
+    player.hand = [_card("hand-1", text="Overridden text.")]
+    return GameState(
+        id="game-defs",
+        players=[player, Player(id="player2", name="Bob")],
+        stack=[_card("stack-1")],
+    )
+
+
+def _proxy(store):
+    return GameStatesProxy(cache=GameStateCache(0), definitions=store)
+
+
+def test_cards_are_stored_as_instances_and_definition_keys():
+    store = CardDefinitionStore(100)
+    data = _proxy(store)._serialize(_game_state())
+
+    cards = {card["unique_id"]: card for card in iter_card_dicts(data)}
+    assert len(cards) == 13
+    assert all(
+        "text" not in card and "image_url" not in card for card in cards.values()
+    )
+    assert cards["bf-1"]["tapped"] is True
+    assert cards["bf-1"]["counters"] == {"+1/+1": 2}
+    assert "face_down" not in cards["bf-1"] and "tapped" not in cards["hand-1"]
+    # Same id, different static data: a second definition
+    assert cards["hand-1"][DEFINITION_KEY] != cards["bf-1"][DEFINITION_KEY]
+    assert len({card[DEFINITION_KEY] for card in cards.values()}) == 2
+
+
+def test_stored_state_round_trips():
+    store = CardDefinitionStore(100)
+    proxy = _proxy(store)
+    game_state = _game_state()
+
+    data, definitions, static_size = proxy._intern(game_state)
+    assert len(definitions) == 2
+    assert static_size > 0
+    store.saved(definitions)
+
+    loaded = proxy._deserialize(data)
+    assert loaded.model_dump() == game_state.model_dump()
+    assert loaded.players[0].hand[0].text == "Overridden text."
+    # Nothing left to insert once the definitions are stored
+    assert proxy._intern(game_state)[1] == {}
+
+
+def test_unknown_definitions_fail_loudly_and_full_cards_pass_through():
+    store = CardDefinitionStore(100)
+    proxy = _proxy(store)
+    data = proxy._serialize(_game_state())
+
+    with pytest.raises(LookupError):
+        store.resolve(data)
+
+    game_state = _game_state()
+    legacy = game_state.model_dump(mode="json")
+    assert store.missing(legacy) == []
+    assert proxy._deserialize(legacy).model_dump() == game_state.model_dump()
+
+
+def test_inserts_count_committed_new_rows_only():
+    class Cursor:
+        rowcount = 1  # the other definition was inserted by another worker
+
+        def execute(self, query, params):
+            pass
+
+    store = CardDefinitionStore(100)
+    _, definitions, _ = _proxy(store)._intern(_game_state())
+    inserted = store.write(Cursor(), definitions)
+    assert store.stats()["inserts"] == 0  # not committed yet
+
+    store.saved(definitions, inserted)
+    assert store.stats()["inserts"] == 1
@@ -0,0 +1,54 @@
+"""Tests for the draft lobby room summaries (no database)."""
+
+import asyncio
+
+from app.backend.models.game import Card, DraftPlayer, DraftRoom, DraftState
+from app.backend.services.draft_engine import DraftEngine
+
+
+def _room(room_id, state=DraftState.WAITING):
+    card = Card(id="card", name="Test Card", card_type="creature")
+    return DraftRoom(
+        id=room_id,
+        name=f"Room {room_id}",
+        set_code="tst",
+        set_name="Test Set",
+        state=state,
+        players=[
+            DraftPlayer(id="player1", name="Alice", drafted_cards=[card]),
+            DraftPlayer(id="bot1", name="Bot", is_bot=True),
+        ],
+        packs=[[[card] * 15]],
+    )
+
+
+def test_summaries_leave_out_packs_and_pools():
+    engine = DraftEngine(draft_service=None, use_db=False)
+    engine.draft_rooms["r1"] = _room("r1")
+
+    (summary,) = asyncio.run(engine.fetch_draft_room_summaries(None, 10))
+
+    assert summary.id == "r1"
+    assert summary.set_name == "Test Set"
+    assert summary.player_count == 2
+    assert summary.human_player_count == 1
+    assert "packs" not in summary.model_dump()
+    assert "players" not in summary.model_dump()
+
+
+def test_summaries_filter_by_state_and_page_newest_first():
+    engine = DraftEngine(draft_service=None, use_db=False)
+    for index in range(4):
+        engine.draft_rooms[f"waiting-{index}"] = _room(f"waiting-{index}")
+    engine.draft_rooms["drafting"] = _room("drafting", DraftState.DRAFTING)
+
+    def ids(state, limit, offset=0):
+        summaries = asyncio.run(
+            engine.fetch_draft_room_summaries(state, limit, offset)
+        )
+        return [summary.id for summary in summaries]
+
+    assert ids(DraftState.DRAFTING, 10) == ["drafting"]
+    assert ids(DraftState.WAITING, 2) == ["waiting-3", "waiting-2"]
+    assert ids(DraftState.WAITING, 2, 2) == ["waiting-1", "waiting-0"]
+    assert ids(None, 1) == ["drafting"]
@@ -0,0 +1,120 @@
+"""Tests for the single-writer game actor runtime (in-memory engine)."""
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app.backend.api import action_handlers  # noqa: F401 - registers handlers
+from app.backend.api.decorators import build_game_action
+from app.backend.models.game import GameState, Player
+from app.backend.services.game_actor import GameActorRuntime
+from app.backend.services.game_engine import SimpleGameEngine
+
+
+def _setup():
+    engine = SimpleGameEngine(use_db=False)
+    state = GameState(
+        id="actor-game",
+        players=[Player(id="player1", name="Alice"), Player(id="player2", name="Bob")],
+    )
+    engine.games[state.id] = state
+    applied = []
+
+    async def on_applied(game_id, game_state, action_result):
+        applied.append((action_result["action"], game_state.version))
+
+    runtime = GameActorRuntime(
+        engine, build_action=build_game_action, on_applied=on_applied
+    )
+    # Only flush on shutdown so the test can observe pending writes
+    runtime.flush_interval = 60
+    return engine, state, runtime, applied
+
+
+def _life_request(amount):
+    return {
+        "action_type": "modify_life",
+        "player_id": "player1",
+        "target_player": "player1",
+        "amount": amount,
+    }
+
+
+def test_actor_applies_in_memory_and_writes_behind_on_stop():
+    engine, state, runtime, applied = _setup()
+
+    async def scenario():
+        await runtime._spawn(state.id)
+        first = await runtime.submit(state.id, _life_request(-3))
+        second = await runtime.submit(state.id, _life_request(-2))
+        steps_before_flush = len(engine.replays.get(state.id, []))
+        life_before_flush = engine.games[state.id].players[0].life
+        await runtime.stop()
+        return first, second, steps_before_flush, life_before_flush
+
+    first, second, steps_before_flush, life_before_flush = asyncio.run(scenario())
+
+    assert first.version == 1
+    assert second.version == 2
+    # The actor works on its own copy; the stored state changes on flush
+    assert second.game_state is not state
+    assert life_before_flush == 20
+    assert engine.games[state.id].players[0].life == 15
+    assert applied == [("modify_life", 1), ("modify_life", 2)]
+    assert steps_before_flush == 0
+    assert len(engine.replays[state.id]) == 2
+    assert runtime.actors == {}
+
+
+def test_actor_rejects_invalid_action_without_touching_state():
+    engine, state, runtime, applied = _setup()
+
+    async def scenario():
+        await runtime._spawn(state.id)
+        with pytest.raises(HTTPException):
+            await runtime.submit(
+                state.id, {"action_type": "modify_life", "player_id": "player1"}
+            )
+        outcome = await runtime.submit(state.id, _life_request(1))
+        await runtime.stop()
+        return outcome
+
+    outcome = asyncio.run(scenario())
+
+    assert outcome.version == 1
+    assert engine.games[state.id].players[0].life == 21
+    assert applied == [("modify_life", 1)]
+
+
+def test_actor_applies_a_batch_whole_or_not_at_all():
+    engine, state, runtime, applied = _setup()
+    batched = []
+
+    async def on_applied(game_id, game_state, action_results):
+        batched.append([entry["amount"] for entry in action_results])
+
+    runtime.on_applied = on_applied
+
+    async def scenario():
+        await runtime._spawn(state.id)
+        outcome = await runtime.submit(
+            state.id, {"actions": [_life_request(-1), _life_request(-2)]}
+        )
+        with pytest.raises(ValueError):
+            await runtime.submit(
+                state.id,
+                {"actions": [_life_request(-5), {"action_type": "modify_life"}]},
+            )
+        life_after_failure = runtime.local_state(state.id).players[0].life
+        await runtime.stop()
+        return outcome, life_after_failure
+
+    outcome, life_after_failure = asyncio.run(scenario())
+
+    assert outcome.version == 2
+    assert len(outcome.action_results) == 2
+    assert batched == [[-1, -2]]
+    assert life_after_failure == 17
+    assert engine.games[state.id].players[0].life == 17
+    assert len(engine.replays[state.id]) == 2
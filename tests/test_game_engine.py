@@ -1,5 +1,7 @@
 """Unit tests for the SimpleGameEngine helpers."""
 
+import asyncio
+
 from app.backend.models.game import (
     Card,
     CardType,
@@ -8,6 +10,7 @@ from app.backend.models.game import (
     GameState,
     Player,
 )
+from app.backend.repositories.dict_proxies import GameStateConflictError
 from app.backend.services.game_engine import SimpleGameEngine
 
 
@@ -87,6 +90,90 @@ def test_record_action_history_preserves_existing_metadata():
     assert entry["turn_player_name"] == "Override"
 
 
+def test_record_action_history_uses_provided_state_without_lookup():
+    engine = SimpleGameEngine(use_db=False)
+    state = _build_game_state(phase=GamePhase.MAIN2, turn=3, active_index=0)
+
+    # The state is not stored in engine.games; the caller hands it over directly
+    entry = engine.record_action_history(
+        state.id,
+        {"action": "tap_card", "player": "player1", "success": True},
+        game_state=state,
+    )
+    assert entry is not None
+    assert entry["phase"] == GamePhase.MAIN2.value
+    assert entry["turn"] == 3
+    assert entry["turn_player_id"] == "player1"
+
+
+def test_unit_of_work_is_noop_for_in_memory_engine():
+    engine = SimpleGameEngine(use_db=False)
+    state = _build_game_state()
+    card = _build_card()
+    state.players[0].battlefield.append(card)
+    engine.games[state.id] = state
+
+    action = GameAction(
+        player_id="player1",
+        action_type="tap_card",
+        additional_data={"unique_id": card.unique_id, "tapped": True},
+    )
+    with engine.unit_of_work():
+        updated = asyncio.run(engine.process_action(state.id, action))
+
+    assert updated.players[0].battlefield[0].tapped is True
+    assert len(engine.replays[state.id]) == 1
+
+
+def test_process_action_bumps_state_version():
+    engine = SimpleGameEngine(use_db=False)
+    state = _build_game_state()
+    engine.games[state.id] = state
+
+    action = GameAction(
+        player_id="player1",
+        action_type="modify_life",
+        additional_data={"target_player": "player1", "amount": -3},
+    )
+    updated = asyncio.run(engine.process_action(state.id, action))
+
+    assert updated.version == 1
+    assert updated.players[0].life == 17
+
+
+def test_process_action_reapplies_action_after_conflict():
+    engine = SimpleGameEngine(use_db=False)
+    stale = _build_game_state()
+    fresh = _build_game_state()
+    fresh.players[0].life = 10
+    fresh.version = 4
+    engine.games[fresh.id] = fresh
+
+    original_touch = engine._touch_game_state
+    calls = []
+
+    def touch_with_one_conflict(game_state):
+        calls.append(game_state)
+        if len(calls) == 1:
+            raise GameStateConflictError(game_state.id, game_state.version)
+        original_touch(game_state)
+
+    engine._touch_game_state = touch_with_one_conflict
+
+    action = GameAction(
+        player_id="player1",
+        action_type="modify_life",
+        additional_data={"target_player": "player1", "amount": 2},
+    )
+    updated = asyncio.run(engine.process_action(stale.id, action, game_state=stale))
+
+    # The retry starts from the freshly loaded state, not the stale copy
+    assert updated is fresh
+    assert updated.players[0].life == 12
+    assert updated.version == 5
+    assert len(engine.replays[stale.id]) == 1
+
+
 def test_add_custom_keyword_adds_only_unique_entries():
     engine = SimpleGameEngine(use_db=False)
     state = _build_game_state()
@@ -461,3 +548,102 @@ def test_restart_game_fails_without_submitted_decks():
         assert False, "Expected ValueError"
     except ValueError as e:
         assert "not available" in str(e).lower() or "decks" in str(e).lower()
+
+
+def _seeded_decks():
+    from app.backend.models.game import Deck, DeckCard
+
+    return {
+        seat_id: Deck(
+            name=f"{seat_id} deck",
+            cards=[
+                DeckCard(card=_build_card(f"{seat_id}-{i}"), quantity=2)
+                for i in range(20)
+            ],
+        )
+        for seat_id in ("player1", "player2")
+    }
+
+
+def test_same_seed_deals_the_same_game():
+    """Libraries, card ids and the coin flip depend only on the seed."""
+    states = []
+    for seed in (1234, 1234, 5678):
+        engine = SimpleGameEngine(use_db=False)
+        setup = engine.create_game_setup("seeded-game")
+        states.append(
+            engine._initialize_game_from_setup(
+                "seeded-game", _seeded_decks(), setup, seed=seed
+            )
+        )
+
+    def dealt(state):
+        return [[card.unique_id for card in p.library] for p in state.players]
+
+    assert states[0].rng_seed == 1234
+    assert dealt(states[0]) == dealt(states[1])
+    assert states[0].coin_flip_winner == states[1].coin_flip_winner
+    assert dealt(states[0]) != dealt(states[2])
+
+
+def test_shuffle_action_draws_from_game_stream():
+    engine = SimpleGameEngine(use_db=False)
+    setup = engine.create_game_setup("seeded-shuffle")
+    state = engine._initialize_game_from_setup(
+        "seeded-shuffle", _seeded_decks(), setup, seed=42
+    )
+    twin = state.model_copy(deep=True)
+    action = GameAction(player_id="player1", action_type="shuffle_library")
+
+    asyncio.run(engine.process_action(state.id, action, game_state=state))
+    asyncio.run(engine.process_action(state.id, action, game_state=twin))
+
+    assert state.rng_draws == twin.rng_draws == 1
+    assert [c.unique_id for c in state.players[0].library] == [
+        c.unique_id for c in twin.players[0].library
+    ]
+    # Table rolls use their own counter and leave the game stream alone. They
+    # write nothing; the next save records how many were made
+    version = engine.games[state.id].version
+    engine.roll_table_die(state.id, 20)
+    engine.roll_table_die(state.id, 20)
+    assert engine.games[state.id].version == version
+    assert state.table_rng_draws == 0
+    engine.record_table_draws(state)
+    assert state.table_rng_draws == 2
+    assert state.rng_draws == 1
+
+
+def test_table_rolls_continue_from_the_stored_counter():
+    engine = SimpleGameEngine(use_db=False)
+    state = _build_game_state()
+    state.rng_seed = 7
+    engine.games[state.id] = state
+    first = [engine.roll_table_die(state.id, 1000) for _ in range(3)]
+
+    # Another process picks up from the saved counter, with the same stream
+    other = SimpleGameEngine(use_db=False)
+    saved = state.model_copy(deep=True)
+    saved.table_rng_draws = 2
+    other.games[state.id] = saved
+    assert other.roll_table_die(state.id, 1000) == first[2]
+
+
+def test_async_reads_fall_back_to_in_memory_stores():
+    engine = SimpleGameEngine(use_db=False)
+    state = _build_game_state()
+    engine.games[state.id] = state
+
+    async def read():
+        return (
+            await engine.fetch_game(state.id),
+            await engine.fetch_game("missing"),
+            await engine.fetch_games(),
+            await engine.fetch_action_history(state.id),
+        )
+
+    found, missing, games, history = asyncio.run(read())
+    assert found is state
+    assert missing is None
+    assert games == [(state.id, state)]
+    assert history == []
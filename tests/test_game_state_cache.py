@@ -0,0 +1,151 @@
+"""Tests for the per-process GameState cache (no database required)."""
+
+from contextlib import contextmanager
+
+import pytest
+
+from app.backend.models.game import GameState, Player
+from app.backend.repositories.card_definitions import CardDefinitionStore
+from app.backend.repositories.dict_proxies import (
+    GameStateConflictError,
+    GameStatesProxy,
+)
+from app.backend.repositories.game_state_cache import GameStateCache
+
+
+def _cache(max_bytes=1000):
+    cache = GameStateCache(max_bytes)
+    # Pretend the invalidation listener is connected
+    cache.ensure_listener = lambda: None
+    cache._listening = True
+    return cache
+
+
+def _state(game_id, version=0):
+    return GameState(
+        id=game_id,
+        players=[Player(id="player1", name="Alice")],
+        version=version,
+    )
+
+
+def test_cache_counts_hits_and_misses():
+    cache = _cache()
+    state = _state("game-1")
+
+    assert cache.get("game-1") is None
+    cache.put(state, 100)
+
+    cached = cache.get("game-1")
+    assert cached is not state
+    assert cached.model_dump() == state.model_dump()
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["bytes"] == 100
+
+
+def test_cache_evicts_least_recently_used_over_byte_cap():
+    cache = _cache(max_bytes=250)
+    cache.put(_state("game-1"), 100)
+    cache.put(_state("game-2"), 100)
+    cache.get("game-1")
+    cache.put(_state("game-3"), 100)
+
+    assert cache.get("game-2") is None
+    assert cache.get("game-1") is not None
+    assert cache.get("game-3") is not None
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["bytes"] == 200
+
+
+def test_notified_version_drops_and_blocks_older_entries():
+    cache = _cache()
+    cache.put(_state("game-1", version=3), 100)
+
+    cache.invalidate("game-1", version=4)
+    assert cache.get("game-1") is None
+
+    # A read that started before the save must not re-cache the old version
+    cache.put(_state("game-1", version=3), 100)
+    assert cache.get("game-1") is None
+
+    newer = _state("game-1", version=4)
+    cache.put(newer, 100)
+    cache.invalidate("game-1", version=4)
+    assert cache.get("game-1").version == 4
+
+
+def test_cache_is_bypassed_while_listener_is_down():
+    cache = _cache()
+    cache.put(_state("game-1"), 100)
+    cache._set_listening(False)
+
+    assert cache.get("game-1") is None
+    assert cache.stats()["entries"] == 0
+
+
+class FakeConnection:
+    """Serves game_states rows and applies their compare-and-set upserts."""
+
+    def __init__(self):
+        self.rows = {}
+        self._result = None
+        self.rowcount = 0
+
+    def cursor(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=None):
+        self._result = None
+        if "FROM game_states WHERE id" in query:
+            self._result = self.rows.get(params[0])
+        elif "INSERT INTO game_states" in query:
+            game_id, state_text, version, expected = params
+            stored = self.rows.get(game_id)
+            if stored is None or stored[1] == expected:
+                self.rows[game_id] = (state_text, version)
+                self._result = (version,)
+
+    def fetchone(self):
+        return self._result
+
+    def commit(self):
+        pass
+
+
+def test_concurrent_writers_of_a_cached_state_conflict(monkeypatch):
+    conn = FakeConnection()
+
+    @contextmanager
+    def get_connection():
+        yield conn
+
+    monkeypatch.setattr(
+        "app.backend.repositories.dict_proxies.get_connection", get_connection
+    )
+    monkeypatch.setattr(
+        "app.backend.repositories.dict_proxies.write_state_summary",
+        lambda cur, value: None,
+    )
+    games = GameStatesProxy(cache=_cache(10**6), definitions=CardDefinitionStore(100))
+    games.compare_and_set(_state("game-1"))
+
+    # Both loads are served by the cache, as two executor threads would be
+    first, second = games["game-1"], games["game-1"]
+    assert first is not second
+
+    first.turn += 1
+    games.compare_and_set(first)
+    second.turn += 5
+    with pytest.raises(GameStateConflictError):
+        games.compare_and_set(second)
+
+    assert games["game-1"].turn == first.turn
+    assert games._cache.stats()["hits"] >= 2
@@ -0,0 +1,97 @@
+"""Tests for the /games/list summary entries (no database)."""
+
+import asyncio
+from datetime import datetime, timedelta
+
+from app.backend.models.game import (
+    GameFormat,
+    GameSetupStatus,
+    GameState,
+    PhaseMode,
+    Player,
+    PlayerDeckStatus,
+)
+from app.backend.repositories.game_summaries import summarize_games
+from app.backend.services.game_engine import SimpleGameEngine
+
+START = datetime(2026, 1, 1, 12, 0, 0)
+
+
+def _setup(game_id, minutes, ready=False, submitted=()):
+    return GameSetupStatus(
+        game_id=game_id,
+        game_format=GameFormat.MODERN,
+        phase_mode=PhaseMode.STRICT,
+        status="ready" if ready else "waiting",
+        ready=ready,
+        player_status={
+            player_id: PlayerDeckStatus(
+                submitted=player_id in submitted, seat_claimed=True
+            )
+            for player_id in ("player1", "player2")
+        },
+        created_at=START,
+        updated_at=START + timedelta(minutes=minutes),
+    )
+
+
+def _state(game_id, minutes):
+    return GameState(
+        id=game_id,
+        players=[Player(id="player1", name="Alice"), Player(id="player2", name="Bob")],
+        game_format=GameFormat.MODERN,
+        turn=3,
+        created_at=START,
+        updated_at=START + timedelta(minutes=minutes),
+    )
+
+
+def test_entries_merge_setup_and_state():
+    setups = {
+        "waiting": _setup("waiting", 1, submitted=("player1",)),
+        "started": _setup("started", 2, ready=True, submitted=("player1", "player2")),
+    }
+    games = {"started": _state("started", 5), "orphan": _state("orphan", 3)}
+
+    entries = {entry["game_id"]: entry for entry in summarize_games(setups, games)}
+
+    waiting = entries["waiting"]
+    assert waiting["status"] == "waiting"
+    assert waiting["game_format"] == "modern"
+    assert waiting["players"] == ["player1"]
+    assert waiting["submitted_count"] == 1
+    assert waiting["seat_claimed_count"] == 2
+    assert waiting["updated_at"] == (START + timedelta(minutes=1)).isoformat()
+
+    started = entries["started"]
+    assert started["status"] == "ongoing"
+    assert started["players"] == ["player1", "player2"]
+    assert started["turn"] == 3
+    assert started["phase_mode"] == "strict"
+    assert started["updated_at"] == (START + timedelta(minutes=5)).isoformat()
+
+    orphan = entries["orphan"]
+    assert orphan["status"] == "ongoing"
+    assert orphan["ready"] is True
+    assert orphan["player_status"] == {}
+    assert orphan["max_players"] == 2
+
+
+def test_entries_are_paged_newest_first():
+    setups = {f"game-{index}": _setup(f"game-{index}", index) for index in range(5)}
+
+    first = summarize_games(setups, {}, limit=2)
+    second = summarize_games(setups, {}, limit=2, offset=2)
+
+    assert [entry["game_id"] for entry in first] == ["game-4", "game-3"]
+    assert [entry["game_id"] for entry in second] == ["game-2", "game-1"]
+
+
+def test_engine_fetches_summaries_from_in_memory_stores():
+    engine = SimpleGameEngine(use_db=False)
+    engine.game_setups["waiting"] = _setup("waiting", 1)
+    engine.games["orphan"] = _state("orphan", 2)
+
+    entries = asyncio.run(engine.fetch_game_summaries(10))
+
+    assert [entry["game_id"] for entry in entries] == ["orphan", "waiting"]
@@ -0,0 +1,141 @@
+"""Tests for the request-scoped identity map of the dict proxies (no database)."""
+
+from contextlib import asynccontextmanager, contextmanager
+
+import pytest
+
+from app.backend.models.game import GameFormat, GameSetupStatus, PhaseMode
+from app.backend.repositories.dict_proxies import GameSetupsProxy, identity_scope
+
+
+class FakeConnection:
+    """Serves game_setups rows from a dict and counts the queries on them."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = 0
+        self._result = None
+        self.rowcount = 0
+
+    def cursor(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=None):
+        if isinstance(query, str) and "game_summaries" in query:
+            return
+        self.queries += 1
+        key = params[0] if params else None
+        self.rowcount = 1 if key in self.rows else 0
+        self._result = (self.rows[key],) if key in self.rows else None
+
+    def fetchone(self):
+        return self._result
+
+    def commit(self):
+        pass
+
+
+@pytest.fixture
+def conn(monkeypatch):
+    setup = GameSetupStatus(
+        game_id="g1",
+        game_format=GameFormat.STANDARD,
+        phase_mode=PhaseMode.CASUAL,
+        status="waiting",
+    )
+    fake = FakeConnection({"g1": setup.model_dump(mode="json")})
+
+    @contextmanager
+    def get_connection():
+        yield fake
+
+    monkeypatch.setattr(
+        "app.backend.repositories.dict_proxies.get_connection", get_connection
+    )
+    return fake
+
+
+def test_contains_then_get_is_one_query_and_one_object(conn):
+    setups = GameSetupsProxy()
+
+    with identity_scope():
+        assert "g1" in setups
+        first = setups["g1"]
+        assert setups.get("g1") is first
+        assert "missing" not in setups
+        assert setups.get("missing") is None
+
+    assert conn.queries == 2
+
+
+def test_reads_outside_a_scope_always_query(conn):
+    setups = GameSetupsProxy()
+
+    assert "g1" in setups
+    assert setups["g1"] is not setups["g1"]
+    assert conn.queries == 3
+
+
+def test_writes_and_deletes_update_the_scope(conn):
+    setups = GameSetupsProxy()
+
+    with identity_scope():
+        setup = setups["g1"]
+        setup.status = "ready"
+        setups["g1"] = setup
+        assert setups["g1"] is setup
+
+        del setups["g1"]
+        assert "g1" not in setups
+
+    # read, write, delete
+    assert conn.queries == 3
+
+
+class FakeAsyncConnection:
+    """Serves game_setups rows to get_many() and counts the queries."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = 0
+
+    async def execute(self, query, params=None):
+        self.queries += 1
+        self._result = [(key, self.rows[key]) for key in params[0] if key in self.rows]
+        return self
+
+    async def fetchall(self):
+        return self._result
+
+
+@pytest.mark.asyncio
+async def test_async_get_many_is_one_query_and_fills_the_scope(conn, monkeypatch):
+    from app.backend.repositories.async_proxies import AsyncGameSetupsProxy
+
+    fake = FakeAsyncConnection(conn.rows)
+
+    @asynccontextmanager
+    async def get_async_connection():
+        yield fake
+
+    monkeypatch.setattr(
+        "app.backend.repositories.async_proxies.get_async_connection",
+        get_async_connection,
+    )
+    setups = AsyncGameSetupsProxy(GameSetupsProxy())
+
+    with identity_scope():
+        found = await setups.get_many(["g1", "missing", "g1"])
+        assert list(found) == ["g1"]
+        assert await setups.get("g1") is found["g1"]
+        assert await setups.get("missing") is None
+        assert not await setups.contains("missing")
+
+    assert fake.queries == 1
+    assert conn.queries == 0
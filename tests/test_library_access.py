@@ -0,0 +1,41 @@
+"""Tests for who may load the ordered contents of a library (no database)."""
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app.backend.api import routes
+from app.backend.models.game import Card, GameState, Player
+
+
+def _game_state():
+    alice = Player(id="player1", name="Alice")
+    alice.library = [
+        Card(id=f"card-{index}", name="Opt", card_type="instant")
+        for index in range(3)
+    ]
+    return GameState(id="g1", players=[alice, Player(id="player2", name="Bob")])
+
+
+@pytest.fixture
+def game(monkeypatch):
+    game_state = _game_state()
+
+    async def fetch_game_state(game_id):
+        return game_state if game_id == "g1" else None
+
+    monkeypatch.setattr(routes, "fetch_game_state", fetch_game_state)
+    return game_state
+
+
+def test_owner_gets_the_library_in_order(game):
+    library = asyncio.run(routes.get_player_library("g1", "player1", "player1"))
+    assert library["cards"] == ["card-0", "card-1", "card-2"]
+
+
+@pytest.mark.parametrize("viewer_id", ["player2", "spectator", None])
+def test_anyone_else_gets_403(game, viewer_id):
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(routes.get_player_library("g1", "player1", viewer_id))
+    assert error.value.status_code == 403
@@ -0,0 +1,56 @@
+"""Tests for the NOTIFY publisher's batching and payload helpers (no database)."""
+
+import asyncio
+import json
+
+from app.backend.services.notify_service import (
+    MAX_CHANNEL_LENGTH,
+    MAX_NOTIFY_PAYLOAD,
+    NotifyPublisher,
+    _game_payload,
+    _publish_params,
+    room_channel,
+)
+
+
+def test_batch_stops_before_a_repeated_notification():
+    publisher = NotifyPublisher(max_batch=10)
+    publisher._queue = asyncio.Queue()
+    first = ("ws_room:g1", "a", None, 0.0)
+    queued = [
+        ("ws_room:g1", "b", None, 0.0),
+        first,
+        ("ws_room:g2", "a", None, 0.0),
+    ]
+    for item in queued:
+        publisher._queue.put_nowait(item)
+
+    batch = publisher._take_batch(first)
+
+    # PostgreSQL would fold the repeat into the first one; it opens the next
+    # batch, still ahead of what was queued after it
+    assert [item[1] for item in batch] == ["a", "b"]
+    assert publisher._held is first
+    assert publisher._take_batch(publisher._held) == [first, queued[2]]
+
+
+def test_only_oversized_payloads_spill_to_the_outbox():
+    small = _game_payload("g1", {"type": "game_state_update"})
+    large = _game_payload("g1", {"blob": "x" * MAX_NOTIFY_PAYLOAD})
+
+    channel = room_channel("g1")
+    channels, payloads, spills = _publish_params([(channel, small), (channel, large)])
+
+    assert payloads == [small, large]
+    assert spills == [False, True]
+    # The full message is kept, not a state_changed placeholder
+    assert json.loads(large)["message"]["blob"].startswith("x")
+
+
+def test_room_channels_fit_in_an_identifier():
+    assert room_channel("draft-1234") == "ws_room:draft-1234"
+
+    long_channel = room_channel("game-" + "x" * 80)
+    assert len(long_channel) <= MAX_CHANNEL_LENGTH
+    assert long_channel == room_channel("game-" + "x" * 80)
+    assert long_channel != room_channel("game-" + "y" * 80)
@@ -0,0 +1,102 @@
+"""Tests for the compact projection cache behind GameState.to_compact_ui_data."""
+
+import pytest
+
+from app.backend.models.game import Card, CardType, GameState, Player
+from app.backend.models.projection_cache import ProjectionCache
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = ProjectionCache(max_entries=4)
+    monkeypatch.setattr("app.backend.models.game.projection_cache", cache)
+    return cache
+
+
+def _card(unique_id, **fields):
+    return Card(
+        id="card-test",
+        unique_id=unique_id,
+        owner_id="player1",
+        name="Test Card",
+        mana_cost="",
+        cmc=0,
+        card_type=CardType.CREATURE,
+        subtype="",
+        text="",
+        **fields,
+    )
+
+
+def _state():
+    player = Player(
+        id="player1",
+        name="Alice",
+        battlefield=[_card("bear"), _card("morph", face_down=True)],
+    )
+    return GameState(id="game-projection", players=[player])
+
+
+def _project(state, viewer_id=None, history=()):
+    return state.to_compact_ui_data(
+        viewer_id=viewer_id, action_history=list(history), chat_log=[]
+    )
+
+
+def test_projection_is_memoized_per_version_and_viewer(cache):
+    state = _state()
+
+    first = _project(state, history=[{"action": "draw_card"}])
+    again = _project(state)
+    owner_view = _project(state, viewer_id="player1")
+
+    assert cache.hits == 1 and cache.misses == 2
+    assert again["action_history"] == []
+    assert first["action_history"] == [{"action": "draw_card"}]
+    assert again["card_instances"] is first["card_instances"]
+    assert "card_id" not in first["card_instances"]["morph"]
+    assert owner_view["card_instances"]["morph"]["card_id"] == "card-test"
+
+
+def test_unchanged_cards_keep_their_instance_dict(cache):
+    state = _state()
+    before = _project(state)["card_instances"]
+
+    state.players[0].battlefield[0].counters["+1/+1"] = 1
+    state.version += 1
+    after = _project(state)["card_instances"]
+
+    assert after["morph"] is before["morph"]
+    assert after["bear"] is not before["bear"]
+    assert after["bear"]["counters"] == {"+1/+1": 1}
+    assert "counters" not in before["bear"]
+
+
+def test_forget_drops_projections_of_an_abandoned_mutation(cache):
+    state = _state()
+    _project(state)
+
+    state.players[0].battlefield[0].tapped = True
+    cache.forget(state.id)
+
+    assert _project(state)["card_instances"]["bear"]["tapped"] is True
+
+
+def test_viewers_share_the_projection_without_face_down_cards(cache):
+    state = _state()
+    state.players[0].battlefield.pop()
+
+    public = _project(state)
+    owner_view = _project(state, viewer_id="player1")
+
+    assert cache.misses == 1
+    assert owner_view["players"] is public["players"]
+
+
+def test_library_is_projected_as_a_count_for_every_viewer(cache):
+    state = _state()
+    state.players[0].library = [_card("lib-0"), _card("lib-1")]
+
+    for viewer_id in (None, "player1", "player2"):
+        zones = _project(state, viewer_id=viewer_id)["players"][0]["zones"]
+        assert zones["library"] == {"count": 2}
@@ -1,8 +1,25 @@
+import asyncio
+import json
+from datetime import datetime, timezone
+
 import pytest
 from fastapi.testclient import TestClient
 from app.backend.main import app
 from app.backend.api.routes import game_engine
-from app.backend.models.game import GameState, GamePhase, Player
+from app.backend.models.game import (
+    Card,
+    CardType,
+    Deck,
+    DeckCard,
+    GameAction,
+    GameState,
+    GamePhase,
+    Player,
+)
+from app.backend.repositories.dict_proxies import materialize_replay_rows
+from app.backend.services.game_engine import SimpleGameEngine
+from app.backend.services.replay_service import EventSourcedReplays
+from app.backend.utils.json_patch import apply_patch, make_patch
 
 
 class TestReplay:
@@ -36,3 +53,141 @@ class TestReplay:
         assert data["game_id"] == game_id
         assert len(data["timeline"]) == 1
         assert data["timeline"][0]["action"]["action_type"] == "snapshot"
+
+
+class TestReplayDeltas:
+    def _states(self):
+        base = {
+            "turn": 1,
+            "players": [{"id": "p1", "life": 20, "zones": {"hand": ["a", "b"]}}],
+            "card_instances": {"a": {"tapped": False}, "b": {"tapped": False}},
+        }
+        second = {
+            "turn": 1,
+            "players": [{"id": "p1", "life": 17, "zones": {"hand": ["b"]}}],
+            "card_instances": {"b": {"tapped": True}, "c/d": {"tapped": False}},
+        }
+        third = {
+            "turn": 2,
+            "players": [{"id": "p1", "life": 17, "zones": {"hand": ["b", "e", "f"]}}],
+            "card_instances": {"b": {"tapped": True}, "c/d": {"tapped": False}},
+        }
+        return base, second, third
+
+    def test_patch_round_trip_does_not_mutate_source(self):
+        base, second, third = self._states()
+        snapshot = json.dumps(base)
+
+        assert apply_patch(base, make_patch(base, second)) == second
+        assert apply_patch(second, make_patch(second, third)) == third
+        assert json.dumps(base) == snapshot
+        assert make_patch(third, third) == []
+
+    def test_materialize_replay_rows_applies_deltas_after_keyframe(self):
+        base, second, third = self._states()
+        recorded_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        rows = [
+            ({"action_type": "initial_setup"}, base, None, recorded_at),
+            ({"action_type": "play_card"}, None, make_patch(base, second), recorded_at),
+            ({"action_type": "pass_turn"}, None, make_patch(second, third), recorded_at),
+        ]
+
+        timeline = materialize_replay_rows(rows)
+
+        assert [step["state"] for step in timeline] == [base, second, third]
+        assert timeline[2]["action"] == {"action_type": "pass_turn"}
+        assert timeline[0]["timestamp"] == recorded_at.timestamp()
+
+
+class TestEventSourcedReplays:
+    def _decks(self):
+        def card(prefix, index):
+            return Card(
+                id=f"{prefix}-{index}",
+                name=f"{prefix} Card {index}",
+                card_type=CardType.LAND,
+            )
+
+        return {
+            seat_id: Deck(
+                name=seat_id,
+                cards=[DeckCard(card=card(seat_id, i), quantity=2) for i in range(30)],
+            )
+            for seat_id in ("player1", "player2")
+        }
+
+    def _play(self, engine, seed):
+        setup = engine.create_game_setup("event-game")
+        engine._initialize_game_from_setup("event-game", self._decks(), setup, seed=seed)
+        actions = [
+            GameAction(player_id="player1", action_type="shuffle_library"),
+            GameAction(
+                player_id="player1",
+                action_type="modify_life",
+                additional_data={"target_player": "player2", "amount": -3},
+            ),
+            GameAction(player_id="player2", action_type="shuffle_library"),
+            GameAction(player_id="player2", action_type="draw_card"),
+        ]
+        for action in actions:
+            asyncio.run(engine.process_action("event-game", action))
+
+    def test_rebuilt_timeline_matches_recorded_snapshots(self):
+        snapshots = SimpleGameEngine(use_db=False)
+        events = SimpleGameEngine(use_db=False)
+        events.replays = EventSourcedReplays(events={})
+
+        self._play(snapshots, seed=99)
+        self._play(events, seed=99)
+
+        log = events.replays.events["event-game"]
+        assert [event["type"] for event in log] == ["setup"] + ["action"] * 4
+        assert "state" not in json.dumps(log[1:])
+
+        def without_clock(steps):
+            return [
+                {k: v for k, v in step["state"].items() if not k.endswith("_at")}
+                for step in steps
+            ]
+
+        timeline = asyncio.run(events.get_replay_timeline("event-game"))
+        expected = snapshots.replays["event-game"]
+        assert without_clock(timeline) == without_clock(expected)
+        assert [step["action"] for step in timeline] == [
+            step["action"] for step in expected
+        ]
+        assert timeline[1]["timestamp"] == log[1]["timestamp"]
+
+    def test_restart_starts_a_new_event_log(self):
+        engine = SimpleGameEngine(use_db=False)
+        engine.replays = EventSourcedReplays(events={})
+        self._play(engine, seed=7)
+
+        engine._submitted_decks["event-game"] = self._decks()
+        engine.restart_game("event-game")
+
+        log = engine.replays.events["event-game"]
+        assert [event["type"] for event in log] == ["setup"]
+        assert log[0]["payload"]["seed"] != 7
+
+    def test_step_ranges_match_full_timeline(self):
+        snapshots = SimpleGameEngine(use_db=False)
+        events = SimpleGameEngine(use_db=False)
+        events.replays = EventSourcedReplays(events={})
+        self._play(snapshots, seed=3)
+        self._play(events, seed=3)
+
+        async def collect(engine, from_step, to_step=None):
+            return [
+                step
+                async for step in engine.iter_replay_steps(
+                    "event-game", from_step, to_step
+                )
+            ]
+
+        for engine in (snapshots, events):
+            full = asyncio.run(engine.get_replay_timeline("event-game"))
+            assert engine.count_replay_steps("event-game") == len(full) == 5
+            assert asyncio.run(collect(engine, 2, 4)) == full[2:4]
+            assert asyncio.run(collect(engine, 4)) == full[4:]
+        assert asyncio.run(snapshots.get_replay_timeline("missing")) is None
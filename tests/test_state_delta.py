@@ -0,0 +1,83 @@
+"""Tests for compact game state deltas."""
+
+from app.backend.models.game import Card, CardType, GamePhase, GameState, Player
+from app.backend.utils.state_delta import apply_compact_delta, diff_compact_state
+
+
+def _card(unique_id, owner_id):
+    return Card(
+        id="card-test",
+        unique_id=unique_id,
+        owner_id=owner_id,
+        name="Test Card",
+        mana_cost="",
+        cmc=0,
+        card_type=CardType.CREATURE,
+        subtype="",
+        text="",
+    )
+
+
+def _state():
+    players = [
+        Player(
+            id="player1",
+            name="Alice",
+            hand=[_card("p1-hand", "player1")],
+            battlefield=[_card("p1-bear", "player1")],
+        ),
+        Player(id="player2", name="Bob", battlefield=[_card("p2-bear", "player2")]),
+    ]
+    return GameState(id="game-delta", players=players, phase=GamePhase.MAIN1)
+
+
+def _compact(state):
+    return state.to_compact_ui_data(action_history=[], chat_log=[])
+
+
+def _save(state):
+    # Projections are cached per version, which every save bumps
+    state.version += 1
+
+
+def test_delta_carries_only_what_changed():
+    state = _state()
+    before = _compact(state)
+    state.players[0].battlefield[0].tapped = True
+    state.players[1].life = 17
+    _save(state)
+    after = _compact(state)
+
+    delta = diff_compact_state(before, after)
+
+    assert delta["fields"] == {}
+    assert delta["players"] == {"player2": {"fields": {"life": 17}}}
+    assert list(delta["cards"]) == ["p1-bear"]
+    assert apply_compact_delta(before, delta) == after
+
+
+def test_moved_card_updates_zones_and_instances():
+    state = _state()
+    before = _compact(state)
+    card = state.players[0].hand.pop()
+    state.players[0].battlefield.append(card)
+    state.players[1].battlefield.clear()
+    state.phase = GamePhase.ATTACK
+    _save(state)
+    after = _compact(state)
+
+    delta = diff_compact_state(before, after)
+
+    assert delta["fields"] == {"phase": GamePhase.ATTACK.value}
+    assert set(delta["players"]["player1"]["zones"]) == {"hand", "battlefield"}
+    assert delta["removed_cards"] == ["p2-bear"]
+    assert apply_compact_delta(before, delta) == after
+
+
+def test_changed_seats_need_a_full_snapshot():
+    state = _state()
+    before = _compact(state)
+    state.players.append(Player(id="player3", name="Carol"))
+    _save(state)
+
+    assert diff_compact_state(before, _compact(state)) is None
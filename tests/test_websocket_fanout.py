@@ -0,0 +1,215 @@
+"""Tests for the WebSocket connection manager's queued fan-out (no sockets)."""
+
+import asyncio
+import json
+
+import pytest
+
+from app.backend.api.websocket import (
+    PING_INTERVAL_SECONDS,
+    PING_TIMEOUT_SECONDS,
+    SEND_QUEUE_SIZE,
+    SLOW_CONSUMER_CLOSE_CODE,
+    ConnectionManager,
+)
+
+
+class FakeWebSocket:
+    """Records sent frames; a blocked socket never finishes a send."""
+
+    def __init__(self, blocked: bool = False):
+        self.sent = []
+        self.closed_with = None
+        self.blocked = blocked
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text):
+        if self.blocked:
+            await asyncio.Event().wait()
+        self.sent.append(json.loads(text))
+
+    async def close(self, code=1000):
+        self.closed_with = code
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_broadcast_reaches_every_connection_in_order():
+    manager = ConnectionManager()
+    sockets = [FakeWebSocket() for _ in range(3)]
+    for index, websocket in enumerate(sockets):
+        await manager.connect(websocket, "g1", f"player{index}")
+
+    await manager.broadcast_to_game("g1", {"type": "chat", "n": 1})
+    await manager.send_to(sockets[0], "g1", {"type": "pong"})
+    await manager.broadcast_to_game("g1", {"type": "chat", "n": 2})
+    await _settle()
+
+    assert [m["type"] for m in sockets[0].sent] == [
+        "connection_established",
+        "chat",
+        "pong",
+        "chat",
+    ]
+    assert [m.get("n") for m in sockets[2].sent[1:]] == [1, 2]
+    assert manager.stats()["fanout_ms_p95"] is not None
+
+
+@pytest.mark.asyncio
+async def test_slow_consumer_is_disconnected_without_delaying_others():
+    manager = ConnectionManager()
+    fast, slow = FakeWebSocket(), FakeWebSocket(blocked=True)
+    await manager.connect(fast, "g1", "player1")
+    await manager.connect(slow, "g1", "spectator")
+
+    for index in range(SEND_QUEUE_SIZE + 2):
+        await manager.broadcast_to_game("g1", {"type": "state", "n": index})
+        await _settle()
+
+    assert len(fast.sent) == SEND_QUEUE_SIZE + 3
+    assert slow.closed_with == SLOW_CONSUMER_CLOSE_CODE
+    assert manager.get_connection_count("g1") == 1
+    assert manager.stats()["slow_consumer_disconnects"] == 1
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_tick_only_touches_due_connections():
+    manager = ConnectionManager()
+    quiet, chatty = FakeWebSocket(), FakeWebSocket()
+    await manager.connect(quiet, "g1", "player1")
+    await manager.connect(chatty, "g2", "player2")
+    connections = {c.websocket: c for c in manager._by_socket.values()}
+    start = connections[quiet].last_seen
+
+    # Nothing is due before the ping interval
+    manager._heartbeat_tick(start + 1)
+    await _settle()
+    assert len(quiet.sent) == 1
+
+    manager._heartbeat_tick(start + PING_INTERVAL_SECONDS + 1)
+    await _settle()
+    assert quiet.sent[-1]["type"] == "ping"
+    assert chatty.sent[-1]["type"] == "ping"
+
+    # Only the chatty client answers; the quiet one times out
+    connections[chatty].last_seen = start + PING_TIMEOUT_SECONDS
+    for tick in range(2, 4):
+        manager._heartbeat_tick(start + tick * PING_INTERVAL_SECONDS + 1)
+    await _settle()
+
+    assert quiet.closed_with == 1000
+    assert manager.get_connection_count("g1") == 0
+    assert manager.get_connection_count("g2") == 1
+
+
+@pytest.mark.asyncio
+async def test_state_updates_after_the_first_go_out_as_deltas():
+    manager = ConnectionManager()
+    websocket = FakeWebSocket()
+    await manager.connect(websocket, "g1", "player1")
+    state = {"turn": 1, "phase": "main1", "players": [], "card_instances": {}}
+
+    for seq, update in [(1, state), (3, {**state, "phase": "combat"}), (2, state)]:
+        await manager.broadcast_to_game(
+            "g1", {"type": "game_state_update", "game_state": update, "seq": seq}
+        )
+    await _settle()
+
+    full, delta = websocket.sent[1:]
+    assert full["type"] == "game_state_update" and full["seq"] == 1
+    assert delta["type"] == "game_state_delta"
+    assert (delta["base_seq"], delta["seq"]) == (1, 3)
+    assert delta["delta"] == {"fields": {"phase": "combat"}}
+
+
+@pytest.mark.asyncio
+async def test_reconnecting_client_gets_only_the_updates_it_missed():
+    manager = ConnectionManager()
+    first = FakeWebSocket()
+    await manager.connect(first, "g1", "player1")
+
+    async def update(seq):
+        state = {"turn": seq, "players": [], "card_instances": {}}
+        await manager.broadcast_to_game(
+            "g1", {"type": "game_state_update", "game_state": state, "seq": seq}
+        )
+
+    await update(1)
+    await update(2)
+    manager.disconnect(first, "g1")
+    # The empty room keeps its buffer while the client is away
+    await update(3)
+    await update(4)
+
+    # Chat is not buffered; the resume carries the log tail instead
+    await manager.broadcast_to_game("g1", {"type": "chat", "message": "gg"})
+
+    again = FakeWebSocket()
+    await manager.connect(again, "g1", "player1")
+    logs = {"chat_log": [{"player": "player2", "message": "gg"}]}
+    assert manager.resume(again, "g1", 2, logs=logs)
+    await _settle()
+
+    replayed = again.sent[1:]
+    assert [(m.get("base_seq"), m["seq"]) for m in replayed[:-1]] == [(2, 3), (3, 4)]
+    assert replayed[-1]["type"] == "session_resumed"
+    assert replayed[-1]["replayed"] == 2
+    assert replayed[-1]["chat_log"] == logs["chat_log"]
+
+
+@pytest.mark.asyncio
+async def test_resume_falls_back_when_the_gap_was_evicted(monkeypatch):
+    monkeypatch.setattr("app.backend.api.websocket.REPLAY_BUFFER_SIZE", 2)
+    manager = ConnectionManager()
+    websocket = FakeWebSocket()
+    await manager.connect(websocket, "g1", "player1")
+    for seq in range(1, 5):
+        state = {"turn": seq, "players": [], "card_instances": {}}
+        await manager.broadcast_to_game(
+            "g1", {"type": "game_state_update", "game_state": state, "seq": seq}
+        )
+
+    assert not manager.resume(websocket, "g1", 1)
+    assert not manager.resume(websocket, "g1", 9)
+    assert manager.resume(websocket, "g1", 3)
+    assert not manager.resume(websocket, "g2", 3)
+
+
+@pytest.mark.asyncio
+async def test_restarted_game_starts_over_at_its_own_seqs():
+    manager = ConnectionManager()
+    websocket = FakeWebSocket()
+    await manager.connect(websocket, "g1", "player1")
+
+    async def update(created_at, seq):
+        state = {"turn": seq, "players": [], "created_at": created_at}
+        await manager.broadcast_to_game(
+            "g1", {"type": "game_state_update", "game_state": state, "seq": seq}
+        )
+
+    await update("2026-01-01T10:00:00+00:00", 5)
+    await update("2026-01-01T10:00:00+00:00", 6)
+    # restart_game: a new GameState whose version starts over
+    await update("2026-01-01T11:00:00+00:00", 1)
+    await update("2026-01-01T11:00:00+00:00", 2)
+    # A late update of the previous game is still dropped
+    await update("2026-01-01T10:00:00+00:00", 7)
+    await _settle()
+
+    sent = [(m["type"], m.get("base_seq"), m["seq"]) for m in websocket.sent[1:]]
+    assert sent == [
+        ("game_state_update", None, 5),
+        ("game_state_delta", 5, 6),
+        ("game_state_update", None, 1),
+        ("game_state_delta", 1, 2),
+    ]
+    # Seqs of the previous game do not resume into the new one
+    assert not manager.resume(websocket, "g1", 6, "2026-01-01T10:00:00+00:00")
+    assert not manager.resume(websocket, "g1", 1, "2026-01-01T10:00:00+00:00")
+    assert manager.resume(websocket, "g1", 1, "2026-01-01T11:00:00+00:00")